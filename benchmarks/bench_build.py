@@ -0,0 +1,358 @@
+import os
+import re
+import sys
+import copy
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..', 'scripts')
+DATA_DIR = os.path.join(BENCH_DIR, '..', 'data')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baselines', 'bench_build.json')
+sys.path.insert(0, SCRIPTS_DIR)
+
+import scraper
+import data_writer
+
+DAILY_FILE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\.json$')
+
+# ==========================================================
+# --- BUILD PIPELINE BENCHMARK ---
+# ==========================================================
+# Runs the offline half of build_json() stage by stage, on fixtures rebuilt from the
+# daily files in data/ and on synthetic slates (up to 20 slates / 600 players):
+#
+#   match     -> build_match_index() + find_dff_key() for every scraped starter
+#   rosters   -> build_team_roster() for every team (starters, old-roster fallback, bench)
+#   waterfall -> apply_slate_waterfall() over the whole DFF dict
+#   news      -> merge_news_lists() of an "earlier run" half into the fresh half
+#   output    -> data_writer.write_json() of the day file into a temp folder
+#
+# Each stage reports its best time and its tracemalloc peak (measured in a separate run,
+# tracing slows everything down). With a baseline saved, a stage that gets slower or
+# hungrier than baseline * (1 + tolerance) fails the run.
+
+STAGES = ['match', 'rosters', 'waterfall', 'news', 'output']
+
+# Timings under this many ms are noise; they never count as a regression
+MIN_REGRESSION_MS = 2.0
+
+# (slates per platform, players) for the synthetic fixtures
+SYNTHETIC_SIZES = [(2, 150), (8, 300), (20, 600)]
+
+# ----------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------
+# A fixture is everything build_json() has in hand after the fetch stage, for one date:
+#   {"name", "date", "rosters": {team: [{"name", "verified"}]}, "pairs": [(team_a, team_b)],
+#    "dff": {TEAM_cleanname: record}, "slates": {platform: {sid: name}},
+#    "old_news", "new_news", "old_games": {game id: game}}
+
+def empty_dff_record(name, injury=""):
+    return {
+        "name": name, "injury": injury, "pos": "Flex", "salary": 0, "proj": 0.0, "value": 0.0,
+        "dk_pos": "Flex", "dk_salary": 0, "dk_proj": 0.0, "dk_value": 0.0,
+        "fd_slates": {}, "dk_slates": {},
+        "fd_positions": "", "dk_positions": ""
+    }
+
+def fixture_from_daily_file(path):
+    """Rebuilds the scraped inputs a saved day was built from (None if it has no games)"""
+    with open(path, 'r') as f:
+        day = json.load(f)
+    games = day.get('games', [])
+    if not games: return None
+
+    rosters, pairs, dff = {}, [], {}
+    for game in games:
+        teams = game.get('teams', [])
+        if len(teams) != 2: continue
+        pairs.append(tuple(teams))
+        for team in teams:
+            roster = game.get('rosters', {}).get(team, {})
+            rosters[team] = []
+            starters = roster.get('players', [])
+            for i, p in enumerate(starters + roster.get('bench', [])):
+                name = p.get('name', '')
+                if name == 'Waiting for Lineup': continue
+                if i < len(starters):
+                    rosters[team].append({"name": name, "verified": p.get('verified', False)})
+                if not p.get('salary') and not p.get('dk_salary'): continue
+
+                rec = empty_dff_record(name, p.get('injury', ''))
+                # Saved slates are dicts once matched; unmatched players carry []
+                rec["fd_slates"] = dict(p.get('fd_slates') or {})
+                rec["dk_slates"] = dict(p.get('dk_slates') or {})
+                rec["fd_positions"] = p.get('fd_positions', p.get('pos', ''))
+                rec["dk_positions"] = p.get('dk_positions', p.get('dk_pos', ''))
+                dff[f"{team}_{scraper.clean_player_name(name)}"] = rec
+
+    slates = {
+        platform: {s['id']: s['name'] for s in day.get('slates', {}).get(platform, [])}
+        for platform in ['fanduel', 'draftkings']
+    }
+    news = day.get('player_news', [])
+    half = len(news) // 2
+    return {
+        "name": os.path.basename(path)[:-5],
+        "date": os.path.basename(path)[:-5],
+        "rosters": rosters,
+        "pairs": pairs,
+        "dff": dff,
+        "slates": slates,
+        "old_news": news[half:],
+        "new_news": news[:half],
+        "old_games": {g['id']: g for g in games}
+    }
+
+def daily_fixtures(days):
+    files = sorted(f for f in os.listdir(DATA_DIR) if DAILY_FILE_RE.match(f))
+    fixtures = []
+    for f in reversed(files):
+        if len(fixtures) >= days: break
+        fixture = fixture_from_daily_file(os.path.join(DATA_DIR, f))
+        # Off-season days have games but no DFF numbers; nothing to match against
+        if fixture and fixture["dff"]: fixtures.append(fixture)
+    return list(reversed(fixtures))
+
+NBA_TEAMS = ["ATL", "BKN", "BOS", "CHA", "CHI", "CLE", "DAL", "DEN", "DET", "GSW", "HOU", "IND", "LAC", "LAL", "MEM",
+             "MIA", "MIL", "MIN", "NOP", "NYK", "OKC", "ORL", "PHI", "PHX", "POR", "SAC", "SAS", "TOR", "UTA", "WAS"]
+SLATE_STYLES = ["All Day", "Main", "Express", "Turbo", "After Hours", "Early", "Night"]
+FIRST_NAMES = ["jalen", "jaylen", "marcus", "anthony", "kevin", "chris", "tyrese", "josh", "jordan", "cam"]
+LAST_NAMES = ["johnson", "williams", "brown", "green", "greene", "smith", "davis", "jones", "white", "walker",
+              "thompson", "harris", "porter", "murray", "holiday", "allen", "young", "mitchell"]
+
+def synthetic_fixture(n_slates, n_players, seed=7):
+    """A made-up slate day: n_slates per platform, n_players spread across 30 teams"""
+    rng = random.Random(seed + n_slates * 1000 + n_players)
+    teams = NBA_TEAMS
+    per_team = max(1, n_players // len(teams))
+    pairs = [(teams[i], teams[i + 1]) for i in range(0, len(teams), 2)]
+
+    slates = {'fanduel': {}, 'draftkings': {}}
+    for platform, prefix in [('fanduel', '1F'), ('draftkings', '2')]:
+        for s in range(n_slates):
+            sid = f"{prefix}{s:03X}".rjust(5, '0')
+            if s < len(SLATE_STYLES):
+                slates[platform][sid] = f"{len(pairs) - s} Games  · {SLATE_STYLES[s]} 7:00PM ET"
+            else:
+                a, b = pairs[s % len(pairs)]
+                slates[platform][sid] = f"{a} @ {b} 7:00PM ET"
+
+    rosters, dff = {}, {}
+    for team in teams:
+        rosters[team] = []
+        for i in range(per_team):
+            # Shared last names on a team are kept on purpose: they hit the slower match paths
+            name = f"{rng.choice(FIRST_NAMES).title()} {rng.choice(LAST_NAMES).title()}{'' if i < 10 else ' Jr.'}"
+            clean = scraper.clean_player_name(name)
+            while f"{team}_{clean}" in dff:
+                name = f"{rng.choice(FIRST_NAMES).title()}{i} {name.split(' ', 1)[1]}"
+                clean = scraper.clean_player_name(name)
+            if i < 5:
+                # Starters are scraped with BBM spellings, which sometimes differ from DFF's
+                scraped = name if rng.random() < 0.8 else f"{name.split()[0][0]}. {name.split(' ', 1)[1]}"
+                rosters[team].append({"name": scraped, "verified": rng.random() < 0.7})
+
+            rec = empty_dff_record(name, rng.choice(["", "", "", "GTD", "O"]))
+            for platform, key, scale in [('fanduel', 'fd_slates', 1.0), ('draftkings', 'dk_slates', 1.05)]:
+                for sid in rng.sample(list(slates[platform]), rng.randint(1, n_slates)):
+                    proj = round(rng.uniform(0, 50) * scale, 1) if rng.random() > 0.1 else 0.0
+                    sal = rng.randrange(3500, 12000, 100)
+                    rec[key][sid] = {"salary": sal, "proj": proj, "value": round(proj / (sal / 1000), 2)}
+            dff[f"{team}_{clean}"] = rec
+
+    def news_item(i):
+        return {
+            "player_name": f"{rng.choice(FIRST_NAMES).title()} {rng.choice(LAST_NAMES).title()} {i}",
+            "next_game": "Monday vs BOS",
+            "title": "Questionable",
+            "details": "Listed as questionable for Monday's game."
+        }
+    n_news = n_players // 4
+    return {
+        "name": f"synthetic_{n_slates}x{n_players}",
+        "date": "2026-01-05",
+        "rosters": rosters,
+        "pairs": pairs,
+        "dff": dff,
+        "slates": slates,
+        "old_news": [news_item(i) for i in range(n_news)],
+        "new_news": [news_item(i) for i in range(n_news // 2, n_news + n_news // 2)],
+        "old_games": {}
+    }
+
+# ----------------------------------------------------
+# STAGES
+# ----------------------------------------------------
+# Each stage is (prepare, run): prepare builds fresh inputs outside the measurement
+# (the waterfall and the news merge change their input in place), run is measured.
+
+def stage_match(fixture):
+    def run(_):
+        index = scraper.build_match_index(fixture["dff"])
+        for team, starters in fixture["rosters"].items():
+            team_index = index.get(team, scraper.EMPTY_TEAM_INDEX)
+            for p in starters:
+                scraper.find_dff_key(team_index, scraper.clean_player_name(p['name']))
+    return (lambda: None), run
+
+def stage_rosters(fixture):
+    index = scraper.build_match_index(fixture["dff"])
+    def run(_):
+        for team_a, team_b in fixture["pairs"]:
+            old_game = fixture["old_games"].get(f"{team_a}-{team_b}-{fixture['date']}", {})
+            for team in [team_a, team_b]:
+                scraper.build_team_roster(
+                    team, fixture["rosters"].get(team, []), fixture["dff"],
+                    index.get(team, scraper.EMPTY_TEAM_INDEX), old_game
+                )
+    return (lambda: None), run
+
+def stage_waterfall(fixture):
+    def run(dff):
+        scraper.apply_slate_waterfall(dff, fixture["slates"])
+    return (lambda: copy.deepcopy(fixture["dff"])), run
+
+def stage_news(fixture):
+    def run(lists):
+        scraper.merge_news_lists(*lists)
+    return (lambda: (copy.deepcopy(fixture["old_news"]), copy.deepcopy(fixture["new_news"]))), run
+
+def stage_output(fixture, out_dir):
+    index = scraper.build_match_index(fixture["dff"])
+    games = []
+    for team_a, team_b in fixture["pairs"]:
+        games.append({
+            "id": f"{team_a}-{team_b}-{fixture['date']}",
+            "date": fixture["date"],
+            "teams": [team_a, team_b],
+            "meta": {"spread": "TBD", "total": "TBD", "time": "7:00 PM"},
+            "rosters": {
+                team: scraper.build_team_roster(team, fixture["rosters"].get(team, []), fixture["dff"], index.get(team, scraper.EMPTY_TEAM_INDEX), {})
+                for team in [team_a, team_b]
+            }
+        })
+    day_json = {
+        "last_updated": "Jan 05, 07:00 PM ET",
+        "player_news": fixture["old_news"] + fixture["new_news"],
+        "espn_schedule": None,
+        "slates": {p: [{"id": k, "name": v} for k, v in s.items()] for p, s in fixture["slates"].items()},
+        "games": games
+    }
+    path = os.path.join(out_dir, f"{fixture['name']}.json")
+    def run(_):
+        data_writer.write_json(path, day_json, sidecars=())
+    return (lambda: None), run
+
+def measure(prepare, run, repeat):
+    """(best ms, tracemalloc peak KB)"""
+    best = float('inf')
+    for _ in range(repeat):
+        arg = prepare()
+        start = time.perf_counter()
+        run(arg)
+        best = min(best, time.perf_counter() - start)
+
+    arg = prepare()
+    tracemalloc.start()
+    try:
+        run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+def bench_fixture(fixture, repeat, out_dir):
+    stages = {
+        'match': stage_match(fixture),
+        'rosters': stage_rosters(fixture),
+        'waterfall': stage_waterfall(fixture),
+        'news': stage_news(fixture),
+        'output': stage_output(fixture, out_dir)
+    }
+    results = {}
+    for stage in STAGES:
+        ms, peak_kb = measure(*stages[stage], repeat)
+        results[stage] = {"ms": round(ms, 3), "peak_kb": round(peak_kb, 1)}
+    return results
+
+# ----------------------------------------------------
+# BASELINE
+# ----------------------------------------------------
+def load_baseline(path):
+    if not os.path.exists(path): return None
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except:
+        return None
+
+def find_regressions(results, baseline, tolerance):
+    """[(fixture, stage, metric, baseline value, new value)] past baseline * (1 + tolerance)"""
+    regressions = []
+    for name, stages in results.items():
+        for stage, now in stages.items():
+            base = baseline.get(name, {}).get(stage)
+            if not base: continue
+            if now["ms"] > base["ms"] * (1 + tolerance) and now["ms"] - base["ms"] > MIN_REGRESSION_MS:
+                regressions.append((name, stage, "ms", base["ms"], now["ms"]))
+            if now["peak_kb"] > base["peak_kb"] * (1 + tolerance):
+                regressions.append((name, stage, "peak_kb", base["peak_kb"], now["peak_kb"]))
+    return regressions
+
+def run(days, repeat, tolerance, baseline_path, update_baseline, synthetic_only):
+    fixtures = [] if synthetic_only else daily_fixtures(days)
+    fixtures += [synthetic_fixture(n_slates, n_players) for n_slates, n_players in SYNTHETIC_SIZES]
+
+    out_dir = tempfile.mkdtemp(prefix="bench_build_")
+    results = {}
+    try:
+        print(f"Build pipeline, best of {repeat} (peak memory from one traced run)\n")
+        print(f"{'fixture':<22} {'players':>7} " + " ".join(f"{s + ' ms':>12} {'KB':>8}" for s in STAGES))
+        for fixture in fixtures:
+            res = bench_fixture(fixture, repeat, out_dir)
+            results[fixture["name"]] = res
+            cells = " ".join(f"{res[s]['ms']:>12.2f} {res[s]['peak_kb']:>8.0f}" for s in STAGES)
+            print(f"{fixture['name'][:22]:<22} {len(fixture['dff']):>7} {cells}")
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    if update_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        data_writer.write_json(baseline_path, results, sidecars=())
+        print(f"\n💾 Baseline saved to {baseline_path}")
+        return 0
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"\n⚠️ No baseline at {baseline_path}. Run with --update-baseline to store one.")
+        return 0
+
+    regressions = find_regressions(results, baseline, tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) past {tolerance:.0%} of baseline:")
+        for name, stage, metric, old, new in regressions:
+            print(f"   {name} / {stage}: {metric} {old} -> {new}")
+        return 1
+    print(f"\n✅ Every stage within {tolerance:.0%} of baseline.")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark build_json()'s offline stages and check them against a baseline")
+    parser.add_argument('--days', type=int, default=5, help="How many of the latest daily files with DFF data to use")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Allowed slowdown / growth over baseline (0.5 = 50%%)")
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true', help="Save this run as the new baseline")
+    parser.add_argument('--synthetic-only', action='store_true')
+    args = parser.parse_args()
+    sys.exit(run(args.days, args.repeat, args.tolerance, args.baseline, args.update_baseline, args.synthetic_only))
@@ -0,0 +1,117 @@
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..', 'scripts')
+LIVE_DIR = os.path.join(BENCH_DIR, '..', 'data', 'LIVE')
+sys.path.insert(0, SCRIPTS_DIR)
+
+import fantasy_scoring
+
+def legacy_calculate_fpts(stats):
+    """The per-athlete scorer the live scripts used before fantasy_scoring.py (reference only)"""
+    try: pts = float(stats.get('PTS', 0))
+    except: pts = 0.0
+    try: reb = float(stats.get('REB', 0))
+    except: reb = 0.0
+    try: ast = float(stats.get('AST', 0))
+    except: ast = 0.0
+    try: blk = float(stats.get('BLK', 0))
+    except: blk = 0.0
+    try: stl = float(stats.get('STL', 0))
+    except: stl = 0.0
+    try: to = float(stats.get('TO', 0))
+    except: to = 0.0
+
+    try: threepm = float(stats.get('3PT', '0-0').split('-')[0])
+    except: threepm = 0.0
+
+    fd_pts = pts + (reb * 1.2) + (ast * 1.5) + (blk * 3) + (stl * 3) - to
+    dk_pts = pts + (threepm * 0.5) + (reb * 1.25) + (ast * 1.5) + (blk * 2) + (stl * 2) - (to * 0.5)
+
+    doubles = sum(1 for stat in [pts, reb, ast, blk, stl] if stat >= 10)
+    if doubles >= 3: dk_pts += 3.0
+    elif doubles == 2: dk_pts += 1.5
+
+    return round(fd_pts, 2), round(dk_pts, 2)
+
+def load_slate(path):
+    """A saved live file is one full slate: every game's boxscore rows, grouped by team"""
+    with open(path, 'r') as f:
+        live_data = json.load(f)
+    teams = []
+    for game in live_data.values():
+        for rows in game.get('players', {}).values():
+            if rows:
+                teams.append(list(rows.values()))
+    return teams
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def first_cycle(teams):
+    """A fresh process: nothing memoized yet"""
+    fantasy_scoring._score_cache.clear()
+    return [fantasy_scoring.score_rows(rows) for rows in teams]
+
+def run(pattern, repeat):
+    files = sorted(glob.glob(pattern))
+    if not files:
+        print(f"❌ No live files match {pattern}")
+        return 1
+
+    # The live engine re-scores the whole slate every cycle and most lines don't change
+    # between cycles, so "cycle" (warm memo) is the steady state and "first" the cold start.
+    print(f"Per-cycle scoring time for a full slate (best of {repeat})\n")
+    print(f"{'slate':<28} {'players':>8} {'legacy ms':>10} {'first ms':>9} {'cycle ms':>9} {'speedup':>8}  output")
+
+    mismatches = 0
+    total_legacy, total_first, total_cycle = 0.0, 0.0, 0.0
+    for path in files:
+        teams = load_slate(path)
+        if not teams: continue
+        players = sum(len(rows) for rows in teams)
+
+        legacy_t = best_of(lambda: [[legacy_calculate_fpts(r) for r in rows] for rows in teams], repeat)
+        first_t = best_of(lambda: first_cycle(teams), repeat)
+        cycle_t = best_of(lambda: [fantasy_scoring.score_rows(rows) for rows in teams], repeat)
+
+        same = True
+        for scored in [first_cycle(teams), [fantasy_scoring.score_rows(rows) for rows in teams]]:
+            for rows, scores in zip(teams, scored):
+                expected = [legacy_calculate_fpts(r) for r in rows]
+                if list(zip(scores['fd'], scores['dk'])) != expected:
+                    same = False
+        if not same: mismatches += 1
+
+        total_legacy += legacy_t
+        total_first += first_t
+        total_cycle += cycle_t
+        print(f"{os.path.basename(path)[:28]:<28} {players:>8} {legacy_t * 1000:>10.2f} {first_t * 1000:>9.2f} {cycle_t * 1000:>9.2f} {legacy_t / max(cycle_t, 1e-9):>7.1f}x  {'identical' if same else 'MISMATCH'}")
+
+    print(f"\nFirst cycle: {total_legacy * 1000:.1f} ms -> {total_first * 1000:.1f} ms ({total_legacy / max(total_first, 1e-9):.1f}x)")
+    print(f"Every later cycle: {total_legacy * 1000:.1f} ms -> {total_cycle * 1000:.1f} ms ({total_legacy / max(total_cycle, 1e-9):.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} slate(s) scored differently from the legacy scorer.")
+        return 1
+    print("✅ Table scores identical to the legacy scorer on every slate.")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark table-driven fantasy scoring against the old per-athlete scorer")
+    parser.add_argument('--files', default=os.path.join(LIVE_DIR, 'live_*.json'), help="Glob of saved live files to score")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(run(args.files, args.repeat))
@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import argparse
+import zoneinfo
+from datetime import datetime
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..', 'scripts')
+SNAPSHOT_DIR = os.path.join(BENCH_DIR, 'snapshots')
+sys.path.insert(0, SCRIPTS_DIR)
+
+import scraper
+import http_client
+
+# Snapshot file prefix -> parser that consumes it
+PARSERS = {
+    'bbm_lineups': scraper.parse_starters_html,
+    'bbm_news': scraper.parse_player_news_html,
+    'dff_base': scraper.extract_slate_candidates,
+    'dff_slate': scraper.parse_projection_rows
+}
+
+def capture_snapshots(snapshot_dir):
+    """Saves today's live pages so the benchmark can be re-run offline against them"""
+    os.makedirs(snapshot_dir, exist_ok=True)
+    date_str = datetime.now(zoneinfo.ZoneInfo("America/New_York")).strftime("%Y-%m-%d")
+
+    def save(name, url, headers=None):
+        res = http_client.get(url, headers=headers or scraper.HEADERS, timeout=20)
+        if res.status_code != 200:
+            print(f"⚠️ {url} returned {res.status_code}, skipped")
+            return None
+        with open(os.path.join(snapshot_dir, f"{name}.html"), 'w', encoding='utf-8') as f:
+            f.write(res.text)
+        print(f"📥 Saved {name}.html ({len(res.content) / 1024:.0f} KB)")
+        return res.text
+
+    save(f"bbm_lineups_{date_str}", scraper.BBM_URL)
+    save(f"bbm_news_{date_str}", scraper.BBM_NEWS_URL)
+    for platform in ['fanduel', 'draftkings']:
+        base_url = f"https://www.dailyfantasyfuel.com/nba/projections/{platform}/{date_str}"
+        html = save(f"dff_base_{platform}_{date_str}", base_url)
+        if not html: continue
+        candidates = scraper.extract_slate_candidates(html)
+        sids = sorted(set(candidates['regex']) | {sid for sid, _ in candidates['named'] if len(str(sid)) == 5})
+        for sid in sids[:4]:
+            save(f"dff_slate_{platform}_{sid}_{date_str}", f"{base_url}?slate={sid}")
+
+def time_parse(parse_fn, html, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse_fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run(snapshot_dir, repeat):
+    files = sorted(f for f in os.listdir(snapshot_dir) if f.endswith('.html')) if os.path.isdir(snapshot_dir) else []
+    if not files:
+        print(f"❌ No snapshots in {snapshot_dir}. Run with --capture first.")
+        return 1
+
+    print(f"Parser: {scraper.FAST_HTML_PARSER} + SoupStrainer vs full html.parser (best of {repeat})\n")
+    print(f"{'snapshot':<48} {'KB':>6} {'full ms':>9} {'fast ms':>9} {'speedup':>8}  output")
+
+    mismatches = 0
+    total_full, total_fast = 0.0, 0.0
+    for fname in files:
+        parse_fn = next((fn for prefix, fn in PARSERS.items() if fname.startswith(prefix)), None)
+        if not parse_fn: continue
+
+        with open(os.path.join(snapshot_dir, fname), 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        scraper.TARGETED_PARSING = False
+        full_t, full_out = time_parse(parse_fn, html, repeat)
+        scraper.TARGETED_PARSING = True
+        fast_t, fast_out = time_parse(parse_fn, html, repeat)
+
+        same = full_out == fast_out
+        if not same: mismatches += 1
+        total_full += full_t
+        total_fast += fast_t
+        print(f"{fname[:48]:<48} {len(html) / 1024:>6.0f} {full_t * 1000:>9.1f} {fast_t * 1000:>9.1f} {full_t / max(fast_t, 1e-9):>7.1f}x  {'identical' if same else 'MISMATCH'}")
+
+    print(f"\nTotal: {total_full * 1000:.1f} ms -> {total_fast * 1000:.1f} ms ({total_full / max(total_fast, 1e-9):.1f}x)")
+    if mismatches:
+        print(f"❌ {mismatches} snapshot(s) parsed differently. Targeted parsing is NOT safe for these pages.")
+        return 1
+    print("✅ Targeted parsing output identical on every snapshot.")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark targeted vs full HTML parsing over saved page snapshots")
+    parser.add_argument('--snapshots', default=SNAPSHOT_DIR, help="Folder of saved .html pages")
+    parser.add_argument('--capture', action='store_true', help="Download fresh snapshots before benchmarking")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.capture:
+        capture_snapshots(args.snapshots)
+    sys.exit(run(args.snapshots, args.repeat))
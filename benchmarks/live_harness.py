@@ -0,0 +1,254 @@
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import threading
+import zoneinfo
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..', 'scripts')
+DATA_DIR = os.path.join(BENCH_DIR, '..', 'data')
+CAPTURE_DIR = os.path.join(BENCH_DIR, 'captures')
+sys.path.insert(0, SCRIPTS_DIR)
+
+ESPN_API_BASE = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba"
+NY_TZ = zoneinfo.ZoneInfo("America/New_York")
+
+# ==========================================================
+# --- RECORD / REPLAY HARNESS FOR THE LIVE ENGINE ---
+# ==========================================================
+#   capture -> polls the real ESPN scoreboard + every live game's summary and saves each
+#              response that changed, with its timestamp, to <name>.jsonl.gz
+#   replay  -> serves a capture from a local stand-in for ESPN at 1x-100x speed. Point the
+#              engine at it with ESPN_API_BASE=http://127.0.0.1:<port>
+#   bench   -> runs live_engine.main() cycle after cycle against the replay (on a virtual
+#              clock, in a temp data folder, Firebase in dry-run) and reports per-cycle
+#              latency, per-stage time and bytes written / pushed
+#
+# Capture line: {"t": epoch seconds, "kind": "scoreboard" | "summary", "key": date or event id, "body": {...}}
+
+def capture_path(name):
+    return name if name.endswith('.jsonl.gz') else os.path.join(CAPTURE_DIR, f"{name}.jsonl.gz")
+
+def capture(name, date_str, interval, max_minutes):
+    """Records a night of ESPN responses until every game is final (or max_minutes runs out)"""
+    import http_client
+
+    os.makedirs(CAPTURE_DIR, exist_ok=True)
+    path = capture_path(name)
+    espn_date = date_str.replace('-', '')
+    last_hash = {}
+    saved = 0
+    deadline = time.time() + max_minutes * 60
+
+    def record(out, kind, key, url):
+        nonlocal saved
+        try:
+            res = http_client.get(url, timeout=10)
+            body = res.json()
+        except Exception as e:
+            print(f"⚠️ {kind} {key} failed: {e}")
+            return None
+        digest = hashlib.sha1(res.content).hexdigest()
+        if last_hash.get((kind, key)) != digest:
+            # Unchanged responses aren't stored: replay serves the latest one at or before "now"
+            last_hash[(kind, key)] = digest
+            out.write(json.dumps({"t": time.time(), "kind": kind, "key": key, "body": body}, separators=(',', ':')) + '\n')
+            out.flush()
+            saved += 1
+        return body
+
+    print(f"🎥 Capturing ESPN for {date_str} into {path} (every {interval}s)...")
+    with gzip.open(path, 'at', encoding='utf-8') as out:
+        while time.time() < deadline:
+            scoreboard = record(out, 'scoreboard', espn_date, f"{ESPN_API_BASE}/scoreboard?dates={espn_date}")
+            events = (scoreboard or {}).get('events', [])
+            states = [e['status']['type']['state'] for e in events]
+
+            for e in events:
+                if e['status']['type']['state'] in ['in', 'post']:
+                    record(out, 'summary', e['id'], f"{ESPN_API_BASE}/summary?event={e['id']}")
+
+            print(f"   {datetime.now(NY_TZ).strftime('%H:%M:%S')} {states.count('in')} live / {states.count('pre')} pre / {states.count('post')} final, {saved} responses saved")
+            if events and all(s == 'post' for s in states):
+                print("🏁 Every game is final. Capture complete.")
+                break
+            time.sleep(interval)
+
+def load_capture(path):
+    """Returns ({(kind, key): [(t, body), ...] sorted by t}, first t, last t)"""
+    timeline = {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip(): continue
+            rec = json.loads(line)
+            timeline.setdefault((rec['kind'], str(rec['key'])), []).append((rec['t'], rec['body']))
+    for entries in timeline.values():
+        entries.sort(key=lambda e: e[0])
+    times = [t for entries in timeline.values() for t, _ in entries]
+    return timeline, min(times), max(times)
+
+class ReplayClock:
+    """Capture time 'now'. Either runs on its own at `speed`, or is stepped by the bench driver."""
+    def __init__(self, start, speed=1.0):
+        self.start = start
+        self.speed = speed
+        self.pinned = None
+        self._real_start = time.time()
+
+    def now(self):
+        if self.pinned is not None:
+            return self.pinned
+        return self.start + (time.time() - self._real_start) * self.speed
+
+def make_replay_server(timeline, clock, port=0):
+    """A local stand-in for ESPN's /scoreboard and /summary that answers from the capture"""
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path.endswith('/scoreboard'):
+                kind, key = 'scoreboard', query.get('dates', [''])[0]
+                entries = timeline.get((kind, key)) or next((v for (k, _), v in timeline.items() if k == 'scoreboard'), None)
+            elif url.path.endswith('/summary'):
+                kind, key = 'summary', query.get('event', [''])[0]
+                entries = timeline.get((kind, key))
+            else:
+                entries = None
+
+            if not entries:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            now = clock.now()
+            body = entries[0][1]
+            for t, b in entries:
+                if t > now: break
+                body = b
+
+            payload = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass  # Thousands of requests per replay; keep the console readable
+
+    return ThreadingHTTPServer(('127.0.0.1', port), ReplayHandler)
+
+def replay(path, speed, port):
+    timeline, first_t, last_t = load_capture(path)
+    clock = ReplayClock(first_t, speed)
+    server = make_replay_server(timeline, clock, port)
+    print(f"▶️  Replaying {os.path.basename(path)} ({(last_t - first_t) / 60:.0f} capture minutes) at {speed:g}x")
+    print(f"   export ESPN_API_BASE=http://127.0.0.1:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+def bench(path, max_cycles, keep_data):
+    timeline, first_t, last_t = load_capture(path)
+    clock = ReplayClock(first_t)
+    clock.pinned = first_t
+    server = make_replay_server(timeline, clock)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Everything the engine writes goes to a throwaway data folder
+    work_dir = tempfile.mkdtemp(prefix="live_bench_")
+    os.environ["ESPN_API_BASE"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["LIVE_FIREBASE_DRY_RUN"] = "1"
+
+    import pbp_log
+    import live_engine
+    live_engine.DATA_DIR = work_dir
+    live_engine.LIVE_DIR = os.path.join(work_dir, 'LIVE')
+    pbp_log.LIVE_DIR = live_engine.LIVE_DIR
+    pbp_log.PBP_DIR = os.path.join(live_engine.LIVE_DIR, 'pbp')
+    os.makedirs(live_engine.LIVE_DIR, exist_ok=True)
+
+    # Fallback rosters come from the daily file, when the repo has it for the captured date
+    capture_day = (datetime.fromtimestamp(first_t, NY_TZ) - timedelta(hours=4)).strftime("%Y-%m-%d")
+    daily_file = os.path.join(DATA_DIR, f"{capture_day}.json")
+    if os.path.exists(daily_file):
+        shutil.copy(daily_file, work_dir)
+
+    cycles = []
+    try:
+        while clock.pinned <= last_t and len(cycles) < max_cycles:
+            live_engine.main(now_est=datetime.fromtimestamp(clock.pinned, NY_TZ))
+            if live_engine.CYCLE_STATS:
+                cycles.append(dict(live_engine.CYCLE_STATS, t=clock.pinned))
+            # Jump the virtual clock straight to the next due game: no real sleeping
+            clock.pinned += live_engine.POLL_SCHEDULER.seconds_until_next_poll(clock.pinned)
+    finally:
+        server.shutdown()
+        if not keep_data:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report(cycles)
+    if keep_data:
+        print(f"\n📂 Engine output kept in {work_dir}")
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def report(cycles):
+    if not cycles:
+        print("❌ No engine cycles ran. Is the capture empty?")
+        return
+
+    print(f"\n{'stage':<14} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for stage in ['scoreboard_s', 'games_s', 'pbp_log_s', 'file_write_s', 'firebase_s', 'total_s']:
+        values = [c[stage] * 1000 for c in cycles if stage in c]
+        if not values: continue
+        print(f"{stage[:-2]:<14} {sum(values) / len(values):>9.1f} {percentile(values, 50):>9.1f} {percentile(values, 95):>9.1f} {max(values):>9.1f}")
+
+    fetched = sum(c.get('games_fetched', 0) for c in cycles)
+    print(f"\nCycles: {len(cycles)}  |  summary fetches: {fetched}  |  capture span: {(cycles[-1]['t'] - cycles[0]['t']) / 60:.0f} min")
+    for key, label in [('bytes_written', 'live file writes'), ('bytes_logged', 'play log appends'), ('bytes_snapshot', 'engine snapshots'), ('bytes_pushed', 'Firebase deltas')]:
+        total = sum(c.get(key, 0) for c in cycles)
+        print(f"{label:<17} {total / 1024:>10.1f} KB total  {total / len(cycles) / 1024:>8.2f} KB/cycle")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record, replay and benchmark the live engine against ESPN captures")
+    sub = parser.add_subparsers(dest='mode', required=True)
+
+    p_capture = sub.add_parser('capture', help="Save every changed ESPN response for a night")
+    p_capture.add_argument('name', help="Capture name (saved under benchmarks/captures/) or a .jsonl.gz path")
+    p_capture.add_argument('--date', default=(datetime.now(NY_TZ) - timedelta(hours=4)).strftime("%Y-%m-%d"))
+    p_capture.add_argument('--interval', type=int, default=10)
+    p_capture.add_argument('--max-minutes', type=int, default=6 * 60)
+
+    p_replay = sub.add_parser('replay', help="Serve a capture as a local ESPN stand-in")
+    p_replay.add_argument('name')
+    p_replay.add_argument('--speed', type=float, default=1.0, help="1 to 100x")
+    p_replay.add_argument('--port', type=int, default=8765)
+
+    p_bench = sub.add_parser('bench', help="Drive live_engine.main() through a capture and report timings")
+    p_bench.add_argument('name')
+    p_bench.add_argument('--max-cycles', type=int, default=100000)
+    p_bench.add_argument('--keep-data', action='store_true', help="Keep the engine's output folder")
+
+    args = parser.parse_args()
+    if args.mode == 'capture':
+        capture(args.name, args.date, args.interval, args.max_minutes)
+    elif args.mode == 'replay':
+        replay(capture_path(args.name), max(1.0, min(args.speed, 100.0)), args.port)
+    else:
+        bench(capture_path(args.name), args.max_cycles, args.keep_data)
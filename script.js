@@ -177,6 +177,27 @@ async function fetchLocalProbables(dateToFetch) {
 // ==========================================
 // FAILSAFE: STATIC ARCHIVE LOADER
 // ==========================================
+// Newer live snapshots point at an append-only play log (one JSON play per line, oldest first)
+// instead of embedding full_log. Rebuild full_log newest-first so the rest of the UI is unchanged.
+async function loadPlayLog(game) {
+    const pbp = game && game.play_by_play;
+    if (!pbp || pbp.full_log || !pbp.log) return;
+    pbp.full_log = [];
+    try {
+        const res = await fetch(`data/LIVE/${pbp.log}?v=` + new Date().getTime(), { cache: 'no-store' });
+        if (!res.ok) return;
+        const lines = (await res.text()).split('\n');
+        const plays = [];
+        for (const line of lines) {
+            if (!line.trim()) continue;
+            try { plays.push(JSON.parse(line)); } catch (e) { break; }
+        }
+        pbp.full_log = plays.reverse();
+    } catch (e) {
+        console.error("Play log fetch failed:", e);
+    }
+}
+
 async function loadStaticLiveArchive(dateToFetch) {
     console.log(`Checking local archive for live_${dateToFetch}.json...`);
     try {
@@ -184,6 +205,7 @@ async function loadStaticLiveArchive(dateToFetch) {
         
         if (liveResponse.ok) {
             LIVE_GAMES_DATA = await liveResponse.json();
+            await Promise.all(Object.values(LIVE_GAMES_DATA).map(loadPlayLog));
             
             // Populate PBP memory so stats and plays show up for completed games
             for (let localId in LIVE_GAMES_DATA) {
@@ -210,6 +232,14 @@ async function loadStaticLiveArchive(dateToFetch) {
     return false;
 }
 
+// Firebase keeps full_log oldest-first (new plays append as new indexes). Everything here reads it newest-first.
+function normalizeFirebaseGame(game) {
+    if (game && game.play_by_play && game.play_by_play.full_log) {
+        game.play_by_play.full_log = Object.values(game.play_by_play.full_log).reverse();
+    }
+    return game;
+}
+
 async function pollLiveData(dateToFetch) {
     try {
         const todayStr = new Date().toLocaleDateString('en-CA');
@@ -224,7 +254,7 @@ async function pollLiveData(dateToFetch) {
                 
                 if (incomingData) {
                     for (let localId in incomingData) {
-                        let game = incomingData[localId];
+                        let game = normalizeFirebaseGame(incomingData[localId]);
                         let hasNewPlays = false;
 
                         if (game.play_by_play) {
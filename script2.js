@@ -172,6 +172,35 @@ async function fetchLocalProbables(dateToFetch) {
     return { games: [], slates: { fanduel: [], draftkings: [] }, player_news: [], espn_schedule: null };
 }
 
+// Newer live snapshots point at an append-only play log (one JSON play per line, oldest first)
+// instead of embedding full_log. Rebuild full_log newest-first so the rest of the UI is unchanged.
+async function loadPlayLog(game) {
+    const pbp = game && game.play_by_play;
+    if (!pbp || pbp.full_log || !pbp.log) return;
+    pbp.full_log = [];
+    try {
+        const res = await fetch(`data/LIVE/${pbp.log}?v=` + new Date().getTime(), { cache: 'no-store' });
+        if (!res.ok) return;
+        const lines = (await res.text()).split('\n');
+        const plays = [];
+        for (const line of lines) {
+            if (!line.trim()) continue;
+            try { plays.push(JSON.parse(line)); } catch (e) { break; }
+        }
+        pbp.full_log = plays.reverse();
+    } catch (e) {
+        console.error("Play log fetch failed:", e);
+    }
+}
+
+// Firebase keeps full_log oldest-first (new plays append as new indexes). Everything here reads it newest-first.
+function normalizeFirebaseGame(game) {
+    if (game && game.play_by_play && game.play_by_play.full_log) {
+        game.play_by_play.full_log = Object.values(game.play_by_play.full_log).reverse();
+    }
+    return game;
+}
+
 async function pollLiveData(dateToFetch) {
     try {
         const todayStr = new Date().toLocaleDateString('en-CA');
@@ -190,7 +219,7 @@ async function pollLiveData(dateToFetch) {
                 
                 if (incomingData) {
                     for (let localId in incomingData) {
-                        let game = incomingData[localId];
+                        let game = normalizeFirebaseGame(incomingData[localId]);
                         let hasNewPlays = false;
 
                         if (game.play_by_play) {
@@ -268,6 +297,7 @@ async function pollLiveData(dateToFetch) {
             const liveResponse = await fetch(`data/LIVE/live_${dateToFetch}.json?v=` + new Date().getTime(), { cache: 'no-store' });
             if (liveResponse.ok) {
                 LIVE_GAMES_DATA = await liveResponse.json();
+                await Promise.all(Object.values(LIVE_GAMES_DATA).map(loadPlayLog));
                 renderGames(true);
             } else {
                 LIVE_GAMES_DATA = {};
@@ -0,0 +1,169 @@
+import os
+import json
+import threading
+
+import http_client
+
+# ==========================================================
+# --- END-OF-NIGHT ARCHIVE HANDOFF ---
+# ==========================================================
+# Once every game is final, the GitHub Action rebuilds and commits the day's live file
+# (data/LIVE/live_<date>.json). Only after that commit lands is it safe to wipe Firebase,
+# because the site falls back to the static file. The handoff runs on its own thread:
+#
+#   [verified ->] triggered -> waiting -> verified -> wiped
+#                                     \-> unverified -> (re-check only, with backoff) -> verified -> wiped
+#
+# The archive counts as done when the committed file itself holds every one of the
+# night's games in its final ('post') state. If it already does, nothing is triggered.
+# The live poll loop keeps running the whole time.
+
+HANDOFF_FIRST_CHECK_SECONDS = 60     # The Action needs about a minute just to boot
+HANDOFF_CHECK_INTERVAL_SECONDS = 30
+HANDOFF_MAX_WAIT_SECONDS = 15 * 60   # Per trigger, before re-pinging the Action
+HANDOFF_MAX_TRIGGERS = 3             # After this many unconfirmed runs, stop triggering (never wipe unverified)
+HANDOFF_RECHECK_FIRST_SECONDS = 120  # Then just re-read the archive: a late commit still counts
+HANDOFF_RECHECK_MAX_INTERVAL_SECONDS = 30 * 60
+HANDOFF_RECHECK_MAX_SECONDS = 6 * 3600
+
+# States the main loop treats as "start over on the next cycle"
+RETRY_STATES = ('failed', 'cancelled')
+
+def archive_is_final(date_str, expected_ids):
+    """
+    True when the day's live file on GitHub has every game in expected_ids, all in 'post'.
+    With no expected_ids, the file must hold at least one game and every game must be final.
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    repo = os.environ.get("GITHUB_REPO")
+    if not token or not repo:
+        return False
+
+    url = f"https://api.github.com/repos/{repo}/contents/data/LIVE/live_{date_str}.json"
+    headers = {
+        "Authorization": f"token {token}",
+        # Raw media type: the file body itself, not base64 wrapped in metadata
+        "Accept": "application/vnd.github.v3.raw"
+    }
+    try:
+        res = http_client.get(url, headers=headers, timeout=20)
+        if res.status_code != 200:
+            return False
+        archived = json.loads(res.content)
+    except Exception as e:
+        print(f"⚠️ Could not read the archived live file for {date_str}: {e}", flush=True)
+        return False
+
+    if not isinstance(archived, dict) or not archived:
+        return False
+    for game_id in (expected_ids or archived):
+        game = archived.get(game_id)
+        if not isinstance(game, dict) or game.get('status') != 'post':
+            return False
+    return True
+
+class ArchiveHandoff:
+    """
+    One night's Firebase -> static archive baton pass.
+    trigger_fn(date_str) pings the Action and returns True on success.
+    wipe_fn() clears Firebase; it runs under wipe_lock so it never races a live push.
+    expected_ids are the night's game ids the archive must hold.
+    """
+    def __init__(self, date_str, trigger_fn, wipe_fn, wipe_lock, expected_ids=()):
+        self.date_str = date_str
+        self.expected_ids = list(expected_ids)
+        self.trigger_fn = trigger_fn
+        self.wipe_fn = wipe_fn
+        self.wipe_lock = wipe_lock
+        self.state = 'pending'
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"archive-handoff-{date_str}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """A game went live again: stand down before anything gets wiped"""
+        if self.state not in ('wiped', 'cancelled', 'failed'):
+            print(f"🔁 Archive handoff for {self.date_str} cancelled (a game is active again).", flush=True)
+            self._cancel.set()
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def _set(self, state):
+        self.state = state
+        print(f"📦 Archive handoff {self.date_str}: {state}", flush=True)
+
+    def _archive_ready(self):
+        return archive_is_final(self.date_str, self.expected_ids)
+
+    def _wait_for_archive(self):
+        """Polls GitHub until the archived file is final, the wait runs out, or we're cancelled"""
+        waited = 0
+        delay = HANDOFF_FIRST_CHECK_SECONDS
+        while waited < HANDOFF_MAX_WAIT_SECONDS:
+            if self._cancel.wait(delay):
+                return False
+            waited += delay
+            if self._archive_ready():
+                return True
+            delay = HANDOFF_CHECK_INTERVAL_SECONDS
+        return False
+
+    def _recheck_archive(self):
+        """Verification only, no new triggers: backs off from HANDOFF_RECHECK_FIRST_SECONDS up to the interval cap"""
+        waited = 0
+        delay = HANDOFF_RECHECK_FIRST_SECONDS
+        while waited < HANDOFF_RECHECK_MAX_SECONDS:
+            if self._cancel.wait(delay):
+                return False
+            waited += delay
+            if self._archive_ready():
+                return True
+            delay = min(delay * 2, HANDOFF_RECHECK_MAX_INTERVAL_SECONDS)
+        return False
+
+    def _run(self):
+        # Already archived (e.g. the scheduled Action got there first): no new run, no new commit needed
+        verified = self._archive_ready()
+        if verified:
+            self._set('verified')
+
+        attempt = 0
+        while not verified and attempt < HANDOFF_MAX_TRIGGERS:
+            attempt += 1
+            if self._cancel.is_set(): break
+
+            if not self.trigger_fn(self.date_str):
+                self._set('failed')
+                return
+            self._set('triggered')
+
+            self._set('waiting')
+            if self._wait_for_archive():
+                verified = True
+                self._set('verified')
+                break
+            if not self._cancel.is_set():
+                print(f"⏳ Archive for {self.date_str} not final yet (trigger {attempt}/{HANDOFF_MAX_TRIGGERS}).", flush=True)
+
+        if not verified and not self._cancel.is_set():
+            # The static file may be missing games: Firebase stays up as the only full copy
+            print(f"❌ Archive for {self.date_str} not verified after {HANDOFF_MAX_TRIGGERS} triggers. Firebase left intact; re-checking with backoff.", flush=True)
+            self._set('unverified')
+            verified = self._recheck_archive()
+            if verified:
+                self._set('verified')
+
+        with self.wipe_lock:
+            if self._cancel.is_set():
+                self._set('cancelled')
+                return
+            if not verified:
+                print(f"❌ Gave up verifying the archive for {self.date_str}. Firebase left intact.", flush=True)
+                return
+            self.wipe_fn()
+            self._set('wiped')
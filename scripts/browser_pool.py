@@ -0,0 +1,191 @@
+import os
+import threading
+import queue
+
+# --- SELENIUM IMPORTS ---
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.expected_conditions import staleness_of
+from selenium.common.exceptions import TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, '..', '.cache')
+DRIVER_PATH_CACHE = os.path.join(CACHE_DIR, 'chromedriver_path.txt')
+
+# ==========================================================
+# --- CONFIGURATION ---
+# ==========================================================
+BROWSER_POOL_SIZE = int(os.environ.get("DFF_BROWSER_POOL_SIZE", "1"))
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Anything that proves the DFF slate picker (or the projections table) has rendered
+SLATE_DOM_SELECTOR = "option, [data-slate], a[href*='slate='], tr.projections-listing"
+# What a slate toggle reveals when it opens
+SLATE_ENTRY_SELECTOR = "option, [data-slate]"
+SLATE_TOGGLE_XPATH = "//*[contains(translate(text(), 'SLATE', 'slate'), 'slate') or contains(translate(text(), 'MAIN', 'main'), 'main') or contains(@class, 'slate')]"
+
+PAGE_READY_TIMEOUT = 10
+TOGGLE_READY_TIMEOUT = 3
+
+def resolve_driver_path(force_refresh=False):
+    """Returns the chromedriver binary path, only asking webdriver-manager when the cached path is gone"""
+    if not force_refresh and os.path.exists(DRIVER_PATH_CACHE):
+        try:
+            with open(DRIVER_PATH_CACHE, 'r') as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.exists(cached_path):
+                return cached_path
+        except: pass
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DRIVER_PATH_CACHE, 'w') as f:
+            f.write(driver_path)
+    except Exception as e:
+        print(f"⚠️ Could not cache chromedriver path: {e}")
+    return driver_path
+
+def build_chrome_options():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    return chrome_options
+
+def launch_chrome():
+    try:
+        return webdriver.Chrome(service=ChromeService(resolve_driver_path()), options=build_chrome_options())
+    except Exception as e:
+        # A cached driver can go stale when the runner's Chrome updates. Re-resolve once.
+        print(f"Cached chromedriver failed to launch ({e}). Re-resolving driver...")
+        return webdriver.Chrome(service=ChromeService(resolve_driver_path(force_refresh=True)), options=build_chrome_options())
+
+# ==========================================================
+# --- REUSABLE HEADLESS BROWSER POOL ---
+# ==========================================================
+# Put on the idle queue by shutdown(): wakes every thread blocked waiting for a browser
+_SHUTDOWN = object()
+
+class BrowserPool:
+    """
+    Starts Chrome lazily (at most `size` instances) and keeps it for the whole run.
+    Every page load gets its own tab, so concurrent dates/platforms never share DOM state.
+    """
+    def __init__(self, size=None):
+        self.size = max(1, size or BROWSER_POOL_SIZE)
+        self._idle = queue.Queue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _closed_error(self, driver=None):
+        if driver is _SHUTDOWN:
+            self._idle.put(_SHUTDOWN)  # Pass the wake-up on to the next waiter
+        return RuntimeError("Browser pool is shut down")
+
+    def _checkout(self):
+        if self._closed:
+            raise self._closed_error()
+        try:
+            driver = self._idle.get_nowait()
+            if driver is _SHUTDOWN or self._closed:
+                raise self._closed_error(driver)
+            return driver
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            # A crawl that outlived the fetch stage must not relaunch Chrome after shutdown()
+            if self._closed:
+                raise self._closed_error()
+            if len(self._all) < self.size:
+                print(f"🌐 Launching headless Chrome ({len(self._all) + 1}/{self.size})...")
+                driver = launch_chrome()
+                self._all.append(driver)
+                return driver
+
+        # Pool is full: wait for another thread to hand its browser back (or for shutdown)
+        driver = self._idle.get()
+        if driver is _SHUTDOWN or self._closed:
+            raise self._closed_error(driver)
+        return driver
+
+    def load_page_source(self, url, click_slate_toggles=True):
+        """Opens url in a fresh tab, waits for the slate DOM and returns the rendered HTML once"""
+        driver = self._checkout()
+        try:
+            base_handle = driver.current_window_handle
+            driver.switch_to.new_window('tab')
+            try:
+                driver.get(url)
+                wait_for_selector(driver, SLATE_DOM_SELECTOR, PAGE_READY_TIMEOUT)
+
+                if click_slate_toggles:
+                    try:
+                        # The picker is already on the page, so wait for the clicks to change it, not for it to exist
+                        entries_before = len(driver.find_elements(By.CSS_SELECTOR, SLATE_ENTRY_SELECTOR))
+                        toggles = driver.find_elements(By.XPATH, SLATE_TOGGLE_XPATH)
+                        clicked = []
+                        for t in toggles:
+                            try:
+                                if not t.get_attribute("href"):
+                                    driver.execute_script("arguments[0].click();", t)
+                                    clicked.append(t)
+                            except: pass
+                        if clicked:
+                            wait_for_dom_change(driver, SLATE_ENTRY_SELECTOR, entries_before, clicked, TOGGLE_READY_TIMEOUT)
+                    except: pass
+
+                return driver.page_source
+            finally:
+                driver.close()
+                driver.switch_to.window(base_handle)
+        finally:
+            # After shutdown() the driver is already quit: never hand it out again
+            if not self._closed:
+                self._idle.put(driver)
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            for driver in self._all:
+                try:
+                    driver.quit()
+                except: pass
+            self._all = []
+            self._idle.put(_SHUTDOWN)
+
+def wait_for_selector(driver, css_selector, timeout):
+    """Returns as soon as css_selector matches, instead of a fixed sleep. Times out quietly."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, css_selector)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+def wait_for_dom_change(driver, css_selector, count_before, clicked, timeout):
+    """
+    Returns once css_selector matches more elements than count_before or a clicked element
+    is re-rendered (goes stale). The short timeout is the fallback when nothing changes.
+    """
+    def changed(d):
+        if len(d.find_elements(By.CSS_SELECTOR, css_selector)) > count_before: return True
+        return any(staleness_of(el)(d) for el in clicked)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(changed)
+        return True
+    except TimeoutException:
+        return False
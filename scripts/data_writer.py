@@ -0,0 +1,65 @@
+import os
+import json
+import gzip
+import tempfile
+
+# Brotli is optional. Without it, .br sidecars are skipped.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ==========================================================
+# --- COMPACT ATOMIC DATA WRITER ---
+# ==========================================================
+# Every data file (daily JSON, nba_data.json, LIVE snapshots) goes through here:
+#   1. Minified JSON (no indent, no spaces after separators)
+#   2. Written to a temp file in the SAME folder, then os.replace()'d into place, so the
+#      site (or a concurrent reader) never sees a half-written file
+#   3. Optional precompressed .gz / .br sidecars for static hosting
+# Sidecars are opt-in per call, or globally via DATA_SIDECARS="gz,br".
+DEFAULT_SIDECARS = tuple(s.strip() for s in os.environ.get("DATA_SIDECARS", "").split(",") if s.strip())
+
+def atomic_write_bytes(path, payload):
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(payload)
+
+def serialize(obj):
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def write_json(path, obj, sidecars=None):
+    """
+    Atomically writes obj as minified JSON. Returns the number of bytes written,
+    sidecars included.
+    """
+    payload = serialize(obj)
+    written = atomic_write_bytes(path, payload)
+
+    for kind in (DEFAULT_SIDECARS if sidecars is None else sidecars):
+        if kind == 'gz':
+            # mtime=0 keeps the .gz byte-identical when the JSON is, so git sees no change
+            written += atomic_write_bytes(f"{path}.gz", gzip.compress(payload, compresslevel=9, mtime=0))
+        elif kind == 'br':
+            if brotli is None:
+                print("⚠️ brotli not installed. Skipping .br sidecar.")
+                continue
+            written += atomic_write_bytes(f"{path}.br", brotli.compress(payload))
+
+    return written
+
+def format_bytes(num_bytes):
+    if num_bytes >= 1024 * 1024: return f"{num_bytes / (1024 * 1024):.1f} MB"
+    if num_bytes >= 1024: return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes} B"
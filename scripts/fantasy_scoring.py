@@ -0,0 +1,106 @@
+# ==========================================================
+# --- TABLE-DRIVEN FANTASY SCORING ---
+# ==========================================================
+# Every scoring system is a table entry. A boxscore line is parsed ONCE and scored
+# under every system, and the result is remembered by the raw stat strings: between
+# live cycles almost every line on the slate is unchanged, so most rows are a dict hit
+# (at tip-off every line is the same all-zero line, so even the first cycle mostly hits).
+#
+# Scores match the old per-athlete math to the last bit: weights are applied one
+# stat at a time in the order listed (same float operations, same order), and the
+# final rounding uses Python's round().
+
+# Parsed stat order. 3PM comes from the "made" half of ESPN's "3PT" ("2-5" -> 2).
+STAT_COLUMNS = ['PTS', 'REB', 'AST', 'BLK', 'STL', 'TO', '3PM']
+COLUMN_INDEX = {stat: i for i, stat in enumerate(STAT_COLUMNS)}
+
+# Add a system here and it is scored everywhere score_rows() is used.
+#   weights -> (stat, points per unit), applied in this order
+#   bonus   -> count the stats at or over `threshold`; the highest tier reached pays out
+SCORING_SYSTEMS = {
+    'fd': {
+        'weights': [('PTS', 1), ('REB', 1.2), ('AST', 1.5), ('BLK', 3), ('STL', 3), ('TO', -1)],
+        'bonus': None
+    },
+    'dk': {
+        'weights': [('PTS', 1), ('3PM', 0.5), ('REB', 1.25), ('AST', 1.5), ('BLK', 2), ('STL', 2), ('TO', -0.5)],
+        # Double-double +1.5, triple-double +3 (not both)
+        'bonus': {
+            'stats': ['PTS', 'REB', 'AST', 'BLK', 'STL'],
+            'threshold': 10,
+            'tiers': [(3, 3.0), (2, 1.5)]
+        }
+    }
+}
+
+# A live night sees a few thousand distinct lines. The memo is dropped when it grows past this.
+SCORE_CACHE_MAX = 50000
+_score_cache = {}
+_compiled = {}
+
+def _to_float(value):
+    try: return float(value)
+    except: return 0.0
+
+def _made_threes(value):
+    try: return float(value.split('-')[0])
+    except: return 0.0
+
+def parse_line(key):
+    """Raw ESPN strings in STAT_COLUMNS order ('3PT' last) -> floats"""
+    try: values = [float(v) for v in key[:-1]]
+    except: values = [_to_float(v) for v in key[:-1]]
+    values.append(_made_threes(key[-1]))
+    return values
+
+def compile_system(system):
+    """Stat names -> column positions, so scoring a line is plain list indexing"""
+    weights = [(COLUMN_INDEX[stat], weight) for stat, weight in system['weights']]
+    bonus = system.get('bonus')
+    if bonus:
+        bonus = ([COLUMN_INDEX[stat] for stat in bonus['stats']], bonus['threshold'], bonus['tiers'])
+    return weights[0], weights[1:], bonus
+
+def score_line(key, systems):
+    """Rounded scores of one raw line under each named system"""
+    values = parse_line(key)
+    scores = []
+    for name in systems:
+        (col, weight), rest, bonus = _compiled[name]
+        total = values[col] * weight
+        for col, weight in rest:
+            total = total + values[col] * weight
+
+        if bonus:
+            cols, threshold, tiers = bonus
+            reached = sum([values[c] >= threshold for c in cols])
+            if reached:
+                for count, points in tiers:
+                    if reached >= count:
+                        total += points
+                        break
+        scores.append(round(total, 2))
+    return scores
+
+def score_rows(stats_rows, systems=('fd', 'dk')):
+    """
+    Scores a batch of boxscore rows (e.g. one team) under each named system.
+    Returns {system name: [score rounded to 2 places, one per row]}.
+    """
+    systems = tuple(systems)
+    for name in systems:
+        if name not in _compiled:
+            _compiled[name] = compile_system(SCORING_SYSTEMS[name])
+    if len(_score_cache) > SCORE_CACHE_MAX:
+        _score_cache.clear()
+
+    scores = []
+    for stats in stats_rows:
+        get = stats.get
+        # Keyed by the raw strings the score depends on, in STAT_COLUMNS order
+        key = (systems, get('PTS', 0), get('REB', 0), get('AST', 0), get('BLK', 0), get('STL', 0), get('TO', 0), get('3PT', '0-0'))
+        cached = _score_cache.get(key)
+        if cached is None:
+            cached = _score_cache[key] = score_line(key[1:], systems)
+        scores.append(cached)
+    return {name: [s[i] for s in scores] for i, name in enumerate(systems)}
@@ -1,8 +1,9 @@
 import json
 import os
-import urllib.request
 import io
 import re
+
+import http_client
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
 # --- CONFIGURATION ---
@@ -45,7 +46,10 @@ def get_fonts():
         print("  📥 Downloading Professional Font...")
         url = "https://github.com/googlefonts/roboto/raw/main/src/hinted/Roboto-Bold.ttf"
         try:
-            urllib.request.urlretrieve(url, font_path)
+            res = http_client.get(url, timeout=30)
+            res.raise_for_status()
+            with open(font_path, 'wb') as f:
+                f.write(res.content)
         except Exception:
             return ImageFont.load_default(), ImageFont.load_default()
     
@@ -67,17 +71,16 @@ def fetch_espn_headshots_for_team(team_abbr):
     
     headshots = {}
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read().decode())
-            for group in data.get('athletes', []):
-                for item in group.get('items', []):
-                    name = item.get('fullName', '')
-                    headshot_url = item.get('headshot', {}).get('href', '')
-                    if name and headshot_url:
-                        # Normalize the ESPN name so it matches the DFS name perfectly
-                        clean_name = normalize_name(name)
-                        headshots[clean_name] = headshot_url
+        resp = http_client.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+        data = resp.json()
+        for group in data.get('athletes', []):
+            for item in group.get('items', []):
+                name = item.get('fullName', '')
+                headshot_url = item.get('headshot', {}).get('href', '')
+                if name and headshot_url:
+                    # Normalize the ESPN name so it matches the DFS name perfectly
+                    clean_name = normalize_name(name)
+                    headshots[clean_name] = headshot_url
     except Exception as e:
         pass
         
@@ -85,9 +88,9 @@ def fetch_espn_headshots_for_team(team_abbr):
 
 def get_circular_avatar(image_url):
     try:
-        req = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as url_resp:
-            img = Image.open(io.BytesIO(url_resp.read())).convert("RGBA")
+        url_resp = http_client.get(image_url, headers={'User-Agent': 'Mozilla/5.0'})
+        url_resp.raise_for_status()
+        img = Image.open(io.BytesIO(url_resp.content)).convert("RGBA")
         
         img = img.resize((220, 220))
         mask = Image.new('L', img.size, 0)
@@ -0,0 +1,450 @@
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import unicodedata
+from datetime import date
+
+import numpy as np
+
+import data_writer
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, '..', 'data')
+LIVE_DIR = os.path.join(DATA_DIR, 'LIVE')
+# Derived from data/, so it lives with the other rebuildable caches (not committed)
+HISTORY_DIR = os.environ.get("HISTORY_DIR", os.path.join(SCRIPT_DIR, '..', '.cache', 'history'))
+
+DAILY_FILE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})\.json$')
+LIVE_FILE_RE = re.compile(r'^live_(\d{4}-\d{2}-\d{2})\.json$')
+
+# ==========================================================
+# --- COLUMNAR HISTORY STORE ---
+# ==========================================================
+# One row per player per team per night, joining the daily file (DFS salaries and
+# projections) with the live file (the box score line and actual fantasy points).
+# Each column is a flat binary file of fixed-width values, opened with np.memmap,
+# so a query only touches the rows and columns it asks for:
+#
+#   <HISTORY_DIR>/<column>.<gen>.bin   -> one value per row, rows sorted by date
+#   <HISTORY_DIR>/idx_player.<gen>.bin -> row ids grouped by player (date order within a player)
+#   <HISTORY_DIR>/idx_team.<gen>.bin   -> row ids grouped by team
+#   <HISTORY_DIR>/meta.json            -> generation, row count, string dictionaries, index offsets,
+#                                         the nights held, and the manifest (sha1 of every ingested
+#                                         file, per date)
+#
+# Strings (team, player, position) are dictionary-encoded: the column holds a code,
+# meta.json holds the strings. Missing numbers are NaN (floats) or 0 (salaries).
+#
+# Ingest is incremental: only dates whose daily or live file changed are rebuilt. Since
+# rows are sorted by date, that is the kept prefix up to the first changed date plus the
+# re-parsed tail (new nights land at the end, so it's normally just the last day or two).
+#
+# Files are never rewritten in place. Every ingest writes a new generation of column and
+# index files next to the current one, then swaps meta.json (atomically) to point at it.
+# A reader always sees one complete generation: the old one until meta.json lands, the
+# new one after. The previous generation is kept for readers that opened it lazily;
+# anything older is deleted.
+STORE_VERSION = 2
+
+COLUMNS = {
+    'date': 'int32',        # date.toordinal()
+    'team': 'int16',        # -> meta dicts.team
+    'opp': 'int16',         # -> meta dicts.team (-1 unknown)
+    'player': 'int32',      # -> meta dicts.player (normalized key) / dicts.player_name
+    'pos': 'int16',         # FanDuel position -> meta dicts.pos
+    'starter': 'int8',      # 1 starter, 0 bench, -1 not in the daily file
+    'fd_salary': 'int32',
+    'fd_proj': 'float32',
+    'dk_salary': 'int32',
+    'dk_proj': 'float32',
+    'min': 'float32',
+    'pts': 'float32',
+    'reb': 'float32',
+    'ast': 'float32',
+    'stl': 'float32',
+    'blk': 'float32',
+    'to': 'float32',
+    'fg3m': 'float32',
+    'fd_pts': 'float32',
+    'dk_pts': 'float32'
+}
+DICT_COLUMNS = {'team': 'team', 'opp': 'team', 'pos': 'pos'}
+
+# Live box score field -> column
+LIVE_STATS = {'MIN': 'min', 'PTS': 'pts', 'REB': 'reb', 'AST': 'ast', 'STL': 'stl', 'BLK': 'blk', 'TO': 'to'}
+
+NAME_SUFFIXES = ['jr', 'sr', 'ii', 'iii', 'iv']
+
+def player_key(name):
+    """
+    One key for every spelling of a player across sources: "Nikola Jokić" (ESPN),
+    "Nikola Jokic" (DFF), "P.J. Washington" / "PJ Washington", "Jabari Smith Jr."
+    """
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch)).lower()
+    name = re.sub(r"[.'’,]", '', name)
+    parts = name.split()
+    if len(parts) > 1 and parts[-1] in NAME_SUFFIXES:
+        parts = parts[:-1]
+    return ' '.join(parts)
+
+def file_digest(path):
+    if not path or not os.path.exists(path): return None
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _to_float(value):
+    try: return float(value)
+    except: return float('nan')
+
+def _made_threes(value):
+    try: return float(str(value).split('-')[0])
+    except: return float('nan')
+
+# ----------------------------------------------------
+# READING ONE NIGHT
+# ----------------------------------------------------
+def night_rows(date_str, daily_path, live_path):
+    """
+    {(team, player key): row dict} for one date. Daily and live rows for the same
+    player are merged; a player in only one of the files keeps the other side empty.
+    """
+    rows = {}
+
+    def row_for(team, name):
+        key = (team, player_key(name))
+        if key not in rows:
+            rows[key] = {
+                'team': team, 'opp': None, 'player_name': name, 'pos': '', 'starter': -1,
+                'fd_salary': 0, 'fd_proj': float('nan'), 'dk_salary': 0, 'dk_proj': float('nan'),
+                'min': float('nan'), 'pts': float('nan'), 'reb': float('nan'), 'ast': float('nan'),
+                'stl': float('nan'), 'blk': float('nan'), 'to': float('nan'), 'fg3m': float('nan'),
+                'fd_pts': float('nan'), 'dk_pts': float('nan')
+            }
+        return rows[key]
+
+    if daily_path and os.path.exists(daily_path):
+        with open(daily_path, 'r') as f:
+            daily = json.load(f)
+        for game in daily.get('games', []):
+            teams = game.get('teams', [])
+            if len(teams) != 2: continue
+            for team, opp in [(teams[0], teams[1]), (teams[1], teams[0])]:
+                roster = game.get('rosters', {}).get(team, {})
+                for starter, players in [(1, roster.get('players', [])), (0, roster.get('bench', []))]:
+                    for p in players:
+                        name = p.get('name', '')
+                        if not name or name == 'Waiting for Lineup': continue
+                        row = row_for(team, name)
+                        row.update({
+                            'opp': opp, 'player_name': name, 'pos': p.get('pos', '') or '', 'starter': starter,
+                            'fd_salary': int(p.get('salary', 0) or 0), 'fd_proj': _to_float(p.get('proj')),
+                            'dk_salary': int(p.get('dk_salary', 0) or 0), 'dk_proj': _to_float(p.get('dk_proj'))
+                        })
+
+    if live_path and os.path.exists(live_path):
+        with open(live_path, 'r') as f:
+            live = json.load(f)
+        for game_id, game in live.items():
+            teams = game_id.split('-')[:2]
+            for team, lines in (game.get('players') or {}).items():
+                opp = next((t for t in teams if t != team), None)
+                for name, stats in lines.items():
+                    if "(didn't match)" in name: continue  # Play-by-play placeholder, not a box score line
+                    row = row_for(team, name)
+                    if row['opp'] is None: row['opp'] = opp
+                    for field, col in LIVE_STATS.items():
+                        row[col] = _to_float(stats.get(field))
+                    row['fg3m'] = _made_threes(stats.get('3PT'))
+                    row['fd_pts'] = _to_float(stats.get('fd_pts'))
+                    row['dk_pts'] = _to_float(stats.get('dk_pts'))
+    return rows
+
+def source_files():
+    """{date: {"daily": path or None, "live": path or None}}"""
+    sources = {}
+    for folder, pattern, kind in [(DATA_DIR, DAILY_FILE_RE, 'daily'), (LIVE_DIR, LIVE_FILE_RE, 'live')]:
+        if not os.path.isdir(folder): continue
+        for f in os.listdir(folder):
+            m = pattern.match(f)
+            if m:
+                sources.setdefault(m.group(1), {'daily': None, 'live': None})[kind] = os.path.join(folder, f)
+    return sources
+
+# ----------------------------------------------------
+# WRITING
+# ----------------------------------------------------
+def _column_path(store_dir, name, gen):
+    return os.path.join(store_dir, f"{name}.{gen}.bin")
+
+def load_meta(store_dir=HISTORY_DIR):
+    path = os.path.join(store_dir, 'meta.json')
+    if not os.path.exists(path): return None
+    try:
+        with open(path, 'r') as f:
+            meta = json.load(f)
+        return meta if meta.get('version') == STORE_VERSION else None
+    except:
+        return None
+
+def empty_meta():
+    return {
+        'version': STORE_VERSION,
+        'generation': 0,
+        'rows': 0,
+        'columns': COLUMNS,
+        'dicts': {'team': [], 'pos': [], 'player': [], 'player_name': []},
+        'index': {'player': [0], 'team': [0]},
+        'nights': [],
+        'manifest': {}
+    }
+
+def _columns_intact(store_dir, meta):
+    for name, dtype in COLUMNS.items():
+        path = _column_path(store_dir, name, meta['generation'])
+        need = meta['rows'] * np.dtype(dtype).itemsize
+        if meta['rows'] and (not os.path.exists(path) or os.path.getsize(path) < need):
+            return False
+    return True
+
+def _read_column(store_dir, name, dtype, rows, gen):
+    if rows == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(_column_path(store_dir, name, gen), dtype=dtype, mode='r', shape=(rows,))
+
+def _build_index(store_dir, name, codes, n_codes, gen):
+    """Row ids grouped by code (stable, so date order is kept within a code) + offsets"""
+    order = np.argsort(codes, kind='stable').astype(np.int32)
+    counts = np.bincount(codes[codes >= 0], minlength=n_codes) if len(codes) else np.zeros(n_codes, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    data_writer.atomic_write_bytes(_column_path(store_dir, f"idx_{name}", gen), order.tobytes())
+    return [int(x) for x in offsets]
+
+BIN_FILE_RE = re.compile(r'^.+\.(\d+)\.bin$')
+
+def _newest_generation_on_disk(store_dir):
+    gens = [int(m.group(1)) for m in map(BIN_FILE_RE.match, os.listdir(store_dir)) if m]
+    return max(gens) if gens else 0
+
+def _drop_old_generations(store_dir, gen):
+    """Deletes column/index files older than the previous generation (and unversioned or temp leftovers)"""
+    for f in os.listdir(store_dir):
+        m = BIN_FILE_RE.match(f)
+        stale = int(m.group(1)) < gen - 1 if m else f.endswith('.bin')
+        if stale or f.startswith('.tmp_'):
+            try:
+                os.remove(os.path.join(store_dir, f))
+            except OSError:
+                pass
+
+def ingest(store_dir=HISTORY_DIR, full=False):
+    """
+    Brings the store up to date with data/ and data/LIVE/. Returns the number of dates
+    (re)ingested. full=True rebuilds from scratch.
+    """
+    start = time.perf_counter()
+    meta = None if full else load_meta(store_dir)
+    if meta is not None and not _columns_intact(store_dir, meta):
+        print("⚠️ History store columns don't match meta.json. Rebuilding from scratch.")
+        meta = None
+    if meta is None:
+        meta = empty_meta()
+    os.makedirs(store_dir, exist_ok=True)
+
+    sources = source_files()
+    digests = {d: {kind: file_digest(path) for kind, path in files.items()} for d, files in sources.items()}
+    manifest = meta['manifest']
+    changed = sorted(d for d in set(digests) | set(manifest) if digests.get(d) != manifest.get(d))
+    if not changed:
+        print(f"💤 History store up to date ({meta['rows']} rows, {len(manifest)} dates).")
+        return 0
+
+    # Everything from the first changed date on is rewritten; earlier rows are untouched
+    first_changed = date.fromisoformat(changed[0]).toordinal()
+    rows, old_gen = meta['rows'], meta['generation']
+    # Past anything on disk, so a rebuild never overwrites files a reader may have open
+    gen = max(old_gen, _newest_generation_on_disk(store_dir)) + 1
+    keep = int(np.searchsorted(_read_column(store_dir, 'date', COLUMNS['date'], rows, old_gen), first_changed, side='left')) if rows else 0
+    redo_dates = sorted(d for d in sources if date.fromisoformat(d).toordinal() >= first_changed)
+
+    dicts = meta['dicts']
+    lookups = {name: {v: i for i, v in enumerate(values)} for name, values in dicts.items()}
+
+    def code(dict_name, value):
+        if value is None: return -1
+        lookup = lookups[dict_name]
+        if value not in lookup:
+            lookup[value] = len(dicts[dict_name])
+            dicts[dict_name].append(value)
+        return lookup[value]
+
+    new_cols = {name: [] for name in COLUMNS}
+    for d_str in redo_dates:
+        ordinal = date.fromisoformat(d_str).toordinal()
+        night = night_rows(d_str, sources[d_str]['daily'], sources[d_str]['live'])
+        for (team, key), row in sorted(night.items()):
+            p_code = code('player', key)
+            if p_code == len(dicts['player_name']):
+                dicts['player_name'].append(row['player_name'])
+            new_cols['date'].append(ordinal)
+            new_cols['player'].append(p_code)
+            for col, dict_name in DICT_COLUMNS.items():
+                new_cols[col].append(code(dict_name, row[col]))
+            for col in COLUMNS:
+                if col in ('date', 'player') or col in DICT_COLUMNS: continue
+                new_cols[col].append(row[col])
+
+    # The new generation: the old generation's kept prefix + the re-parsed tail, in fresh files
+    added = len(new_cols['date'])
+    full_cols = {}
+    for name, dtype in COLUMNS.items():
+        kept = np.asarray(_read_column(store_dir, name, dtype, rows, old_gen)[:keep])
+        full_cols[name] = np.concatenate([kept, np.asarray(new_cols[name], dtype=dtype)])
+        data_writer.atomic_write_bytes(_column_path(store_dir, name, gen), full_cols[name].tobytes())
+
+    meta['generation'] = gen
+    meta['rows'] = keep + added
+    meta['index'] = {
+        'player': _build_index(store_dir, 'player', full_cols['player'], len(dicts['player']), gen),
+        'team': _build_index(store_dir, 'team', full_cols['team'], len(dicts['team']), gen)
+    }
+    meta['nights'] = [int(o) for o in np.unique(full_cols['date'])]
+    meta['manifest'] = {d: digests[d] for d in sorted(digests)}
+    # The switch: readers move to the new generation the moment meta.json is replaced
+    data_writer.write_json(os.path.join(store_dir, 'meta.json'), meta, sidecars=())
+    _drop_old_generations(store_dir, gen)
+
+    print(f"✅ History store: re-ingested {len(redo_dates)} date(s) from {changed[0]} ({added} rows), "
+          f"{meta['rows']} rows total, {time.perf_counter() - start:.2f}s.")
+    return len(redo_dates)
+
+# ----------------------------------------------------
+# QUERIES
+# ----------------------------------------------------
+class HistoryStore:
+    """
+    Read-only view of the store. Every query returns {column: numpy array} with the rows
+    in date order, plus 'date' as ISO strings and 'player_name' / 'team' / 'opp' / 'pos'
+    decoded. days=N means the N most recent nights in the store (not calendar "today").
+    """
+    def __init__(self, store_dir=HISTORY_DIR):
+        self.store_dir = store_dir
+        self.meta = load_meta(store_dir)
+        if self.meta is None:
+            raise FileNotFoundError(f"No history store in {store_dir}. Run: python scripts/history_store.py ingest")
+        self.rows = self.meta['rows']
+        self.dicts = self.meta['dicts']
+        self.player_codes = {key: i for i, key in enumerate(self.dicts['player'])}
+        self.team_codes = {team: i for i, team in enumerate(self.dicts['team'])}
+        self._columns = {}
+        self._index = {}
+
+    def column(self, name):
+        if name not in self._columns:
+            if name.startswith('idx_'):
+                self._columns[name] = _read_column(self.store_dir, name, 'int32', self.rows, self.meta['generation'])
+            else:
+                self._columns[name] = _read_column(self.store_dir, name, COLUMNS[name], self.rows, self.meta['generation'])
+        return self._columns[name]
+
+    def dates(self):
+        """Every ingested night, oldest first"""
+        return [date.fromordinal(o).isoformat() for o in self.meta['nights']]
+
+    def find_player(self, name):
+        """Player code for a name: exact (normalized) first, then a unique last-name match"""
+        key = player_key(name)
+        if key in self.player_codes:
+            return self.player_codes[key]
+        matches = [i for k, i in self.player_codes.items() if k.endswith(' ' + key) or k.split(' ')[-1] == key]
+        return matches[0] if len(matches) == 1 else None
+
+    def _cutoff(self, days, since):
+        if since:
+            return date.fromisoformat(since).toordinal()
+        if days:
+            nights = self.meta['nights']
+            return nights[-days] if len(nights) >= days else (nights[0] if nights else 0)
+        return None
+
+    def _select(self, row_ids, columns):
+        columns = columns or list(COLUMNS)
+        out = {}
+        for col in ['date'] + [c for c in columns if c != 'date']:
+            values = np.asarray(self.column(col))[row_ids]
+            if col == 'date':
+                out['date'] = [date.fromordinal(int(o)).isoformat() for o in values]
+            elif col in DICT_COLUMNS:
+                names = self.dicts[DICT_COLUMNS[col]]
+                out[col] = [names[c] if c >= 0 else None for c in values]
+            elif col == 'player':
+                out['player_name'] = [self.dicts['player_name'][c] for c in values]
+            else:
+                out[col] = values
+        return out
+
+    def _rows_for(self, index_name, code, days, since):
+        offsets = self.meta['index'][index_name]
+        row_ids = np.asarray(self.column(f"idx_{index_name}"))[offsets[code]:offsets[code + 1]]
+        cutoff = self._cutoff(days, since)
+        if cutoff is not None:
+            row_ids = row_ids[np.asarray(self.column('date'))[row_ids] >= cutoff]
+        return row_ids
+
+    def player_history(self, name, days=None, since=None, columns=None):
+        """A player's nights, e.g. player_history("Nikola Jokic", days=30, columns=['dk_salary', 'dk_pts'])"""
+        code = self.find_player(name)
+        if code is None:
+            return None
+        return self._select(self._rows_for('player', code, days, since), columns)
+
+    def team_history(self, team, days=None, since=None, columns=None):
+        code = self.team_codes.get(str(team).upper())
+        if code is None:
+            return None
+        return self._select(self._rows_for('team', code, days, since), columns)
+
+    def night(self, date_str, columns=None):
+        """Every row for one date"""
+        dates = self.column('date')
+        ordinal = date.fromisoformat(date_str).toordinal()
+        lo, hi = np.searchsorted(dates, ordinal, side='left'), np.searchsorted(dates, ordinal, side='right')
+        return self._select(np.arange(lo, hi), columns)
+
+def as_rows(result):
+    """Columnar query result -> list of row dicts (for printing / JSON)"""
+    if not result: return []
+    keys = list(result)
+    return [
+        {k: (v.item() if hasattr(v, 'item') else v) for k, v in zip(keys, values)}
+        for values in zip(*(result[k] for k in keys))
+    ]
+
+if __name__ == "__main__":
+    # python history_store.py [ingest | rebuild]
+    # python history_store.py player "Nikola Jokic" [days]
+    args = sys.argv[1:] or ['ingest']
+    if args[0] == 'ingest':
+        ingest()
+    elif args[0] == 'rebuild':
+        ingest(full=True)
+    elif args[0] == 'player' and len(args) >= 2:
+        store = HistoryStore()
+        query_start = time.perf_counter()
+        result = store.player_history(args[1], days=int(args[2]) if len(args) > 2 else None,
+                                      columns=['team', 'opp', 'starter', 'dk_salary', 'dk_proj', 'dk_pts', 'fd_salary', 'fd_proj', 'fd_pts', 'min'])
+        elapsed = (time.perf_counter() - query_start) * 1000
+        if result is None:
+            print(f"❌ No player matching '{args[1]}' in the history store.")
+        else:
+            for row in as_rows(result):
+                print(json.dumps(row))
+            print(f"⏱️ {len(result['date'])} nights in {elapsed:.2f} ms")
+    else:
+        print("Usage: history_store.py [ingest | rebuild | player <name> [days]]")
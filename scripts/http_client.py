@@ -0,0 +1,77 @@
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ==========================================================
+# --- SHARED POOLED HTTP CLIENT ---
+# ==========================================================
+# Every script goes through ONE requests.Session, so connections to the same host
+# (ESPN every 10 seconds, DFF slate pages, BBM) are kept alive and reused instead of
+# paying a fresh TCP + TLS handshake on every call.
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+DEFAULT_TIMEOUT = 15
+
+# Keep-alive sockets kept per host
+POOL_SIZE = 16
+
+# Max requests in flight per host. Hosts not listed use DEFAULT_HOST_LIMIT.
+DEFAULT_HOST_LIMIT = 8
+HOST_LIMITS = {
+    'www.dailyfantasyfuel.com': 6,
+    'basketballmonster.com': 2,
+    'api.elevenlabs.io': 2,
+    'api.github.com': 2
+}
+
+# Retries are for idempotent reads only. POSTs (GitHub dispatch, ElevenLabs) are never replayed.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'HEAD']),
+    raise_on_status=False
+)
+
+_session = None
+_session_lock = threading.Lock()
+_host_semaphores = {}
+
+def session():
+    """Returns the process-wide pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY_POLICY)
+                s.mount('https://', adapter)
+                s.mount('http://', adapter)
+                s.headers.update(DEFAULT_HEADERS)
+                _session = s
+    return _session
+
+def _host_slot(url):
+    host = urlparse(url).netloc.lower()
+    with _session_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT))
+        return _host_semaphores[host]
+
+def request(method, url, **kwargs):
+    """Same signature as requests.request(), routed through the shared pool"""
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    with _host_slot(url):
+        return session().request(method, url, **kwargs)
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
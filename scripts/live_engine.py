@@ -1,21 +1,39 @@
 import os
+import sys
 import json
-import requests
+import zlib
+import http_client
+import data_writer
+import pbp_log
+from name_resolver import NameResolver
+from fantasy_scoring import score_rows
+from mention_index import MentionIndex, patch_missing_players, evict_ghosts
 import zoneinfo
 import time
 import re
+import threading
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import base64
+import hashlib
+from poll_scheduler import PollScheduler
+from archive_handoff import ArchiveHandoff, RETRY_STATES
 
 # --- FIREBASE IMPORTS ---
-import firebase_admin
-from firebase_admin import credentials, db
+# Optional: the one-shot GitHub Action run never pushes, and installs only requests
+try:
+    import firebase_admin
+    from firebase_admin import credentials, db
+except ImportError:
+    firebase_admin = None
 
 # ==========================================================
 # --- SECURE FIREBASE INITIALIZATION ---
 # ==========================================================
 raw_firebase_secret = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-if raw_firebase_secret:
+if raw_firebase_secret and firebase_admin is None:
+    print("⚠️ firebase-admin not installed. Firebase pushing will be skipped.")
+elif raw_firebase_secret:
     try:
         if not firebase_admin._apps:
             cred_dict = json.loads(raw_firebase_secret)
@@ -49,6 +67,48 @@ TEAM_MAP = {
 
 ARCHIVED_DATES = set()
 
+# ESPN's NBA API. Pointed at benchmarks/live_harness.py's replay server for load tests.
+ESPN_API_BASE = os.environ.get("ESPN_API_BASE", "https://site.api.espn.com/apis/site/v2/sports/basketball/nba").rstrip('/')
+
+# Builds and measures every Firebase delta without sending it (benchmarks, no credentials needed)
+FIREBASE_DRY_RUN = os.environ.get("LIVE_FIREBASE_DRY_RUN") == "1"
+
+# Timings (seconds) and byte counts for the last main() cycle, read by the benchmark driver
+CYCLE_STATS = {}
+
+# Max games fetched and processed at once each cycle
+LIVE_FETCH_WORKERS = int(os.environ.get("LIVE_FETCH_WORKERS", "8"))
+
+# Per-game play-by-play state kept between cycles: processed sequence numbers, formatted
+# plays, and the on-court / unmatched sets as replayed from the substitutions.
+ENGINE_STATE = {}
+
+# Each ESPN game's next poll time, driven by its clock/status (see poll_scheduler.py)
+POLL_SCHEDULER = PollScheduler()
+
+# What Firebase's live_games node holds right now (firebase_view per game).
+# None until the first successful push, which sends every game whole.
+FIREBASE_MIRROR = None
+# game id -> fingerprint of the game object each mirrored view was built from
+MIRROR_FINGERPRINTS = {}
+
+# Guards live_games between the poll loop's pushes and the handoff thread's wipe
+FIREBASE_LOCK = threading.Lock()
+
+# End-of-night archive handoffs by date (see archive_handoff.py)
+ARCHIVE_HANDOFFS = {}
+
+# How long to back off when the ESPN scoreboard itself can't be fetched
+SCOREBOARD_RETRY_SECONDS = 30
+
+# 🌙 MIDNIGHT ROLLOVER: hours subtracted from Eastern time to get the NBA "day".
+# The one-shot archive run looks back further, so a late West Coast final still lands on its night.
+ROLLOVER_HOURS = 4
+ONE_SHOT_ROLLOVER_HOURS = 6
+
+def firebase_ready():
+    return firebase_admin is not None and bool(firebase_admin._apps)
+
 def trigger_github_action(date_str):
     """Pings the GitHub Action to run the live_update script and commit the final archive."""
     token = os.environ.get("GITHUB_TOKEN")
@@ -71,7 +131,7 @@ def trigger_github_action(date_str):
     
     # 🛡️ THE FIX: Wrapped in a try/except with a 10-second timeout!
     try:
-        res = requests.post(url, headers=headers, json=data, timeout=10)
+        res = http_client.post(url, headers=headers, json=data, timeout=10)
 
         if res.status_code == 204:
             print(f"✅ Successfully triggered GitHub Action for {date_str}!", flush=True)
@@ -89,23 +149,113 @@ def normalize_team(abbr):
     clean = abbr.strip().upper()
     return TEAM_MAP.get(clean, clean)
 
-def inspect_and_sanitize(obj, current_path="root"):
-    """Recursively removes forbidden Firebase characters from dictionary keys"""
-    if isinstance(obj, dict):
-        new_dict = {}
-        for k, v in obj.items():
-            k_str = str(k).strip()
-            safe_key = k_str
-            if not k_str: safe_key = "empty_key"
-            
-            if re.search(r'[.$#\[\]/]', safe_key):
-                safe_key = re.sub(r'[.$#\[\]/]', '_', safe_key)
-            new_dict[safe_key] = inspect_and_sanitize(v, f"{current_path} -> {safe_key}")
-        return new_dict
-    elif isinstance(obj, list):
-        return [inspect_and_sanitize(item, f"{current_path}[{i}]") for i, item in enumerate(obj)]
-    else:
-        return obj
+# Characters Firebase refuses in keys
+FIREBASE_FORBIDDEN = re.compile(r'[.$#\[\]/]')
+
+def firebase_key(key):
+    """A key Firebase accepts as-is (same rule the old push-time sanitizer used)"""
+    k_str = str(key).strip()
+    if not k_str: return "empty_key"
+    return FIREBASE_FORBIDDEN.sub('_', k_str)
+
+def game_fingerprint(game_data):
+    """Stable content hash of a game object (its own fingerprint field excluded). Called once, as the game is built."""
+    if game_data is None: return None
+    if 'fingerprint' in game_data:
+        game_data = {k: v for k, v in game_data.items() if k != 'fingerprint'}
+    payload = json.dumps(game_data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def stored_fingerprint(game_data):
+    """
+    The fingerprint stamped when the game was built. A carried-over game is the same,
+    unmodified dict, so its stamp still holds. Only files written before stamping get hashed.
+    """
+    if game_data is None: return None
+    return game_data.get('fingerprint') or game_fingerprint(game_data)
+
+def live_data_changed(new_live_data, old_live_data):
+    """Fingerprint comparison instead of a deep compare of every game"""
+    if new_live_data.keys() != old_live_data.keys(): return True
+    return any(stored_fingerprint(g) != stored_fingerprint(old_live_data[fix_id]) for fix_id, g in new_live_data.items())
+
+# The file keeps its historical keys (safe_key() names can carry edge whitespace or end
+# up empty), so the maps keyed by ESPN text get their Firebase keys here. Each name is
+# sanitized once per process, and each game remembers its key mapping, so a changed game
+# only pays a tuple compare unless a player or stat key appeared.
+FIREBASE_KEY_NAMES = {}  # stored key -> Firebase key
+FIREBASE_KEY_MAPS = {}   # (game id, section, team) -> (keys last seen, {stored key: Firebase key} or None)
+
+def cached_firebase_key(key):
+    safe = FIREBASE_KEY_NAMES.get(key)
+    if safe is None:
+        safe = FIREBASE_KEY_NAMES[key] = firebase_key(key)
+    return safe
+
+def firebase_keys(cache_id, d):
+    """d with Firebase-accepted keys. Returns d itself when nothing needs renaming, which is almost always."""
+    keys = tuple(d)
+    cached = FIREBASE_KEY_MAPS.get(cache_id)
+    if cached is None or cached[0] != keys:
+        renames = {k: cached_firebase_key(k) for k in keys if cached_firebase_key(k) != k}
+        cached = FIREBASE_KEY_MAPS[cache_id] = (keys, renames or None)
+    renames = cached[1]
+    if renames is None: return d
+    return {renames.get(k, k): v for k, v in d.items()}
+
+def forget_firebase_keys(live_game_ids):
+    """Drops key mappings of games that left the board"""
+    for cache_id in [c for c in FIREBASE_KEY_MAPS if c[0] not in live_game_ids]:
+        del FIREBASE_KEY_MAPS[cache_id]
+
+def firebase_view(game_id, game_data, full_log):
+    """
+    The game exactly as Firebase stores it: the game object plus the full play log, kept
+    OLDEST-first so each new play lands on a brand-new index instead of shifting every
+    existing one. The fingerprint stays in the file; the site never reads it from Firebase.
+    """
+    view = {k: v for k, v in game_data.items() if k != 'fingerprint'}
+    if isinstance(view.get("play_by_play"), dict):
+        view["play_by_play"] = dict(view["play_by_play"], full_log=full_log)
+    for section in ("players", "team_stats"):
+        if isinstance(view.get(section), dict):
+            view[section] = {
+                cached_firebase_key(t): firebase_keys((game_id, section, t), v)
+                for t, v in view[section].items()
+            }
+    return view
+
+def firebase_play_log(date_str, game_id):
+    """A game's plays for Firebase (oldest first): engine state, else what Firebase already has, else the log file"""
+    if game_id in ENGINE_STATE:
+        return list(ENGINE_STATE[game_id]["formatted"])  # Copy: the engine keeps appending to its own list
+    mirrored = ((FIREBASE_MIRROR or {}).get(game_id) or {}).get("play_by_play", {}).get("full_log")
+    if mirrored is not None:
+        return mirrored
+    return pbp_log.read_game(date_str, game_id)
+
+def leaf_delta(old, new, path, delta):
+    """
+    Adds {"a/b/c": value} entries to delta for every leaf that differs between old and new.
+    Lists are diffed index by index, so appended plays only send the new indexes.
+    Keys that disappeared are sent as None (Firebase deletes them).
+    """
+    if old == new:
+        return delta
+
+    old_map = {str(i): v for i, v in enumerate(old)} if isinstance(old, list) else old
+    new_map = {str(i): v for i, v in enumerate(new)} if isinstance(new, list) else new
+
+    if isinstance(old_map, dict) and isinstance(new_map, dict) and new_map:
+        for k, v in new_map.items():
+            leaf_delta(old_map.get(k), v, f"{path}/{k}", delta)
+        for k in old_map:
+            if k not in new_map:
+                delta[f"{path}/{k}"] = None
+        return delta
+
+    delta[path] = new
+    return delta
 
 def safe_key(name):
     """Removes forbidden Firebase characters from dictionary keys"""
@@ -114,97 +264,495 @@ def safe_key(name):
         name = name.replace(char, '')
     return name
 
-def calculate_fpts(stats):
-    """Calculates FD and DK Fantasy Points dynamically"""
-    try: pts = float(stats.get('PTS', 0))
-    except: pts = 0.0
-    try: reb = float(stats.get('REB', 0))
-    except: reb = 0.0
-    try: ast = float(stats.get('AST', 0))
-    except: ast = 0.0
-    try: blk = float(stats.get('BLK', 0))
-    except: blk = 0.0
-    try: stl = float(stats.get('STL', 0))
-    except: stl = 0.0
-    try: to = float(stats.get('TO', 0))
-    except: to = 0.0
-    
-    try: threepm = float(stats.get('3PT', '0-0').split('-')[0])
-    except: threepm = 0.0
-
-    fd_pts = pts + (reb * 1.2) + (ast * 1.5) + (blk * 3) + (stl * 3) - to
-    dk_pts = pts + (threepm * 0.5) + (reb * 1.25) + (ast * 1.5) + (blk * 2) + (stl * 2) - (to * 0.5)
-    
-    doubles = sum(1 for stat in [pts, reb, ast, blk, stl] if stat >= 10)
-    if doubles >= 3: dk_pts += 3.0 
-    elif doubles == 2: dk_pts += 1.5 
-
-    return round(fd_pts, 2), round(dk_pts, 2)
-
-def resolve_espn_name(pbp_name, roster_names):
-    """
-    Strictly maps ESPN's Play-by-Play short names (e.g., 'I. Joe') 
-    to ESPN's Boxscore full names (e.g., 'Isaiah Joe').
-    """
-    clean_pbp = pbp_name.replace('.', '').strip().lower()
+def format_play(p):
+    """Turns a raw ESPN play into the compact play object stored in full_log"""
+    seq = float(p.get('sequenceNumber', 0))
+    clock_data = p.get('clock') or {}
+    clock = clock_data.get('displayValue', '') if isinstance(clock_data, dict) else ''
+    period_data = p.get('period') or {}
+    period = period_data.get('number', '') if isinstance(period_data, dict) else ''
+    text = p.get('text', '')
+    
+    # Format OT nicely based on Period number!
+    if str(period).isdigit():
+        period_num = int(period)
+        if period_num == 5:
+            time_str = f"OT {clock}".strip()
+        elif period_num > 5:
+            time_str = f"{period_num - 4}OT {clock}".strip()
+        else:
+            time_str = f"Q{period_num} {clock}".strip()
+    else:
+        time_str = clock
+    
+    return {
+        "seq": seq,
+        "period": period,
+        "time": time_str,
+        "text": text
+    }
 
-    for full_name in roster_names:
-        if clean_pbp == full_name.replace('.', '').strip().lower():
-            return full_name
+def apply_substitution(text, resolvers, home_abbr, away_abbr, on_court_tracker, unmatched_injections):
+    """Applies one 'X enters the game for Y' play to the on-court sets"""
+    if ' enters the game for ' not in text: return
+    parts = text.split(' enters the game for ')
+    if len(parts) != 2: return
+    
+    p_in_raw = parts[0].strip()
+    p_out_raw = parts[1].strip()
+    
+    if not p_in_raw or not p_out_raw: return
+    
+    team_in, full_in = None, None
+    team_out, full_out = None, None
+    
+    for t_abbr in [home_abbr, away_abbr]:
+        if not team_in:
+            m_in = resolvers[t_abbr].resolve(p_in_raw)
+            if m_in: team_in, full_in = t_abbr, m_in
+        if not team_out:
+            m_out = resolvers[t_abbr].resolve(p_out_raw)
+            if m_out: team_out, full_out = t_abbr, m_out
             
-    parts = clean_pbp.split()
-    if len(parts) > 1:
-        pbp_first = parts[0]
-        pbp_last = parts[-1]
+    target_team = team_in or team_out
+    if not target_team: return
+    
+    if not full_in:
+        in_val = f"{p_in_raw} (didn't match)"
+        unmatched_injections[target_team][in_val] = True
+    else:
+        in_val = full_in
+
+    if not full_out:
+        out_val = f"{p_out_raw} (didn't match)"
+        unmatched_injections[target_team][out_val] = False
+    else:
+        out_val = full_out
         
-        matching_initials = []
-        for full_name in roster_names:
-            clean_full = full_name.replace('.', '').strip().lower()
-            full_parts = clean_full.split()
-            compare_last = full_parts[-2] if full_parts[-1] in ['jr', 'sr', 'ii', 'iii', 'iv'] and len(full_parts) > 1 else full_parts[-1]
-            
-            if compare_last == pbp_last and clean_full.startswith(pbp_first[0]):
-                matching_initials.append(full_name)
+    if out_val in on_court_tracker[target_team]:
+        on_court_tracker[target_team].remove(out_val)
+    elif not full_out:
+        out_parts = p_out_raw.split()
+        if out_parts:
+            for p in list(on_court_tracker[target_team]):
+                if out_parts[-1].lower() in p.lower():
+                    on_court_tracker[target_team].remove(p)
+                    break
                 
-        if len(matching_initials) == 1:
-            return matching_initials[0]
+    on_court_tracker[target_team].add(in_val)
+
+def advance_game_state(state, raw_plays, rosters, home_abbr, away_abbr, home_starters, away_starters):
+    """
+    Brings a game's persisted engine state up to date with this cycle's plays.
+    Only plays after the last processed sequence number are formatted and replayed.
+    A full replay from the starters happens when there is no state yet, the rosters or
+    starters changed, or ESPN revised sequence numbers we already processed.
+    """
+    seqs = [float(p.get('sequenceNumber', 0)) for p in raw_plays]
+    if any(seqs[i] > seqs[i + 1] for i in range(len(seqs) - 1)):
+        order = sorted(range(len(raw_plays)), key=lambda i: seqs[i])
+        raw_plays = [raw_plays[i] for i in order]
+        seqs = [seqs[i] for i in order]
+    
+    roster_sig = (
+        tuple(rosters[home_abbr]), tuple(rosters[away_abbr]),
+        tuple(sorted(home_starters)), tuple(sorted(away_starters))
+    )
+    
+    processed = len(state["seqs"]) if state else 0
+    can_resume = (
+        state is not None
+        and state["roster_sig"] == roster_sig
+        and len(seqs) >= processed
+        and seqs[:processed] == state["seqs"]
+    )
+    
+    if not can_resume:
+        if state is not None:
+            print(f"   -> Play history revised or roster changed. Full replay for {away_abbr} @ {home_abbr}.")
+        state = {
+            "roster_sig": roster_sig,
+            "seqs": [],
+            "formatted": [],
+            "on_court": {home_abbr: set(home_starters), away_abbr: set(away_starters)},
+            # Roster name lookups, built once per roster (roster_sig) instead of per substitution
+            "resolvers": {home_abbr: NameResolver(rosters[home_abbr]), away_abbr: NameResolver(rosters[away_abbr])},
+            # Who each play mentions, for the on-court repair passes
+            "mentions": MentionIndex(),
+            "unmatched": {home_abbr: {}, away_abbr: {}}
+        }
+        processed = 0
+    
+    for p in raw_plays[processed:]:
+        state["formatted"].append(format_play(p))
+        state["mentions"].add_play(p.get('text', ''))
+        apply_substitution(p.get('text', ''), state["resolvers"], home_abbr, away_abbr, state["on_court"], state["unmatched"])
+    
+    state["seqs"] = seqs
+    return state
+
+# ==========================================================
+# --- ENGINE SNAPSHOT (RESUME ACROSS RUNS) ---
+# ==========================================================
+# data/LIVE/engine_<date>.snap is a zlib-compressed JSON of each game's engine state:
+# how many plays were processed (and the last seq), the roster signature, and the
+# on-court / unmatched sets those plays left behind. The plays themselves are NOT in it:
+# they are already in the game's play-by-play log, and the player lines are in the live
+# file. A fresh process (a one-shot run, or a restarted daemon) rebuilds ENGINE_STATE from
+# these, so it only formats and replays plays that are new since the snapshot.
+SNAPSHOT_VERSION = 1
+
+# Dates whose snapshot this process has already restored, and the last bytes saved per date
+RESTORED_DATES = set()
+SAVED_SNAPSHOTS = {}
+
+def snapshot_path(date_str):
+    return os.path.join(LIVE_DIR, f"engine_{date_str}.snap")
+
+def export_game_state(state):
+    teams = list(state["on_court"])
+    return {
+        "teams": teams,
+        "count": len(state["formatted"]),
+        "last_seq": state["seqs"][-1] if state["seqs"] else 0,
+        "roster_sig": state["roster_sig"],
+        "on_court": {t: list(state["on_court"][t]) for t in teams},
+        "unmatched": state["unmatched"]
+    }
+
+def restore_game_state(saved, formatted):
+    """The engine state export_game_state() saved, with the plays read back from the log"""
+    home_abbr, away_abbr = saved["teams"]
+    roster_sig = tuple(tuple(part) for part in saved["roster_sig"])
+    mentions = MentionIndex()
+    for play in formatted:
+        mentions.add_play(play.get('text', ''))
+    return {
+        "roster_sig": roster_sig,
+        "seqs": [play["seq"] for play in formatted],
+        "formatted": formatted,
+        "on_court": {t: set(saved["on_court"][t]) for t in saved["teams"]},
+        "resolvers": {home_abbr: NameResolver(list(roster_sig[0])), away_abbr: NameResolver(list(roster_sig[1]))},
+        "mentions": mentions,
+        "unmatched": {t: dict(saved["unmatched"][t]) for t in saved["teams"]}
+    }
+
+def save_engine_snapshot(date_str, game_ids):
+    """Writes the snapshot for the given games when it changed. Returns bytes written."""
+    games = {game_id: export_game_state(ENGINE_STATE[game_id]) for game_id in game_ids if game_id in ENGINE_STATE}
+    payload = zlib.compress(data_writer.serialize({"v": SNAPSHOT_VERSION, "date": date_str, "games": games}), 9)
+    if SAVED_SNAPSHOTS.get(date_str) == payload:
+        return 0
+    written = data_writer.atomic_write_bytes(snapshot_path(date_str), payload)
+    SAVED_SNAPSHOTS[date_str] = payload
+    return written
+
+def restore_engine_snapshot(date_str):
+    """
+    Rebuilds ENGINE_STATE for a date from its snapshot and play logs. A game whose log no
+    longer lines up with the snapshot is skipped (it gets a full replay, as before).
+    """
+    path = snapshot_path(date_str)
+    if not os.path.exists(path):
+        return 0
+    try:
+        with open(path, 'rb') as f:
+            snapshot = json.loads(zlib.decompress(f.read()))
+    except Exception as e:
+        print(f"⚠️ Engine snapshot for {date_str} unreadable, starting cold: {e}")
+        return 0
+    if snapshot.get("v") != SNAPSHOT_VERSION or snapshot.get("date") != date_str:
+        return 0
+
+    pbp_index = pbp_log.load_index(date_str)
+    restored = 0
+    for game_id, saved in snapshot.get("games", {}).items():
+        if game_id in ENGINE_STATE: continue  # Live memory always beats the snapshot
+        entry = pbp_index.get(game_id)
+        if not entry or entry['count'] != saved['count']: continue
+        formatted = pbp_log.read_game(date_str, game_id)[:saved['count']]
+        if len(formatted) != saved['count']: continue
+        if formatted and formatted[-1]['seq'] != saved['last_seq']: continue
+        try:
+            ENGINE_STATE[game_id] = restore_game_state(saved, formatted)
+            restored += 1
+        except Exception as e:
+            print(f"⚠️ Could not restore engine state for {game_id}: {e}")
+    if restored:
+        print(f"♻️ Restored engine state for {restored} game(s) from {os.path.basename(path)}.")
+    return restored
+
+def process_live_event(event, current_date_str, now_est, base_json, old_live_data, is_due=True):
+    """
+    Fetches the summary for one in-progress (or just-finished) game and builds its live object.
+    Returns (local_game_id, game_live_obj, counts_as_active). game_live_obj is None when the
+    summary fetch failed. Runs on a worker thread, so it only touches its own game's state.
+    Games the scheduler says aren't due yet keep last cycle's object without a fetch.
+    """
+    status_state = event['status']['type']['state']
+    game_id = event['id']
+    comp = event['competitions'][0]
+    
+    home_abbr = normalize_team(comp['competitors'][0]['team']['abbreviation'])
+    away_abbr = normalize_team(comp['competitors'][1]['team']['abbreviation'])
+    local_game_id = f"{away_abbr}-{home_abbr}-{current_date_str}"
+    
+    clock_text = event['status']['type']['shortDetail']
+    
+    away_score = comp['competitors'][1].get('score', '0')
+    home_score = comp['competitors'][0].get('score', '0')
+    
+    print(f"Processing Live Game: {away_abbr} {away_score} @ {home_score} {home_abbr} ({clock_text})")
+    
+    # 🛑 THE 10-MINUTE COOLDOWN: Catch late stat corrections, then go to sleep!
+    if status_state == 'post':
+        if local_game_id in old_live_data and 'game_ended_time' in old_live_data[local_game_id]:
+            ended_time_str = old_live_data[local_game_id]['game_ended_time']
+            try:
+                ended_time = datetime.fromisoformat(ended_time_str)
+                if now_est > ended_time + timedelta(minutes=10):
+                    print(f"   -> Game Final for 10+ mins. Carried over saved stats.")
+                    return local_game_id, old_live_data[local_game_id], False # <-- Doesn't count as active!
+            except: pass
+
+    # ⏱️ Not this game's turn yet (halftime, between quarters...). Keep last cycle's data.
+    if not is_due and local_game_id in old_live_data:
+        return local_game_id, old_live_data[local_game_id], True
+
+    # --- FETCH BOXSCORE AND PLAY-BY-PLAY (FROM SUMMARY) ---
+    summary_url = f"{ESPN_API_BASE}/summary?event={game_id}"
+    try:
+        sum_res = http_client.get(summary_url, timeout=10)
+        box_data = sum_res.json()
+    except: return local_game_id, None, True
+
+    game_live_obj = {
+        "status": status_state,
+        "clock": clock_text,
+        "away_score": away_score, 
+        "home_score": home_score, 
+        "team_stats": {},
+        "players": {home_abbr: {}, away_abbr: {}}
+    }
+    
+    # Stamp the time the game ended so our 10-minute timer can start
+    if status_state == 'post':
+        if local_game_id in old_live_data and 'game_ended_time' in old_live_data[local_game_id]:
+            game_live_obj['game_ended_time'] = old_live_data[local_game_id]['game_ended_time']
+        else:
+            game_live_obj['game_ended_time'] = now_est.isoformat()
+    
+    # =========================================================
+    # BUILD NATIVE ESPN ROSTERS & STARTERS
+    # =========================================================
+    rosters = {home_abbr: [], away_abbr: []}
+    home_starters = set()
+    away_starters = set()
+    
+    # DFS Fallback
+    game_data = None
+    for g in base_json.get('games', []):
+        if g.get('teams') and len(g['teams']) >= 2:
+            t1, t2 = normalize_team(g['teams'][0]), normalize_team(g['teams'][1])
+            if (t1 == home_abbr or t1 == away_abbr) and (t2 == home_abbr or t2 == away_abbr):
+                game_data = g
+                break
+    
+    if game_data:
+        for s in game_data.get('homeStarters', []) + game_data.get('homeBench', []):
+            rosters[home_abbr].append(s.get('athlete', {}).get('displayName', ''))
+        for s in game_data.get('awayStarters', []) + game_data.get('awayBench', []):
+            rosters[away_abbr].append(s.get('athlete', {}).get('displayName', ''))
+
+    # ESPN Native Boxscore
+    if 'boxscore' in box_data and 'players' in box_data['boxscore']:
+        for team_box in box_data['boxscore']['players']:
+            t_abbr = normalize_team(team_box['team']['abbreviation'])
+            if team_box.get('statistics'):
+                for ath in team_box['statistics'][0].get('athletes', []):
+                    p_name = ath['athlete']['displayName']
+                    if p_name not in rosters.get(t_abbr, []):
+                        rosters[t_abbr].append(p_name)
+                    
+                    if ath.get('starter', False):
+                        if t_abbr == home_abbr: home_starters.add(p_name)
+                        elif t_abbr == away_abbr: away_starters.add(p_name)
+    
+    # Fallback Seed
+    if not home_starters and len(rosters[home_abbr]) >= 5: home_starters = set(rosters[home_abbr][:5])
+    if not away_starters and len(rosters[away_abbr]) >= 5: away_starters = set(rosters[away_abbr][:5])
+    
+    plays = box_data.get('plays', [])
+    
+    # =========================================================
+    # INCREMENTAL PLAY-BY-PLAY ENGINE (state persists between cycles)
+    # =========================================================
+    old_game_data = old_live_data.get(local_game_id, {})
+    old_pbp = old_game_data.get("play_by_play", {})
+    last_seq = float(old_pbp.get("last_seq", 0))
+    
+    state = advance_game_state(ENGINE_STATE.get(local_game_id), plays, rosters, home_abbr, away_abbr, home_starters, away_starters)
+    ENGINE_STATE[local_game_id] = state
+    
+    formatted_full = state["formatted"]
+    
+    # The plays themselves go to the game's append-only log (synced in main). The snapshot only points at it.
+    game_live_obj["play_by_play"] = {
+        "log": pbp_log.log_pointer(current_date_str, local_game_id),
+        "count": len(formatted_full),
+        "last_seq": max(last_seq, formatted_full[-1]["seq"]) if formatted_full else last_seq
+    }
+    
+    # The repair passes below mutate these, so they work on copies of the persisted sub state
+    on_court_tracker = {t: set(court) for t, court in state["on_court"].items()}
+    unmatched_injections = {t: dict(un) for t, un in state["unmatched"].items()}
+
+    # THE BAND-AID PATCH and 👻 THE 6-MAN FIX: EVICT GHOST PLAYERS
+    # Both read the game's mention index, which only ever scans each play once per player.
+    for t_abbr in [home_abbr, away_abbr]:
+        patch_missing_players(t_abbr, on_court_tracker[t_abbr], rosters[t_abbr], state["mentions"])
+    for t_abbr in [home_abbr, away_abbr]:
+        evict_ghosts(t_abbr, on_court_tracker[t_abbr], state["mentions"])
+
+    # =========================================================
+    # BUILD BOXSCORE JSON WITH NEW ON-COURT FLAGS & SAFE KEYS
+    # =========================================================
+    if 'boxscore' in box_data and 'players' in box_data['boxscore']:
+        for team_box in box_data['boxscore']['players']:
+            t_abbr = normalize_team(team_box['team']['abbreviation'])
+            if not team_box.get('statistics'): continue
+            
+            stat_labels = team_box['statistics'][0]['names']
+            team_athletes = [ath for ath in team_box['statistics'][0]['athletes'] if ath.get('stats')]
+            team_stats_rows = [dict(zip(stat_labels, ath['stats'])) for ath in team_athletes]
             
-        matching_last_names = []
-        for full_name in roster_names:
-            clean_full = full_name.replace('.', '').strip().lower()
-            full_parts = clean_full.split()
-            compare_last = full_parts[-2] if full_parts[-1] in ['jr', 'sr', 'ii', 'iii', 'iv'] and len(full_parts) > 1 else full_parts[-1]
+            # Scored from the SCORING_SYSTEMS table, memoized per stat line (see fantasy_scoring.py)
+            team_scores = score_rows(team_stats_rows)
             
-            if compare_last == pbp_last:
-                matching_last_names.append(full_name)
+            for ath, mapped_stats, fd_pts, dk_pts in zip(team_athletes, team_stats_rows, team_scores['fd'], team_scores['dk']):
+                p_name = ath['athlete']['displayName']
+                safe_p_name = safe_key(p_name) # <--- SAFE KEY HERE
                 
-        if len(matching_last_names) == 1:
-            return matching_last_names[0]
+                try: current_mins = int(mapped_stats.get('MIN', 0))
+                except: current_mins = 0
+                
+                is_on_court = p_name in on_court_tracker[t_abbr]
+                
+                game_live_obj["players"][t_abbr][safe_p_name] = { 
+                    "MIN": current_mins,
+                    "PTS": mapped_stats.get("PTS", "0"),
+                    "REB": mapped_stats.get("REB", "0"),
+                    "AST": mapped_stats.get("AST", "0"),
+                    "STL": mapped_stats.get("STL", "0"),
+                    "BLK": mapped_stats.get("BLK", "0"),
+                    "TO": mapped_stats.get("TO", "0"),
+                    "FG": mapped_stats.get("FG", "0-0"),
+                    "3PT": mapped_stats.get("3PT", "0-0"),
+                    "FT": mapped_stats.get("FT", "0-0"),
+                    "fd_pts": fd_pts,
+                    "dk_pts": dk_pts,
+                    "is_on_court": is_on_court
+                }
 
-    return None
+    # INJECT MISSING/UNMATCHED PLAYERS FOR THE UI (SAFE KEYS)
+    # Name order, not set order: a restored engine writes the same bytes as one that never stopped
+    for t_abbr, court_set in on_court_tracker.items():
+        for p_name in sorted(court_set):
+            safe_p_name = safe_key(p_name) 
+            if safe_p_name not in game_live_obj["players"][t_abbr]:
+                game_live_obj["players"][t_abbr][safe_p_name] = {
+                    "MIN": 0, "PTS": "0", "REB": "0", "AST": "0", "STL": "0", "BLK": "0", "TO": "0",
+                    "FG": "0-0", "3PT": "0-0", "FT": "0-0",
+                    "fd_pts": 0.0, "dk_pts": 0.0,
+                    "is_on_court": True
+                }
+    
+    for t_abbr, un_dict in unmatched_injections.items():
+        for p_name, is_court in un_dict.items():
+            safe_p_name = safe_key(p_name)
+            if safe_p_name not in game_live_obj["players"][t_abbr]:
+                game_live_obj["players"][t_abbr][safe_p_name] = {
+                    "MIN": 0, "PTS": "0", "REB": "0", "AST": "0", "STL": "0", "BLK": "0", "TO": "0",
+                    "FG": "0-0", "3PT": "0-0", "FT": "0-0",
+                    "fd_pts": 0.0, "dk_pts": 0.0,
+                    "is_on_court": is_court
+                }
+
+    # Grab Team Stats
+    if 'boxscore' in box_data and 'teams' in box_data['boxscore']:
+        for team_box in box_data['boxscore']['teams']:
+            t_abbr = normalize_team(team_box['team']['abbreviation'])
+            if not team_box.get('statistics'): continue
+            
+            team_stats_dict = {}
+            for stat_obj in team_box['statistics']:
+                stat_key = stat_obj.get('abbreviation', stat_obj.get('name', ''))
+                stat_val = stat_obj.get('displayValue', '')
+                if stat_key:
+                    team_stats_dict[stat_key] = stat_val
+                    
+            game_live_obj["team_stats"][t_abbr] = team_stats_dict
+
+    # Stamped last, over the finished object: change detection is a hash compare from here on
+    game_live_obj["fingerprint"] = game_fingerprint(game_live_obj)
+
+    return local_game_id, game_live_obj, True # Actively playing or finished less than 10 minutes ago
+
+def safe_process_live_event(*args):
+    """One bad game must not sink the whole cycle"""
+    try:
+        return process_live_event(*args)
+    except Exception as e:
+        print(f"⚠️ Failed to process live game: {e}")
+        return None, None, False
 
-def main():
-    global ARCHIVED_DATES
+def wipe_firebase_live_games():
+    """The Baton Pass: the static archive takes over from Firebase (runs on the handoff thread)"""
+    global FIREBASE_MIRROR, MIRROR_FINGERPRINTS
+    if firebase_ready():
+        try:
+            db.reference('live_games').delete()
+            FIREBASE_MIRROR = {}
+            MIRROR_FINGERPRINTS = {}
+            print("🧹 Firebase live_games wiped clean. Baton successfully passed!", flush=True)
+        except Exception as e:
+            print(f"⚠️ Error wiping Firebase: {e}", flush=True)
+
+def main(now_est=None, rollover_hours=ROLLOVER_HOURS, one_shot=False):
+    """
+    One engine cycle. now_est can be pinned (replay benchmarks); it defaults to the real clock.
+    one_shot runs only update the files: no Firebase push and no end-of-night handoff.
+    """
+    global ARCHIVED_DATES, FIREBASE_MIRROR, MIRROR_FINGERPRINTS
     ny_tz = zoneinfo.ZoneInfo("America/New_York")
-    now_est = datetime.now(ny_tz)
+    now_est = now_est or datetime.now(ny_tz)
+    
+    cycle_start = time.perf_counter()
+    CYCLE_STATS.clear()
     
     # 🌙 MIDNIGHT ROLLOVER FIX
-    nba_day = now_est - timedelta(hours=4)
+    nba_day = now_est - timedelta(hours=rollover_hours)
     
     current_date_str = nba_day.strftime("%Y-%m-%d")
     espn_date_str = nba_day.strftime("%Y%m%d")
     
+    # First cycle of a date in this process: pick up where the last run left off
+    if current_date_str not in RESTORED_DATES:
+        RESTORED_DATES.add(current_date_str)
+        restore_engine_snapshot(current_date_str)
+    
     base_file_path = os.path.join(DATA_DIR, f"{current_date_str}.json")
     live_file_path = os.path.join(LIVE_DIR, f"live_{current_date_str}.json")
     
     # 1. Fetch live ESPN Scoreboard
-    scoreboard_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={espn_date_str}"
+    scoreboard_url = f"{ESPN_API_BASE}/scoreboard?dates={espn_date_str}"
     try:
-        sb_res = requests.get(scoreboard_url, timeout=10)
+        sb_res = http_client.get(scoreboard_url, timeout=10)
         scoreboard_data = sb_res.json()
     except Exception as e:
         print(f"Failed to fetch ESPN scoreboard: {e}")
-        return False
+        return None
+    CYCLE_STATS['scoreboard_s'] = time.perf_counter() - cycle_start
 
     # 2. Load Base JSON (for Fallback Rosters)
     base_json = {}
@@ -225,368 +773,64 @@ def main():
     new_live_data = {}
     active_games_found = 0
 
-    for event in scoreboard_data.get('events', []):
-        status_state = event['status']['type']['state']
+    poll_clock = now_est.timestamp()
+    events = scoreboard_data.get('events', [])
+    POLL_SCHEDULER.retain(e['id'] for e in events)
+
+    # Every in-progress game is fetched and processed at the same time, so the cycle
+    # takes as long as the SLOWEST game instead of the sum of all of them.
+    live_events = [e for e in events if e['status']['type']['state'] in ['in', 'post']]
+    due_ids = {e['id'] for e in live_events if POLL_SCHEDULER.is_due(e['id'], poll_clock)}
+    cooled_down_ids = set()
+    stage_start = time.perf_counter()
+    if live_events:
+        with ThreadPoolExecutor(max_workers=min(LIVE_FETCH_WORKERS, len(live_events))) as pool:
+            results = list(pool.map(
+                lambda ev: safe_process_live_event(ev, current_date_str, now_est, base_json, old_live_data, ev['id'] in due_ids),
+                live_events
+            ))
         
-        if status_state in ['in', 'post']:
-            game_id = event['id']
-            comp = event['competitions'][0]
-            
-            home_abbr = normalize_team(comp['competitors'][0]['team']['abbreviation'])
-            away_abbr = normalize_team(comp['competitors'][1]['team']['abbreviation'])
-            local_game_id = f"{away_abbr}-{home_abbr}-{current_date_str}"
-            
-            clock_text = event['status']['type']['shortDetail']
-            
-            away_score = comp['competitors'][1].get('score', '0')
-            home_score = comp['competitors'][0].get('score', '0')
-            
-            print(f"Processing Live Game: {away_abbr} {away_score} @ {home_score} {home_abbr} ({clock_text})")
-            
-            # 🛑 THE 10-MINUTE COOLDOWN: Catch late stat corrections, then go to sleep!
-            if status_state == 'post':
-                if local_game_id in old_live_data and 'game_ended_time' in old_live_data[local_game_id]:
-                    ended_time_str = old_live_data[local_game_id]['game_ended_time']
-                    try:
-                        ended_time = datetime.fromisoformat(ended_time_str)
-                        if now_est > ended_time + timedelta(minutes=10):
-                            new_live_data[local_game_id] = old_live_data[local_game_id]
-                            print(f"   -> Game Final for 10+ mins. Carried over saved stats.")
-                            continue # <-- This safely skips the active_games_found increment below!
-                    except: pass
-
-            # Only increments for games actively playing or finished less than 10 minutes ago
-            active_games_found += 1
-            
-            # --- FETCH BOXSCORE AND PLAY-BY-PLAY (FROM SUMMARY) ---
-            summary_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary?event={game_id}"
-            try:
-                sum_res = requests.get(summary_url, timeout=10)
-                box_data = sum_res.json()
-            except: continue
-
-            game_live_obj = {
-                "status": status_state,
-                "clock": clock_text,
-                "away_score": away_score, 
-                "home_score": home_score, 
-                "team_stats": {},
-                "players": {home_abbr: {}, away_abbr: {}}
-            }
-            
-            # Stamp the time the game ended so our 10-minute timer can start
-            if status_state == 'post':
-                if local_game_id in old_live_data and 'game_ended_time' in old_live_data[local_game_id]:
-                    game_live_obj['game_ended_time'] = old_live_data[local_game_id]['game_ended_time']
-                else:
-                    game_live_obj['game_ended_time'] = now_est.isoformat()
-            
-            # =========================================================
-            # BUILD NATIVE ESPN ROSTERS & STARTERS
-            # =========================================================
-            rosters = {home_abbr: [], away_abbr: []}
-            home_starters = set()
-            away_starters = set()
-            
-            # DFS Fallback
-            game_data = None
-            for g in base_json.get('games', []):
-                if g.get('teams') and len(g['teams']) >= 2:
-                    t1, t2 = normalize_team(g['teams'][0]), normalize_team(g['teams'][1])
-                    if (t1 == home_abbr or t1 == away_abbr) and (t2 == home_abbr or t2 == away_abbr):
-                        game_data = g
-                        break
-            
-            if game_data:
-                for s in game_data.get('homeStarters', []) + game_data.get('homeBench', []):
-                    rosters[home_abbr].append(s.get('athlete', {}).get('displayName', ''))
-                for s in game_data.get('awayStarters', []) + game_data.get('awayBench', []):
-                    rosters[away_abbr].append(s.get('athlete', {}).get('displayName', ''))
-
-            # ESPN Native Boxscore
-            if 'boxscore' in box_data and 'players' in box_data['boxscore']:
-                for team_box in box_data['boxscore']['players']:
-                    t_abbr = normalize_team(team_box['team']['abbreviation'])
-                    if team_box.get('statistics'):
-                        for ath in team_box['statistics'][0].get('athletes', []):
-                            p_name = ath['athlete']['displayName']
-                            if p_name not in rosters.get(t_abbr, []):
-                                rosters[t_abbr].append(p_name)
-                            
-                            if ath.get('starter', False):
-                                if t_abbr == home_abbr: home_starters.add(p_name)
-                                elif t_abbr == away_abbr: away_starters.add(p_name)
-            
-            # Fallback Seed
-            if not home_starters and len(rosters[home_abbr]) >= 5: home_starters = set(rosters[home_abbr][:5])
-            if not away_starters and len(rosters[away_abbr]) >= 5: away_starters = set(rosters[away_abbr][:5])
-            
-            on_court_tracker = { home_abbr: home_starters, away_abbr: away_starters }
-            unmatched_injections = { home_abbr: {}, away_abbr: {} }
-
-            plays = box_data.get('plays', [])
-            plays = sorted(plays, key=lambda x: float(x.get('sequenceNumber', 0)))
-            
-            # =========================================================
-            # SMART PLAY-BY-PLAY DIFFING ENGINE
-            # =========================================================
-            old_game_data = old_live_data.get(local_game_id, {})
-            old_pbp = old_game_data.get("play_by_play", {})
-            last_seq = float(old_pbp.get("last_seq", 0))
-
-            formatted_full = []
-            formatted_new = []
-            max_seq = last_seq
-
-            for p in plays:
-                seq = float(p.get('sequenceNumber', 0))
-                clock_data = p.get('clock') or {}
-                clock = clock_data.get('displayValue', '') if isinstance(clock_data, dict) else ''
-                period_data = p.get('period') or {}
-                period = period_data.get('number', '') if isinstance(period_data, dict) else ''
-                text = p.get('text', '')
-                
-                # Format OT nicely based on Period number!
-                if str(period).isdigit():
-                    period_num = int(period)
-                    if period_num == 5:
-                        time_str = f"OT {clock}".strip()
-                    elif period_num > 5:
-                        time_str = f"{period_num - 4}OT {clock}".strip()
-                    else:
-                        time_str = f"Q{period_num} {clock}".strip()
-                else:
-                    time_str = clock
-                
-                play_obj = {
-                    "seq": seq,
-                    "period": period,
-                    "time": time_str,
-                    "text": text
-                }
-                
-                formatted_full.append(play_obj)
-                
-                # Check if this play happened AFTER our last scrape!
-                if seq > last_seq:
-                    formatted_new.append(play_obj)
-                    if seq > max_seq:
-                        max_seq = seq
-
-            game_live_obj["play_by_play"] = {
-                "full_log": formatted_full[::-1], # Reversed so index 0 is the newest play
-                "new_plays": formatted_new[::-1],
-                "last_seq": max_seq
-            }
-            
-            # =========================================================
-            # PROCESS SUBSTITUTIONS
-            # =========================================================
-            for play in plays:
-                text = play.get('text', '')
-                if ' enters the game for ' in text:
-                    parts = text.split(' enters the game for ')
-                    if len(parts) == 2:
-                        p_in_raw = parts[0].strip()
-                        p_out_raw = parts[1].strip()
-                        
-                        if not p_in_raw or not p_out_raw: continue
-                        
-                        team_in, full_in = None, None
-                        team_out, full_out = None, None
-                        
-                        for t_abbr in [home_abbr, away_abbr]:
-                            if not team_in:
-                                m_in = resolve_espn_name(p_in_raw, rosters[t_abbr])
-                                if m_in: team_in, full_in = t_abbr, m_in
-                            if not team_out:
-                                m_out = resolve_espn_name(p_out_raw, rosters[t_abbr])
-                                if m_out: team_out, full_out = t_abbr, m_out
-                                
-                        target_team = team_in or team_out
-                        if target_team:
-                            if not full_in:
-                                in_val = f"{p_in_raw} (didn't match)"
-                                unmatched_injections[target_team][in_val] = True
-                            else:
-                                in_val = full_in
-
-                            if not full_out:
-                                out_val = f"{p_out_raw} (didn't match)"
-                                unmatched_injections[target_team][out_val] = False
-                            else:
-                                out_val = full_out
-                                
-                            if out_val in on_court_tracker[target_team]:
-                                on_court_tracker[target_team].remove(out_val)
-                            elif not full_out:
-                                out_parts = p_out_raw.split()
-                                if out_parts:
-                                    for p in list(on_court_tracker[target_team]):
-                                        if out_parts[-1].lower() in p.lower():
-                                            on_court_tracker[target_team].remove(p)
-                                            break
-                                        
-                            on_court_tracker[target_team].add(in_val)
-
-            # THE BAND-AID PATCH
-            for t_abbr in [home_abbr, away_abbr]:
-                if len(on_court_tracker[t_abbr]) < 5:
-                    for play in reversed(plays):
-                        text = play.get('text', '')
-                        if ' enters the game for ' in text: break 
-                        
-                        text_lower = text.lower()
-                        for roster_player in rosters[t_abbr]:
-                            if roster_player in on_court_tracker[t_abbr]: continue
-                                
-                            rp_lower = roster_player.lower()
-                            is_match = False
-                            if rp_lower in text_lower:
-                                is_match = True
-                            else:
-                                parts = rp_lower.split()
-                                last_name = parts[-2] if parts[-1] in ['jr.', 'sr.', 'ii', 'iii', 'iv', 'jr', 'sr'] and len(parts) > 1 else parts[-1]
-                                if last_name in text_lower:
-                                    same_last = sum(1 for p in rosters[t_abbr] if (p.lower().split()[-2] if p.lower().split()[-1] in ['jr.', 'sr.', 'ii', 'iii', 'iv', 'jr', 'sr'] and len(p.split())>1 else p.lower().split()[-1]) == last_name)
-                                    if same_last == 1: is_match = True
-                            
-                            if is_match:
-                                on_court_tracker[t_abbr].add(roster_player)
-                                print(f"🩹 PATCH APPLIED: Found {roster_player} active, injected to {t_abbr} court.")
-                                if len(on_court_tracker[t_abbr]) == 5: break
-                        if len(on_court_tracker[t_abbr]) == 5: break
-
-            # =========================================================
-            # 👻 THE 6-MAN FIX: EVICT GHOST PLAYERS
-            # =========================================================
-            for t_abbr in [home_abbr, away_abbr]:
-                while len(on_court_tracker[t_abbr]) > 5:
-                    evicted = False
-                    
-                    # Pass 1: Quick Search Backwards (Did we miss a sub-out due to a typo?)
-                    for play in reversed(plays):
-                        text = play.get('text', '')
-                        if ' enters the game for ' in text:
-                            p_out_raw = text.split(' enters the game for ')[1].strip().lower()
-                            
-                            for p in list(on_court_tracker[t_abbr]):
-                                p_last = p.split()[-2].lower() if p.split()[-1].lower() in ['jr.', 'sr.', 'ii', 'iii', 'iv', 'jr', 'sr'] and len(p.split()) > 1 else p.split()[-1].lower()
-                                if p_last in p_out_raw or p.lower() in p_out_raw:
-                                    on_court_tracker[t_abbr].remove(p)
-                                    print(f"👻 GHOST EVICTED (Missed Sub): Removed {p} from {t_abbr} court.")
-                                    evicted = True
-                                    break
-                        if evicted: break
-                        
-                    if len(on_court_tracker[t_abbr]) <= 5: continue
-                    
-                    # Pass 2: The Elimination Game (Boot the Coldest Player)
-                    if not evicted:
-                        candidates = list(on_court_tracker[t_abbr])
-                        for play in reversed(plays):
-                            text = play.get('text', '').lower()
-                            if ' enters the game for ' in text: continue # Skip sub logs for this check
-                            
-                            active_in_play = []
-                            for p in candidates:
-                                p_last = p.split()[-2].lower() if p.split()[-1].lower() in ['jr.', 'sr.', 'ii', 'iii', 'iv', 'jr', 'sr'] and len(p.split()) > 1 else p.split()[-1].lower()
-                                if p.lower() in text or p_last in text:
-                                    active_in_play.append(p)
-                                    
-                            if len(candidates) - len(active_in_play) < (len(on_court_tracker[t_abbr]) - 5):
-                                break 
-                                
-                            for p in active_in_play:
-                                candidates.remove(p)
-                                
-                            if len(candidates) == (len(on_court_tracker[t_abbr]) - 5):
-                                break
-                                
-                        evict_count = len(on_court_tracker[t_abbr]) - 5
-                        for p in candidates[:evict_count]:
-                            on_court_tracker[t_abbr].remove(p)
-                            print(f"🥶 GHOST EVICTED (Coldest Player): Removed {p} from {t_abbr} court.")
-
-            # =========================================================
-            # BUILD BOXSCORE JSON WITH NEW ON-COURT FLAGS & SAFE KEYS
-            # =========================================================
-            if 'boxscore' in box_data and 'players' in box_data['boxscore']:
-                for team_box in box_data['boxscore']['players']:
-                    t_abbr = normalize_team(team_box['team']['abbreviation'])
-                    if not team_box.get('statistics'): continue
-                    
-                    stat_labels = team_box['statistics'][0]['names']
-                    team_athletes = team_box['statistics'][0]['athletes']
-                    
-                    for ath in team_athletes:
-                        if not ath.get('stats'): continue
-                        p_name = ath['athlete']['displayName']
-                        safe_p_name = safe_key(p_name) # <--- SAFE KEY HERE
-                        
-                        mapped_stats = dict(zip(stat_labels, ath['stats']))
-                        
-                        try: current_mins = int(mapped_stats.get('MIN', 0))
-                        except: current_mins = 0
-                        
-                        is_on_court = p_name in on_court_tracker[t_abbr]
-                        fd_pts, dk_pts = calculate_fpts(mapped_stats)
-                        
-                        game_live_obj["players"][t_abbr][safe_p_name] = { 
-                            "MIN": current_mins,
-                            "PTS": mapped_stats.get("PTS", "0"),
-                            "REB": mapped_stats.get("REB", "0"),
-                            "AST": mapped_stats.get("AST", "0"),
-                            "STL": mapped_stats.get("STL", "0"),
-                            "BLK": mapped_stats.get("BLK", "0"),
-                            "TO": mapped_stats.get("TO", "0"),
-                            "FG": mapped_stats.get("FG", "0-0"),
-                            "3PT": mapped_stats.get("3PT", "0-0"),
-                            "FT": mapped_stats.get("FT", "0-0"),
-                            "fd_pts": fd_pts,
-                            "dk_pts": dk_pts,
-                            "is_on_court": is_on_court
-                        }
-
-            # INJECT MISSING/UNMATCHED PLAYERS FOR THE UI (SAFE KEYS)
-            for t_abbr, court_set in on_court_tracker.items():
-                for p_name in court_set:
-                    safe_p_name = safe_key(p_name) 
-                    if safe_p_name not in game_live_obj["players"][t_abbr]:
-                        game_live_obj["players"][t_abbr][safe_p_name] = {
-                            "MIN": 0, "PTS": "0", "REB": "0", "AST": "0", "STL": "0", "BLK": "0", "TO": "0",
-                            "FG": "0-0", "3PT": "0-0", "FT": "0-0",
-                            "fd_pts": 0.0, "dk_pts": 0.0,
-                            "is_on_court": True
-                        }
-            
-            for t_abbr, un_dict in unmatched_injections.items():
-                for p_name, is_court in un_dict.items():
-                    safe_p_name = safe_key(p_name)
-                    if safe_p_name not in game_live_obj["players"][t_abbr]:
-                        game_live_obj["players"][t_abbr][safe_p_name] = {
-                            "MIN": 0, "PTS": "0", "REB": "0", "AST": "0", "STL": "0", "BLK": "0", "TO": "0",
-                            "FG": "0-0", "3PT": "0-0", "FT": "0-0",
-                            "fd_pts": 0.0, "dk_pts": 0.0,
-                            "is_on_court": is_court
-                        }
-
-            # Grab Team Stats
-            if 'boxscore' in box_data and 'teams' in box_data['boxscore']:
-                for team_box in box_data['boxscore']['teams']:
-                    t_abbr = normalize_team(team_box['team']['abbreviation'])
-                    if not team_box.get('statistics'): continue
-                    
-                    team_stats_dict = {}
-                    for stat_obj in team_box['statistics']:
-                        stat_key = stat_obj.get('abbreviation', stat_obj.get('name', ''))
-                        stat_val = stat_obj.get('displayValue', '')
-                        if stat_key:
-                            team_stats_dict[stat_key] = stat_val
-                            
-                    game_live_obj["team_stats"][t_abbr] = team_stats_dict
-
-            new_live_data[local_game_id] = game_live_obj
+        # Merged in scoreboard order, so the live file's game order stays stable
+        for event, (local_game_id, game_live_obj, counts_as_active) in zip(live_events, results):
+            if counts_as_active:
+                active_games_found += 1
+            if game_live_obj is not None:
+                new_live_data[local_game_id] = game_live_obj
+
+            if local_game_id is not None and not counts_as_active:
+                # Past the 10-minute cooldown: never needs another summary fetch
+                cooled_down_ids.add(local_game_id)
+                POLL_SCHEDULER.retire(event['id'])
+            elif event['id'] in due_ids:
+                POLL_SCHEDULER.mark_polled(event, poll_clock)
+
+    # Unstarted games are due right at their scheduled tip-off
+    for event in events:
+        if event['status']['type']['state'] == 'pre':
+            POLL_SCHEDULER.mark_polled(event, poll_clock)
+
+    # Forget engine state for games that dropped off the board or were carried over after their cooldown
+    for stale_id in list(ENGINE_STATE):
+        if stale_id not in new_live_data or stale_id in cooled_down_ids:
+            del ENGINE_STATE[stale_id]
+
+    CYCLE_STATS['games_s'] = time.perf_counter() - stage_start
+    CYCLE_STATS['games_fetched'] = len(due_ids)
+
+    # Append this cycle's new plays to each game's log BEFORE the snapshot points past them
+    stage_start = time.perf_counter()
+    pbp_index = pbp_log.load_index(current_date_str)
+    log_bytes = 0
+    for game_id in new_live_data:
+        if game_id in ENGINE_STATE:
+            log_bytes += pbp_log.sync_game(current_date_str, game_id, ENGINE_STATE[game_id]["formatted"], pbp_index)
+    if log_bytes:
+        pbp_log.save_index(current_date_str, pbp_index)
+        print(f"📝 Appended {data_writer.format_bytes(log_bytes)} of plays to the play-by-play logs.")
+    # The snapshot only ever points at plays the logs above already hold
+    CYCLE_STATS['bytes_snapshot'] = save_engine_snapshot(current_date_str, new_live_data)
+    CYCLE_STATS['pbp_log_s'] = time.perf_counter() - stage_start
+    CYCLE_STATS['bytes_logged'] = log_bytes
 
     # =========================================================
     # THE DOUBLE-WRITE: SAVE TO FILE AND PUSH TO FIREBASE
@@ -594,39 +838,83 @@ def main():
     has_live_games = False
 
     # 1. ALWAYS SAVE TO FILE IF DATA HAS CHANGED (Ensures final post-game states are saved locally)
-    if new_live_data and new_live_data != old_live_data:
-        with open(live_file_path, 'w') as f:
-            json.dump(new_live_data, f, indent=2)
-        print(f"\n✅ Successfully updated {live_file_path} with {len(new_live_data)} games.")
-
-    if active_games_found > 0:
-        # 2. The Real-Time Stream (Firebase Push - DELTA UPDATES ONLY)
-        if firebase_admin._apps:
-            try:
-                delta_payload = {}
-                
-                # A. Find games that updated
-                for fix_id, game_data in new_live_data.items():
-                    if fix_id not in old_live_data or old_live_data[fix_id] != game_data:
-                        # Clean keys before pushing to Firebase
-                        safe_game_data = inspect_and_sanitize(game_data) 
-                        delta_payload[fix_id] = safe_game_data
+    stage_start = time.perf_counter()
+    written = 0
+    if new_live_data and live_data_changed(new_live_data, old_live_data):
+        written = data_writer.write_json(live_file_path, new_live_data)
+        print(f"\n✅ Successfully updated {live_file_path} with {len(new_live_data)} games ({data_writer.format_bytes(written)}).")
+    CYCLE_STATS['file_write_s'] = time.perf_counter() - stage_start
+    CYCLE_STATS['bytes_written'] = written
+    CYCLE_STATS['bytes_pushed'] = 0
+
+    if one_shot:
+        # The Action run only refreshes the files; the daemon owns Firebase and the handoff
+        if active_games_found == 0:
+            print("\n💤 No active games right now. Script exiting cleanly.")
+    elif active_games_found > 0:
+        # A late or rescheduled game is live again: don't hand off (or wipe) under it
+        handoff = ARCHIVE_HANDOFFS.get(current_date_str)
+        if handoff and handoff.running:
+            handoff.cancel()
+            # An unverified date was marked handled; the master gate has to start a fresh handoff later
+            ARCHIVED_DATES.discard(current_date_str)
+
+        # 2. The Real-Time Stream (Firebase Push - LEAF-LEVEL DELTAS ONLY)
+        stage_start = time.perf_counter()
+        if firebase_ready() or FIREBASE_DRY_RUN:
+            # Never interleaves with the end-of-night wipe running on the handoff thread
+            with FIREBASE_LOCK:
+                try:
+                    new_views = {}
+                    new_fingerprints = {}
+                    for fix_id, game_data in new_live_data.items():
+                        mirrored = (FIREBASE_MIRROR or {}).get(fix_id)
+                        new_fingerprints[fix_id] = stored_fingerprint(game_data)
+                        if mirrored is not None and MIRROR_FINGERPRINTS.get(fix_id) == new_fingerprints[fix_id]:
+                            new_views[fix_id] = mirrored  # Same fingerprint: nothing to rebuild or diff
+                        else:
+                            new_views[fix_id] = firebase_view(fix_id, game_data, firebase_play_log(current_date_str, fix_id))
+                    forget_firebase_keys(new_live_data)
+                    delta_payload = {}
                 
-                # B. Find games that finished the cooldown and need to be wiped
-                for fix_id in old_live_data:
-                    if fix_id not in new_live_data:
-                        delta_payload[fix_id] = None  # None tells .update() to delete the specific node
+                    if FIREBASE_MIRROR is None:
+                        # A. First push since startup: we don't know what Firebase holds, so send games whole
+                        delta_payload = dict(new_views)
+                        for fix_id in old_live_data:
+                            if fix_id not in new_views:
+                                delta_payload[fix_id] = None
+                    else:
+                        # B. Only the changed stat fields, score/clock and newly appended plays
+                        for fix_id, view in new_views.items():
+                            if view is FIREBASE_MIRROR.get(fix_id):
+                                continue
+                            leaf_delta(FIREBASE_MIRROR.get(fix_id), view, fix_id, delta_payload)
+                    
+                        # C. Games that finished the cooldown get wiped
+                        for fix_id in FIREBASE_MIRROR:
+                            if fix_id not in new_views:
+                                delta_payload[fix_id] = None  # None tells .update() to delete the specific node
                         
-                # C. Only push if something actually changed
-                if delta_payload:
-                    ref = db.reference('live_games')
-                    ref.update(delta_payload)
-                    print(f"🚀 Pushed deltas for {len(delta_payload)} active NBA games to Firebase!")
-                else:
-                    print("💤 No NBA stats changed this cycle. Skipping Firebase push.")
+                    # D. Only push if something actually changed
+                    if delta_payload:
+                        if not FIREBASE_DRY_RUN:
+                            ref = db.reference('live_games')
+                            ref.update(delta_payload)
+                        payload_size = len(data_writer.serialize(delta_payload))
+                        CYCLE_STATS['bytes_pushed'] = payload_size
+                        print(f"🚀 Pushed {len(delta_payload)} changed paths ({data_writer.format_bytes(payload_size)}) to Firebase!")
+                    else:
+                        print("💤 No NBA stats changed this cycle. Skipping Firebase push.")
+                
+                    FIREBASE_MIRROR = new_views
+                    MIRROR_FINGERPRINTS = new_fingerprints
                     
-            except Exception as e:
-                print(f"⚠️ Failed to push to Firebase: {e}")
+                except Exception as e:
+                    # We can't tell what landed, so the next push re-sends games whole
+                    FIREBASE_MIRROR = None
+                    print(f"⚠️ Failed to push to Firebase: {e}")
+
+        CYCLE_STATS['firebase_s'] = time.perf_counter() - stage_start
 
         # Check if any game is truly LIVE right now (not just in the post-game cooldown)
         has_live_games = any(g.get('status') == 'in' for g in new_live_data.values())
@@ -640,36 +928,46 @@ def main():
         # THE MASTER GATE: All games finished, and no more scheduled
         # =========================================================
         if unstarted_games == 0 and current_date_str not in ARCHIVED_DATES:
-            print("🏆 All games for the day are finished!")
+            handoff = ARCHIVE_HANDOFFS.get(current_date_str)
             
-            # 2. Ping GitHub Actions
-            ping_success = trigger_github_action(current_date_str)
-            
-            if ping_success:
-                # 3. THE SHIELD: Wait 5 minutes for GitHub to build the archive
-                print("⏳ Waiting 5 minutes for GitHub Action to build and save the final archive...")
-                time.sleep(300)
+            if handoff is None or (handoff.state in RETRY_STATES and not handoff.running):
+                if handoff is not None and handoff.state == 'failed':
+                    print("⚠️ Ping failed. Retrying now.")
+                print("🏆 All games for the day are finished!")
                 
-                # 4. WIPE FIREBASE (The Baton Pass)
-                if firebase_admin._apps:
-                    try:
-                        db.reference('live_games').delete()
-                        print("🧹 Firebase live_games wiped clean. Baton successfully passed!")
-                    except Exception as e:
-                        print(f"⚠️ Error wiping Firebase: {e}")
-                        
+                # 2-4. Ping GitHub Actions, verify the archived file, then WIPE FIREBASE (The Baton Pass)
+                # Runs on its own thread so this loop keeps polling in the meantime.
+                # The archive must hold every game on tonight's board, all final
+                ARCHIVE_HANDOFFS[current_date_str] = ArchiveHandoff(
+                    current_date_str, trigger_github_action, wipe_firebase_live_games, FIREBASE_LOCK,
+                    expected_ids=sorted(new_live_data)
+                ).start()
+            elif handoff.state == 'wiped':
+                ARCHIVED_DATES.add(current_date_str)
+            elif handoff.state == 'unverified':
+                # Logged once: the handoff thread keeps re-checking and still wipes if the archive lands
+                print(f"⚠️ Archive for {current_date_str} not verified yet. Firebase stays up while the handoff re-checks.")
                 ARCHIVED_DATES.add(current_date_str)
             else:
-                print("⚠️ Ping failed. Retrying on next loop.")
+                print(f"⏳ Archive handoff for {current_date_str} in progress ({handoff.state}).")
                 
         elif unstarted_games > 0:
             print(f"⏳ Waiting for {unstarted_games} unstarted game(s). Firebase stays alive.")
 
-    # Return True if we need to poll fast, False if we can rest (5 mins)
+    CYCLE_STATS['total_s'] = time.perf_counter() - cycle_start
+
+    # True while any game is truly live. The sleep itself comes from POLL_SCHEDULER.
     return has_live_games
 
+def run_once(rollover_hours=ONE_SHOT_ROLLOVER_HOURS):
+    """
+    A single cycle, then exit (the GitHub Action). Resumes from the engine snapshot, so
+    only plays newer than the last run are formatted and replayed.
+    """
+    print("🏀 Running one-shot NBA live update...")
+    main(rollover_hours=rollover_hours, one_shot=True)
 
-if __name__ == "__main__":
+def run_daemon():
     print("🏀 Starting NBA Live Real-Time Engine...")
     
     # The Persistent Loop Architecture
@@ -677,12 +975,18 @@ if __name__ == "__main__":
         try:
             needs_fast_poll = main()
             
+            if needs_fast_poll is None:
+                print(f"⚠️ Scoreboard unavailable. Retrying in {SCOREBOARD_RETRY_SECONDS} seconds...\n")
+                time.sleep(SCOREBOARD_RETRY_SECONDS)
+                continue
+
+            # Wake exactly when the next game is due (tip-off, crunch time poll, end of halftime...)
+            wait_seconds = POLL_SCHEDULER.seconds_until_next_poll()
             if needs_fast_poll:
-                print("⏱️ Fast poll active. Waiting 10 seconds...\n")
-                time.sleep(10)
+                print(f"⏱️ Live games on. Next game due in {wait_seconds:.0f} seconds...\n")
             else:
-                print("⏳ No live games. Resting for 5 minutes...\n")
-                time.sleep(300)
+                print(f"⏳ No live games. Next check in {wait_seconds:.0f} seconds...\n")
+            time.sleep(wait_seconds)
                 
         except KeyboardInterrupt:
             print("\n🛑 Live Engine manually stopped. Exiting.")
@@ -690,3 +994,11 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"\n❌ Master loop crashed: {e}. Restarting in 60s...")
             time.sleep(60)
+
+if __name__ == "__main__":
+    # python live_engine.py         -> the real-time daemon
+    # python live_engine.py --once  -> one cycle and exit (what live_update.py runs)
+    if '--once' in sys.argv[1:]:
+        run_once()
+    else:
+        run_daemon()
@@ -0,0 +1,134 @@
+from collections import Counter
+
+# ==========================================================
+# --- PLAY-BY-PLAY MENTION INDEX ---
+# ==========================================================
+# The on-court repair passes (BAND-AID PATCH and the 6-MAN FIX) need to know when a
+# player was last mentioned in the play-by-play. Instead of rescanning every play for
+# every player each cycle, plays are added to the index ONCE as they arrive, and each
+# player's "last play that mentions them" is cached and only extended over new plays.
+#
+# A mention keeps the exact rule the passes have always used: the lowercase full name,
+# or the suffix-aware lowercase last name, appears anywhere in the lowercase play text.
+
+NAME_SUFFIXES = ['jr.', 'sr.', 'ii', 'iii', 'iv', 'jr', 'sr']
+SUB_MARKER = ' enters the game for '
+
+def mention_keys(name):
+    """(full name, last name) in lowercase, skipping a trailing Jr./Sr./II/III/IV"""
+    lower = name.lower()
+    parts = lower.split()
+    if not parts: return lower, None
+    last = parts[-2] if parts[-1] in NAME_SUFFIXES and len(parts) > 1 else parts[-1]
+    return lower, last
+
+def _mentions(text, full, last, use_last=True):
+    return full in text or (use_last and last is not None and last in text)
+
+class MentionIndex:
+    """
+    Per-game, append-only. Play indexes line up with the game's (sorted) raw plays.
+    """
+    def __init__(self):
+        self.all_plays = []     # (play index, lowercase text) for every play
+        self.plain_plays = []   # Same, minus anything that reads like a substitution
+        self.sub_outs = []      # (play index, lowercase "subbed out" half) for substitutions
+        self.last_sub = -1      # Index of the latest substitution play
+        self._cache = {}        # (kind, name, use_last) -> [scanned up to, last matching play index]
+
+    def add_play(self, text):
+        text = text or ''
+        idx = len(self.all_plays)
+        lower = text.lower()
+        self.all_plays.append((idx, lower))
+        if SUB_MARKER not in lower:
+            self.plain_plays.append((idx, lower))
+        if SUB_MARKER in text:
+            self.sub_outs.append((idx, text.split(SUB_MARKER)[1].strip().lower()))
+            self.last_sub = idx
+
+    def _last_match(self, kind, entries, name, use_last=True):
+        key = (kind, name, use_last)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = [0, -1]
+
+        full, last = mention_keys(name)
+        for pos in range(cached[0], len(entries)):
+            idx, text = entries[pos]
+            if _mentions(text, full, last, use_last):
+                cached[1] = idx
+        cached[0] = len(entries)
+        return cached[1]
+
+    def last_mention(self, name, use_last=True):
+        """Latest play of any kind that mentions name (-1 if none)"""
+        return self._last_match('all', self.all_plays, name, use_last)
+
+    def last_plain_mention(self, name):
+        """Latest non-substitution play that mentions name (-1 if none)"""
+        return self._last_match('plain', self.plain_plays, name)
+
+    def last_sub_out(self, name):
+        """Latest substitution whose subbed-out half mentions name (-1 if none)"""
+        return self._last_match('sub_out', self.sub_outs, name)
+
+# ==========================================================
+# --- ON-COURT REPAIR PASSES ---
+# ==========================================================
+def patch_missing_players(team, on_court, roster, mentions):
+    """
+    THE BAND-AID PATCH: fewer than 5 on court, so inject roster players seen since the
+    last substitution, most recent play first (roster order within a play).
+    """
+    if len(on_court) >= 5: return
+
+    last_counts = Counter(mention_keys(p)[1] for p in roster)
+    seen = []
+    for order, roster_player in enumerate(roster):
+        if roster_player in on_court: continue
+        unique_last = last_counts[mention_keys(roster_player)[1]] == 1
+        idx = mentions.last_mention(roster_player, use_last=unique_last)
+        if idx > mentions.last_sub:
+            seen.append((-idx, order, roster_player))
+
+    for _, _, roster_player in sorted(seen):
+        if roster_player in on_court: continue
+        on_court.add(roster_player)
+        print(f"🩹 PATCH APPLIED: Found {roster_player} active, injected to {team} court.")
+        if len(on_court) == 5: break
+
+def evict_ghosts(team, on_court, mentions):
+    """THE 6-MAN FIX: more than 5 on court, so evict the ghosts"""
+    while len(on_court) > 5:
+        # Pass 1: Quick Search Backwards (Did we miss a sub-out due to a typo?)
+        best_idx, best_player = -1, None
+        for p in list(on_court):
+            idx = mentions.last_sub_out(p)
+            if idx > best_idx:
+                best_idx, best_player = idx, p
+
+        if best_player is not None:
+            on_court.remove(best_player)
+            print(f"👻 GHOST EVICTED (Missed Sub): Removed {best_player} from {team} court.")
+            continue
+
+        # Pass 2: The Elimination Game (Boot the Coldest Player)
+        # Walking back through the plays, whoever is mentioned is warm and drops out of the
+        # candidate list, until only as many candidates remain as need evicting.
+        candidates = list(on_court)
+        evict_count = len(on_court) - 5
+        last_seen = {p: mentions.last_plain_mention(p) for p in candidates}
+
+        for idx in sorted({i for i in last_seen.values() if i >= 0}, reverse=True):
+            active_in_play = [p for p in candidates if last_seen[p] == idx]
+            if len(candidates) - len(active_in_play) < evict_count:
+                break
+            for p in active_in_play:
+                candidates.remove(p)
+            if len(candidates) == evict_count:
+                break
+
+        for p in candidates[:evict_count]:
+            on_court.remove(p)
+            print(f"🥶 GHOST EVICTED (Coldest Player): Removed {p} from {team} court.")
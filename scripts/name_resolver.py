@@ -0,0 +1,68 @@
+# ==========================================================
+# --- PLAY-BY-PLAY NAME RESOLVER ---
+# ==========================================================
+# Maps ESPN's Play-by-Play short names (e.g., 'I. Joe') to ESPN's Boxscore full names
+# (e.g., 'Isaiah Joe'). The roster is normalized ONCE per game into lookup tables,
+# so each substitution resolves in O(1) instead of rescanning the roster three times.
+
+NAME_SUFFIXES = ['jr', 'sr', 'ii', 'iii', 'iv']
+
+def clean_name(name):
+    return name.replace('.', '').strip().lower()
+
+def compare_last_name(clean_full):
+    """Last name with a trailing Jr./Sr./II/III/IV skipped"""
+    full_parts = clean_full.split()
+    if not full_parts: return None
+    return full_parts[-2] if full_parts[-1] in NAME_SUFFIXES and len(full_parts) > 1 else full_parts[-1]
+
+class NameResolver:
+    """
+    Built once from a team's roster. Lookups follow the same three passes as always:
+      1. Exact normalized name (first roster entry wins)
+      2. Unique (first initial, last name) match
+      3. Unique last name match
+    """
+    def __init__(self, roster_names):
+        self.by_exact = {}
+        self.by_initial_last = {}
+        self.by_last = {}
+        self.memo = {}
+
+        for full_name in roster_names:
+            clean_full = clean_name(full_name)
+            self.by_exact.setdefault(clean_full, full_name)
+
+            compare_last = compare_last_name(clean_full)
+            if compare_last is None: continue
+            self.by_initial_last.setdefault((clean_full[0], compare_last), []).append(full_name)
+            self.by_last.setdefault(compare_last, []).append(full_name)
+
+    def resolve(self, pbp_name):
+        if pbp_name in self.memo:
+            return self.memo[pbp_name]
+
+        result = None
+        clean_pbp = clean_name(pbp_name)
+
+        if clean_pbp in self.by_exact:
+            result = self.by_exact[clean_pbp]
+        else:
+            parts = clean_pbp.split()
+            if len(parts) > 1:
+                pbp_first = parts[0]
+                pbp_last = parts[-1]
+
+                matching_initials = self.by_initial_last.get((pbp_first[0], pbp_last), [])
+                matching_last_names = self.by_last.get(pbp_last, [])
+                if len(matching_initials) == 1:
+                    result = matching_initials[0]
+                elif len(matching_last_names) == 1:
+                    result = matching_last_names[0]
+
+        self.memo[pbp_name] = result
+        return result
+
+def resolve_espn_name(pbp_name, roster_names):
+    """One-off lookup. Code that resolves many names should keep a NameResolver per team."""
+    return NameResolver(roster_names).resolve(pbp_name)
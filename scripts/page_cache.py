@@ -0,0 +1,116 @@
+import os
+import json
+import copy
+import time
+import hashlib
+import threading
+
+import http_client
+import data_writer
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, '..', '.cache')
+CACHE_FILE = os.path.join(CACHE_DIR, 'page_validators.json')
+
+# Entries not seen for this long are dropped (old DFF dates never come back)
+MAX_ENTRY_AGE_SECONDS = 3 * 86400
+
+# Bump whenever a parse function's output changes shape, so cached parses from the old code are thrown away
+PARSER_VERSION = 1
+
+# ==========================================================
+# --- CONDITIONAL GET + CONTENT-HASH CACHE ---
+# ==========================================================
+# Per URL we remember the ETag, Last-Modified, a hash of the body and the PARSED result.
+# A 304, or a 200 whose body hashes the same as last run, reuses the parsed result
+# instead of building a new soup. Entries are tagged with the parser that built them;
+# a different parse_fn (or PARSER_VERSION) ignores the entry and parses fresh.
+_entries = None
+_lock = threading.Lock()
+CACHE_STATS = {'not_modified': 0, 'unchanged': 0, 'parsed': 0}
+
+def _load():
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if os.path.exists(CACHE_FILE):
+            try:
+                with open(CACHE_FILE, 'r') as f:
+                    _entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Page cache unreadable, starting fresh: {e}")
+    return _entries
+
+def _save():
+    now = time.time()
+    fresh = {k: v for k, v in _entries.items() if now - v.get('stored_at', 0) <= MAX_ENTRY_AGE_SECONDS}
+    try:
+        data_writer.write_json(CACHE_FILE, fresh, sidecars=())
+    except Exception as e:
+        print(f"⚠️ Could not save page cache: {e}")
+
+def parser_id(parse_fn):
+    return f"{getattr(parse_fn, '__qualname__', repr(parse_fn))}@{PARSER_VERSION}"
+
+def fetch_parsed(url, parse_fn, headers=None, timeout=15):
+    """
+    GETs url with conditional headers and returns parse_fn(html), reusing the cached parse
+    when the page is unchanged. parse_fn must return JSON-serializable data.
+    Returns None when the page could not be fetched.
+    """
+    parser = parser_id(parse_fn)
+    with _lock:
+        entry = _load().get(url)
+    # Parsed by other code: neither the validators nor the parse can be trusted
+    if entry and entry.get('parser') != parser:
+        entry = None
+
+    req_headers = dict(headers or {})
+    if entry:
+        if entry.get('etag'): req_headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'): req_headers['If-Modified-Since'] = entry['last_modified']
+
+    res = http_client.get(url, headers=req_headers, timeout=timeout)
+
+    if res.status_code == 304 and entry:
+        with _lock:
+            CACHE_STATS['not_modified'] += 1
+            entry['stored_at'] = time.time()
+        return copy.deepcopy(entry['parsed'])
+
+    if res.status_code != 200:
+        print(f"⚠️ {url} returned {res.status_code}")
+        return None
+
+    body_hash = hashlib.sha256(res.content).hexdigest()
+    if entry and entry.get('body_hash') == body_hash:
+        with _lock:
+            CACHE_STATS['unchanged'] += 1
+            entry['stored_at'] = time.time()
+            entry['etag'] = res.headers.get('ETag', entry.get('etag'))
+            entry['last_modified'] = res.headers.get('Last-Modified', entry.get('last_modified'))
+        return copy.deepcopy(entry['parsed'])
+
+    parsed = parse_fn(res.text)
+    with _lock:
+        CACHE_STATS['parsed'] += 1
+        _load()[url] = {
+            'etag': res.headers.get('ETag'),
+            'last_modified': res.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+            'parser': parser,
+            'stored_at': time.time(),
+            # Callers mutate what they get back (e.g. news timestamps), so the cache keeps its own copy
+            'parsed': copy.deepcopy(parsed)
+        }
+    return parsed
+
+def flush():
+    """Writes the validator cache to disk. Call once at the end of a run."""
+    with _lock:
+        if _entries is None: return
+        _save()
+    print(f"📦 Page cache: {CACHE_STATS['not_modified']} not modified / {CACHE_STATS['unchanged']} unchanged / {CACHE_STATS['parsed']} parsed")
@@ -0,0 +1,106 @@
+import os
+import json
+
+import data_writer
+
+# ==========================================================
+# --- FOLDER SETUP ---
+# ==========================================================
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LIVE_DIR = os.path.join(SCRIPT_DIR, '..', 'data', 'LIVE')
+PBP_DIR = os.path.join(LIVE_DIR, 'pbp')
+
+# ==========================================================
+# --- APPEND-ONLY PLAY-BY-PLAY LOG ---
+# ==========================================================
+# Each game's plays live in data/LIVE/pbp/<date>/<game_id>.jsonl, one play per line,
+# oldest first. The live snapshot only keeps a pointer to it plus last_seq, so a cycle
+# writes the few new plays instead of re-serializing the whole game's history.
+#
+# data/LIVE/pbp/<date>/index.json holds, per game:
+#   count    -> plays in the log
+#   bytes    -> byte offset where the next play goes (a torn append past it is cut off)
+#   last_seq -> seq of the last logged play
+
+def log_pointer(date_str, game_id):
+    """Path of a game's log relative to data/LIVE/ (what the site fetches)"""
+    return f"pbp/{date_str}/{game_id}.jsonl"
+
+def _index_path(date_str):
+    return os.path.join(PBP_DIR, date_str, 'index.json')
+
+def load_index(date_str):
+    path = _index_path(date_str)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Play log index for {date_str} unreadable, rebuilding logs: {e}")
+        return {}
+
+def save_index(date_str, index):
+    data_writer.write_json(_index_path(date_str), index, sidecars=())
+
+def _encode(plays):
+    return b''.join(data_writer.serialize(p) + b'\n' for p in plays)
+
+def sync_game(date_str, game_id, plays, index):
+    """
+    Brings a game's log in line with plays (chronological formatted plays).
+    Appends only the plays past the logged count when the logged prefix still matches,
+    otherwise rewrites the log. Updates index in place and returns bytes written.
+    """
+    path = os.path.join(LIVE_DIR, log_pointer(date_str, game_id))
+    entry = index.get(game_id)
+
+    can_append = (
+        entry is not None
+        and entry['count'] <= len(plays)
+        and (entry['count'] == 0 or plays[entry['count'] - 1]['seq'] == entry['last_seq'])
+        and os.path.exists(path)
+        and os.path.getsize(path) >= entry['bytes']
+    )
+
+    if can_append:
+        new_plays = plays[entry['count']:]
+        if not new_plays and os.path.getsize(path) == entry['bytes']:
+            return 0
+        payload = _encode(new_plays)
+        with open(path, 'r+b') as f:
+            # Anything past the indexed offset is a half-written append from a crash
+            f.truncate(entry['bytes'])
+            f.seek(entry['bytes'])
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        written = len(payload)
+        total_bytes = entry['bytes'] + written
+    else:
+        # First sight of this game, or ESPN revised history we already logged
+        written = data_writer.atomic_write_bytes(path, _encode(plays))
+        total_bytes = written
+
+    index[game_id] = {
+        'count': len(plays),
+        'bytes': total_bytes,
+        'last_seq': plays[-1]['seq'] if plays else 0
+    }
+    return written
+
+def read_game(date_str, game_id):
+    """Returns a game's logged plays, oldest first ([] when there is no log)"""
+    path = os.path.join(LIVE_DIR, log_pointer(date_str, game_id))
+    if not os.path.exists(path):
+        return []
+    plays = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line: continue
+            try:
+                plays.append(json.loads(line))
+            except ValueError:
+                break  # Torn tail from an interrupted append
+    return plays
@@ -0,0 +1,117 @@
+import os
+import time
+from datetime import datetime, timezone
+
+# ==========================================================
+# --- GAME-STATE-AWARE POLL SCHEDULER ---
+# ==========================================================
+# Every ESPN game gets its OWN next-poll time, picked from what the scoreboard says
+# about it. The engine sleeps until the earliest one is due, so a tip-off is caught
+# right at its scheduled start, crunch time is polled hard, and halftime barely at all.
+
+# Seconds between summary fetches for each game situation
+POLL_INTERVALS = {
+    'crunch': int(os.environ.get("LIVE_POLL_CRUNCH", "5")),    # Final 5 minutes of the 4th, and all of OT
+    'live': int(os.environ.get("LIVE_POLL_LIVE", "10")),       # Regular running game
+    'end_period': 30,                                          # Between quarters
+    'halftime': 60,
+    'delayed_start': 30,                                       # Past tip-off time but ESPN still says "pre"
+    'cooldown': 60                                             # Final, waiting out late stat corrections
+}
+
+# Bounds on how long the engine sleeps between wake-ups
+MIN_SLEEP_SECONDS = 2
+MAX_IDLE_SECONDS = 300
+
+CRUNCH_CLOCK_SECONDS = 300
+
+def parse_clock_seconds(display_clock):
+    """'4:32' -> 272.0, '45.2' -> 45.2. Unknown formats return None."""
+    try:
+        if ':' in display_clock:
+            minutes, seconds = display_clock.split(':', 1)
+            return int(minutes) * 60 + float(seconds)
+        return float(display_clock)
+    except:
+        return None
+
+def parse_start_time(date_str):
+    """ESPN event dates look like '2025-01-15T00:30Z'. Returns epoch seconds, or None."""
+    if not date_str: return None
+    for fmt in ("%Y-%m-%dT%H:%MZ", "%Y-%m-%dT%H:%M:%SZ"):
+        try:
+            return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            pass
+    return None
+
+def classify_event(event):
+    """Maps an ESPN scoreboard event to one of the POLL_INTERVALS situations (or 'pre' / 'post')"""
+    status = event.get('status', {})
+    status_type = status.get('type', {})
+    state = status_type.get('state')
+
+    if state == 'pre': return 'pre'
+    if state == 'post': return 'cooldown'
+
+    name = status_type.get('name', '')
+    detail = status_type.get('shortDetail', '').lower()
+
+    if name == 'STATUS_HALFTIME' or 'halftime' in detail:
+        return 'halftime'
+    if name == 'STATUS_END_PERIOD' or detail.startswith('end of'):
+        return 'end_period'
+
+    period = status.get('period', 0) or 0
+    if period > 4:
+        return 'crunch'
+    if period == 4:
+        clock = parse_clock_seconds(status.get('displayClock', ''))
+        if clock is not None and clock <= CRUNCH_CLOCK_SECONDS:
+            return 'crunch'
+    return 'live'
+
+class PollScheduler:
+    """
+    Tracks when each ESPN event is next due. Events never seen before are due immediately.
+    """
+    def __init__(self):
+        self.next_due = {}
+
+    def is_due(self, event_id, now=None):
+        now = time.time() if now is None else now
+        due_at = self.next_due.get(event_id, 0)
+        return due_at is not None and now >= due_at
+
+    def mark_polled(self, event, now=None):
+        """Schedules the next poll of event based on the state it was just seen in"""
+        now = time.time() if now is None else now
+        situation = classify_event(event)
+
+        if situation == 'pre':
+            start = parse_start_time(event.get('date'))
+            # Wake right at tip-off. Once it passes and ESPN still says "pre", keep checking.
+            if start is None or start <= now:
+                self.next_due[event['id']] = now + POLL_INTERVALS['delayed_start']
+            else:
+                self.next_due[event['id']] = start
+        else:
+            self.next_due[event['id']] = now + POLL_INTERVALS[situation]
+
+    def retire(self, event_id):
+        """The game is done for good. It is never due again."""
+        self.next_due[event_id] = None
+
+    def retain(self, event_ids):
+        """Drops games that are no longer on the scoreboard (e.g. after the date rolls over)"""
+        keep = set(event_ids)
+        for event_id in list(self.next_due):
+            if event_id not in keep:
+                del self.next_due[event_id]
+
+    def seconds_until_next_poll(self, now=None):
+        now = time.time() if now is None else now
+        pending = [t for t in self.next_due.values() if t is not None]
+        if not pending:
+            return MAX_IDLE_SECONDS
+        return min(MAX_IDLE_SECONDS, max(MIN_SLEEP_SECONDS, min(pending) - now))
@@ -1,18 +1,20 @@
 import json
 import os
-import requests
+import http_client
+import page_cache
+import data_writer
 import re
 import zoneinfo
+import hashlib
+import threading
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
-# --- SELENIUM IMPORTS ---
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# --- BROWSER POOL (SELENIUM) ---
+from browser_pool import BrowserPool
 
 # ==========================================================
 # --- FOLDER SETUP ---
@@ -59,6 +61,31 @@ NICKNAMES = {
     'gg': 'gregory'
 }
 
+# ==========================================================
+# --- TARGETED HTML PARSING ---
+# ==========================================================
+# Only the elements we actually read get built into a tree (SoupStrainer), and lxml does
+# the tokenizing when it's installed. TARGETED_PARSING = False restores full html.parser
+# trees; benchmarks/bench_html_parsing.py uses that to prove outputs are identical.
+try:
+    import lxml  # noqa: F401
+    FAST_HTML_PARSER = 'lxml'
+except ImportError:
+    FAST_HTML_PARSER = 'html.parser'
+
+TARGETED_PARSING = os.environ.get("SCRAPER_FULL_PARSE", "") != "1"
+
+STARTERS_STRAINER = SoupStrainer('tr')
+NEWS_STRAINER = SoupStrainer('div', class_='q-su-item')
+PROJECTION_ROWS_STRAINER = SoupStrainer('tr', class_='projections-listing')
+SLATE_LINKS_STRAINER = SoupStrainer(['option', 'a'])
+SLATE_DATA_STRAINER = SoupStrainer(attrs={'data-slate': True})
+
+def make_soup(html_text, strainer):
+    if not TARGETED_PARSING:
+        return BeautifulSoup(html_text, 'html.parser')
+    return BeautifulSoup(html_text, FAST_HTML_PARSER, parse_only=strainer)
+
 def normalize_team(team_name):
     if not team_name: return ""
     clean_name = re.sub(r'[\r\n\t\d\xa0]', '', str(team_name)).strip().upper()
@@ -140,18 +167,52 @@ def merge_news_lists(old_news, new_news):
             
     return recent_list
 
+# ==========================================================
+# --- PER-RUN ESPN SCOREBOARD CACHE ---
+# ==========================================================
+# Every stage of build_json() (schedule, odds shield, bundled scoreboard) reads the
+# same 3 scoreboard payloads. Fetch each date ONCE and serve the rest from memory.
+ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
+SCOREBOARD_TTL_SECONDS = 600  # Longer than a full scraper run, so each date is fetched once
+
+SCOREBOARD_CACHE = {}  # espn_date_str -> (fetched_at, payload)
+SCOREBOARD_CACHE_STATS = {'hits': 0, 'misses': 0}
+SCOREBOARD_CACHE_LOCK = threading.Lock()
+
+def get_cached_scoreboard(espn_date_str):
+    """Returns the ESPN scoreboard for a YYYYMMDD date, fetching it at most once per TTL window"""
+    espn_date_str = str(espn_date_str).replace('-', '')
+    
+    with SCOREBOARD_CACHE_LOCK:
+        cached = SCOREBOARD_CACHE.get(espn_date_str)
+        if cached and (time.time() - cached[0]) < SCOREBOARD_TTL_SECONDS:
+            SCOREBOARD_CACHE_STATS['hits'] += 1
+            return cached[1]
+        
+        SCOREBOARD_CACHE_STATS['misses'] += 1
+        try:
+            res = http_client.get(f"{ESPN_SCOREBOARD_URL}?dates={espn_date_str}", timeout=10)
+            if res.status_code == 200:
+                payload = res.json()
+                SCOREBOARD_CACHE[espn_date_str] = (time.time(), payload)
+                return payload
+            print(f"ESPN Scoreboard API returned {res.status_code} for {espn_date_str}")
+        except Exception as e:
+            print(f"ESPN Scoreboard API Error for {espn_date_str}: {e}")
+        
+        # Failures are NOT cached, so the next stage gets a fresh attempt
+        return {}
+
+def print_scoreboard_cache_stats():
+    hits = SCOREBOARD_CACHE_STATS['hits']
+    misses = SCOREBOARD_CACHE_STATS['misses']
+    print(f"📦 ESPN scoreboard cache: {hits} hits / {misses} misses ({len(SCOREBOARD_CACHE)} dates cached)")
+
 # ==========================================================
 # --- RAW ESPN SCOREBOARD FETCH (FOR THE NEW BUNDLED JSON) ---
 # ==========================================================
 def fetch_espn_scoreboard(espn_date_str):
-    url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={espn_date_str}"
-    try:
-        res = requests.get(url, timeout=10)
-        if res.status_code == 200:
-            return res.json()
-    except Exception as e:
-        print(f"ESPN Scoreboard API Error for {espn_date_str}: {e}")
-    return {}
+    return get_cached_scoreboard(espn_date_str)
 
 # ==========================================================
 # --- FETCH PRECISE DATES & TIMES FROM ESPN ---
@@ -167,9 +228,7 @@ def get_espn_schedule_data():
             target_date = now_est + timedelta(days=i)
             date_str = target_date.strftime('%Y%m%d')
             
-            url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_str}"
-            res = requests.get(url, timeout=10)
-            data = res.json()
+            data = get_cached_scoreboard(date_str)
             
             for ev in data.get('events', []):
                 utc_date_str = ev['date'].replace('Z', '+00:00')
@@ -206,16 +265,20 @@ def scrape_bbm_player_news():
     }
     
     try:
-        response = requests.get(BBM_NEWS_URL, headers=headers, timeout=15)
-        if response.status_code != 200:
-            print(f"⚠️ Failed to fetch BBM News. Status Code: {response.status_code}")
-            return []
-        html_content = response.text
+        news = page_cache.fetch_parsed(BBM_NEWS_URL, parse_player_news_html, headers=headers, timeout=15)
     except Exception as e:
         print(f"⚠️ Network error fetching BBM News: {e}")
         return []
+    
+    if news is None:
+        print("⚠️ Failed to fetch BBM News.")
+        return []
+    
+    print(f"Scraped {len(news)} player news items.")
+    return news
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+def parse_player_news_html(html_content):
+    soup = make_soup(html_content, NEWS_STRAINER)
     news_items = soup.find_all('div', class_='q-su-item')
     
     if not news_items:
@@ -265,7 +328,6 @@ def scrape_bbm_player_news():
             
         extracted_news.append(news_data)
         
-    print(f"Scraped {len(extracted_news)} player news items.")
     return extracted_news
 
 # ==========================================================
@@ -274,12 +336,20 @@ def scrape_bbm_player_news():
 def scrape_starters():
     print(f"--- SCRAPING {BBM_URL} ---")
     try:
-        response = requests.get(BBM_URL, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.find_all('tr')
+        starters_map = page_cache.fetch_parsed(BBM_URL, parse_starters_html, headers=HEADERS, timeout=15)
     except Exception as e:
         print(f"CRITICAL ERROR SCRAPING BBM: {e}")
         return {}
+    
+    if starters_map is None:
+        return {}
+
+    print(f"Scraped {len(starters_map)} teams from BBM.")
+    return starters_map
+
+def parse_starters_html(html_content):
+    soup = make_soup(html_content, STARTERS_STRAINER)
+    rows = soup.find_all('tr')
 
     starters_map = {} 
     
@@ -331,93 +401,230 @@ def scrape_starters():
                 p_info = extract_player_info(cells[2])
                 if p_info: starters_map[tm_home].append(p_info)
 
-    print(f"Scraped {len(starters_map)} teams from BBM.")
     return starters_map
 
 # GLOBAL SLATE DIRECTORY
 GLOBAL_SLATES = {'fanduel': {}, 'draftkings': {}}
 
+# ==========================================================
+# --- BOUNDED-CONCURRENCY SLATE DOWNLOADER ---
+# ==========================================================
+# Busy nights have 10+ slates per platform. Downloads overlap on a small worker pool that
+# shares the pooled keep-alive session; parsing stays on the calling thread so parse_row
+# never races on dff_data.
+DFF_SLATE_WORKERS = int(os.environ.get("DFF_SLATE_WORKERS", "6"))
+
+def download_slate_pages(base_url, slate_ids, workers=None, cancel=None):
+    """Downloads every ?slate= page concurrently. Yields (sid, rows) in slate order, rows is None on failure."""
+    api_headers = HEADERS.copy()
+    api_headers['X-Requested-With'] = 'XMLHttpRequest'
+    
+    def fetch(sid):
+        # Queued slates are dropped once the fetch stage has given up on this crawl
+        if cancel is not None and cancel.is_set(): return sid, None
+        print(f"Rapid JSON Scrape for Slate: {sid}")
+        try:
+            return sid, page_cache.fetch_parsed(f"{base_url}?slate={sid}", parse_projection_rows, headers=api_headers, timeout=5)
+        except: pass
+        return sid, None
+    
+    if not slate_ids: return
+    
+    workers = max(1, min(workers or DFF_SLATE_WORKERS, len(slate_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() keeps slate order, so the slate dicts are built in the same order every run
+        for result in pool.map(fetch, slate_ids):
+            yield result
+
+# ==========================================================
+# --- HTTP-FIRST SLATE DISCOVERY ---
+# ==========================================================
+def fetch_slate_candidates(base_url):
+    """Plain HTTP fetch of a DFF projections page, run through the extraction passes. None on failure."""
+    try:
+        return page_cache.fetch_parsed(base_url, extract_slate_candidates, headers=HEADERS, timeout=10)
+    except Exception as e:
+        print(f"⚠️ Network error fetching DFF page: {e}")
+    return None
+
+def extract_slate_candidates(html_text):
+    """
+    Runs the four slate extraction passes over a projections page. Registers nothing, so the
+    same function serves the HTTP page and the browser-rendered page.
+    """
+    # Each pass only materializes its own elements. A full parse serves all passes at once.
+    link_soup = make_soup(html_text, SLATE_LINKS_STRAINER)
+    data_soup = make_soup(html_text, SLATE_DATA_STRAINER) if TARGETED_PARSING else link_soup
+    rows_soup = make_soup(html_text, PROJECTION_ROWS_STRAINER) if TARGETED_PARSING else link_soup
+    named = []
+    active_sid = None
+    
+    # 1. Look in Option tags
+    for opt in link_soup.find_all('option'):
+        val = opt.get('value', '')
+        if opt.has_attr('selected'): active_sid = val
+        named.append((val, opt.get_text(separator=" ", strip=True)))
+        
+    # 2. Look in React Divs/Spans with data-slate
+    for el in data_soup.find_all(attrs={"data-slate": True}):
+        named.append((el.get("data-slate", ""), el.get_text(separator=" ", strip=True)))
+        
+    # 3. Look in Links with slate=
+    for a in link_soup.find_all('a', href=True):
+        match = re.search(r'slate=([a-zA-Z0-9]{5})', a['href'])
+        if match:
+            named.append((match.group(1), a.get_text(separator=" ", strip=True)))
+
+    # 4. Fallback Regex
+    regex_ids = re.findall(r'slate=["\']?([a-zA-Z0-9]{5})', html_text)
+    
+    return {
+        "named": named,
+        "regex": regex_ids,
+        "active_sid": active_sid,
+        "rows": rows_to_attr_dicts(rows_soup)
+    }
+
+def parse_projection_rows(html_text):
+    return rows_to_attr_dicts(make_soup(html_text, PROJECTION_ROWS_STRAINER))
+
+def rows_to_attr_dicts(soup):
+    # parse_row only reads attributes, so rows travel (and get cached) as plain attribute dicts
+    return [dict(row.attrs) for row in soup.find_all('tr', class_='projections-listing')]
+
+def has_valid_slates(candidates):
+    if candidates['regex']: return True
+    return any(sid and re.match(r'^[a-zA-Z0-9]{5}$', str(sid)) for sid, _ in candidates['named'])
+
+# ==========================================================
+# --- SLATE PRIORITY WATERFALL ---
+# ==========================================================
+# A player can appear on several slates. The default (top-level) salary/proj/value
+# comes from the best one: real projections beat 0.0, then All Day > Main > other
+# classics > single-game, then the highest projection.
+def get_slate_priority(slate_name):
+    name_lower = slate_name.lower()
+    if "all day" in name_lower: return 1
+    elif "main" in name_lower: return 2
+    elif "@" in name_lower or "showdown" in name_lower or "single game" in name_lower or "captain" in name_lower: return 4
+    else: return 3
+
+def pick_best_slate(slates, slate_names):
+    """sid of the slate whose numbers become the player's defaults (None if no slates)"""
+    best_sid, best_pri = None, 99
+    for sid, stats in slates.items():
+        pri = get_slate_priority(slate_names.get(sid, ""))
+        best_proj = slates.get(best_sid, {}).get("proj", 0)
+        
+        # Rule 1: Actual projections always beat 0.0 projections
+        if stats["proj"] > 0 and best_proj == 0:
+            best_pri, best_sid = pri, sid
+        # Rule 2: If both have stats (or both are 0), defer to priority & highest projection
+        elif (stats["proj"] > 0) == (best_proj > 0):
+            if pri < best_pri or (pri == best_pri and stats["proj"] > best_proj):
+                best_pri, best_sid = pri, sid
+    return best_sid
+
+def apply_slate_waterfall(dff_data, slate_names=None):
+    """Fills every player's default FD and DK numbers from their best slate, in place"""
+    if slate_names is None: slate_names = GLOBAL_SLATES
+    for p_key, p_data in dff_data.items():
+        # --- Fanduel ---
+        best_fd_sid = pick_best_slate(p_data["fd_slates"], slate_names['fanduel'])
+        if best_fd_sid:
+            p_data["salary"] = p_data["fd_slates"][best_fd_sid]["salary"]
+            p_data["proj"] = p_data["fd_slates"][best_fd_sid]["proj"]
+            p_data["value"] = p_data["fd_slates"][best_fd_sid]["value"]
+            
+        # --- DraftKings ---
+        best_dk_sid = pick_best_slate(p_data["dk_slates"], slate_names['draftkings'])
+        if best_dk_sid:
+            p_data["dk_salary"] = p_data["dk_slates"][best_dk_sid]["salary"]
+            p_data["dk_proj"] = p_data["dk_slates"][best_dk_sid]["proj"]
+            p_data["dk_value"] = p_data["dk_slates"][best_dk_sid]["value"]
+    return dff_data
+
 # ==========================================================
 # --- DYNAMIC SLATE CRAWLER FOR DFF (HYBRID BOT) ---
 # ==========================================================
-def scrape_dff_projections(target_date_str):
-    print(f"\n--- BROWSER BOT STARTING FOR: {target_date_str} ---")
+def add_slate_name(slate_names, sid, name):
+    """Registers a slate's display name. A real name replaces a "Slate xxxxx" placeholder, never the reverse."""
+    if sid not in slate_names or slate_names[sid].startswith("Slate "):
+        slate_names[sid] = name
+
+def merge_slate_names(target, source):
+    for platform, names in source.items():
+        for sid, name in names.items():
+            add_slate_name(target.setdefault(platform, {}), sid, name)
+    return target
+
+class CrawlCancelled(Exception):
+    pass
+
+def scrape_dff_projections(target_date_str, browser_pool=None, cancel=None):
+    """
+    Crawls every FD and DK slate for one date. Returns (dff_data, slate_names) and touches
+    no globals, so a crawl that outlives its deadline can't leak into the build.
+    """
+    print(f"\n--- DFF CRAWLER STARTING FOR: {target_date_str} ---")
     dff_data = {}
+    slate_names = {'fanduel': {}, 'draftkings': {}}
     platforms = ['fanduel', 'draftkings']
     
-    chrome_options = Options()
-    chrome_options.add_argument("--headless") 
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    def check_cancel():
+        if cancel is not None and cancel.is_set():
+            raise CrawlCancelled(f"DFF crawl for {target_date_str} cancelled")
     
-    try:
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=chrome_options)
-    except Exception as e:
-        print(f"Failed to launch browser bot: {e}")
-        return dff_data
+    # Standalone calls get a private pool; build_json() shares one Chrome across every date.
+    # Either way Chrome only starts if HTTP discovery comes up empty.
+    owns_pool = browser_pool is None
+    if owns_pool:
+        browser_pool = BrowserPool()
 
     for platform in platforms:
         base_url = f"https://www.dailyfantasyfuel.com/nba/projections/{platform}/{target_date_str}"
         slate_ids = set()
+        platform_names = slate_names[platform]
         
         try:
+            check_cancel()
+            # HTTP-first: the slate picker is almost always in the server-rendered HTML.
+            # Chrome only launches (lazily, via the pool) when plain HTTP yields no valid slate IDs.
             print(f"Loading {platform.upper()} Base URL: {base_url}")
-            driver.get(base_url)
-            time.sleep(2) 
+            discovery_source = "HTTP"
+            candidates = fetch_slate_candidates(base_url)
             
-            try:
-                toggles = driver.find_elements(By.XPATH, "//*[contains(translate(text(), 'SLATE', 'slate'), 'slate') or contains(translate(text(), 'MAIN', 'main'), 'main') or contains(@class, 'slate')]")
-                for t in toggles:
-                    try:
-                        if not t.get_attribute("href"):
-                            driver.execute_script("arguments[0].click();", t)
-                    except: pass
-                time.sleep(1) 
-            except: pass
-
-            # --- BULLETPROOF SLATE EXTRACTION ---
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            if not candidates or not has_valid_slates(candidates):
+                check_cancel()
+                print(f"No slates in server HTML for {platform.upper()}. Falling back to browser bot...")
+                discovery_source = "Browser"
+                # Own tab, waits on the slate DOM instead of fixed sleeps, page_source captured once
+                html_text = browser_pool.load_page_source(base_url)
+                candidates = extract_slate_candidates(html_text)
             
-            def add_slate_name(sid, name):
+            def register_slate(sid, name):
                 if not sid or not re.match(r'^[a-zA-Z0-9]{5}$', str(sid)): return
                 slate_ids.add(sid)
                 name = str(name).strip()
                 if name and len(name) > 2:
                     bad_names = ["projections", "matchups", "odds", "starting lineups", "players", "lineups", "optimizer"]
                     if name.lower() not in bad_names:
-                        if sid not in GLOBAL_SLATES[platform] or GLOBAL_SLATES[platform][sid].startswith("Slate "):
-                            clean_name = re.sub(r'^(FD|DK)\s+', '', name, flags=re.IGNORECASE).strip()
-                            if clean_name:
-                                GLOBAL_SLATES[platform][sid] = clean_name
-
-            # 1. Look in Option tags
-            active_sid = None
-            for opt in soup.find_all('option'):
-                val = opt.get('value', '')
-                if opt.has_attr('selected'): active_sid = val
-                add_slate_name(val, opt.get_text(separator=" ", strip=True))
-                
-            # 2. Look in React Divs/Spans with data-slate
-            for el in soup.find_all(attrs={"data-slate": True}):
-                add_slate_name(el.get("data-slate", ""), el.get_text(separator=" ", strip=True))
-                
-            # 3. Look in Links with slate=
-            for a in soup.find_all('a', href=True):
-                match = re.search(r'slate=([a-zA-Z0-9]{5})', a['href'])
-                if match:
-                    add_slate_name(match.group(1), a.get_text(separator=" ", strip=True))
+                        clean_name = re.sub(r'^(FD|DK)\s+', '', name, flags=re.IGNORECASE).strip()
+                        if clean_name:
+                            add_slate_name(platform_names, sid, clean_name)
+
+            # 1-3. Option tags, data-slate elements and slate= links (in page order)
+            active_sid = candidates['active_sid']
+            for sid, name in candidates['named']:
+                register_slate(sid, name)
 
             # 4. Fallback Regex
-            html_text = driver.page_source
-            matches = re.findall(r'slate=["\']?([a-zA-Z0-9]{5})', html_text)
-            for m in matches:
+            for m in candidates['regex']:
                 slate_ids.add(m)
-                if m not in GLOBAL_SLATES[platform]:
-                    GLOBAL_SLATES[platform][m] = f"Slate {m}"
+                if m not in platform_names:
+                    platform_names[m] = f"Slate {m}"
             
-            print(f"Browser found {len(slate_ids)} valid slates: {slate_ids}")
+            print(f"{discovery_source} found {len(slate_ids)} valid slates: {slate_ids}")
             
             def parse_row(row, plt, sid):
                 team_raw = row.get('data-team')
@@ -471,78 +678,281 @@ def scrape_dff_projections(target_date_str):
 
             print(f"Scraping initial rendered slate: {base_url}")
             if active_sid:
-                for row in soup.find_all('tr', class_='projections-listing'):
+                for row in candidates['rows']:
                     parse_row(row, platform, active_sid)
             
-            for sid in slate_ids:
-                if sid == active_sid: continue
-                print(f"Rapid JSON Scrape for Slate: {sid}")
-                try:
-                    api_headers = HEADERS.copy()
-                    api_headers['X-Requested-With'] = 'XMLHttpRequest'
-                    res = requests.get(f"{base_url}?slate={sid}", headers=api_headers, timeout=5)
-                    
-                    if res.status_code == 200:
-                        sub_soup = BeautifulSoup(res.text, 'html.parser')
-                        for row in sub_soup.find_all('tr', class_='projections-listing'):
-                            parse_row(row, platform, sid)
-                except: pass
+            pending_sids = sorted(sid for sid in slate_ids if sid != active_sid)
+            for sid, rows in download_slate_pages(base_url, pending_sids, cancel=cancel):
+                check_cancel()
+                if rows is None: continue
+                for row in rows:
+                    parse_row(row, platform, sid)
                 
             print(f"Successfully compiled all slates for {platform.upper()}.")
             
+        except CrawlCancelled as e:
+            print(f"🛑 {e}. Stopping.")
+            break
         except Exception as e:
             print(f"Error scraping DFF ({platform}): {e}")
             
     print("Applying priority waterfall logic for default DFS stats...")
-    
-    def get_slate_priority(slate_name):
-        name_lower = slate_name.lower()
-        if "all day" in name_lower: return 1
-        elif "main" in name_lower: return 2
-        elif "@" in name_lower or "showdown" in name_lower or "single game" in name_lower or "captain" in name_lower: return 4
-        else: return 3
+    apply_slate_waterfall(dff_data, slate_names)
+
+    if owns_pool:
+        browser_pool.shutdown()
+    return dff_data, slate_names
+
+# ==========================================================
+# --- PER-DATE PLAYER MATCH INDEX ---
+# ==========================================================
+# Built once per date so every starter lookup is a dict hit instead of a scan of the
+# whole slate. Keys keep daily_dff order, so bench lists come out in the same order.
+EMPTY_TEAM_INDEX = {"by_name": {}, "by_last_initial": {}, "keys": []}
+
+def build_match_index(daily_dff):
+    """team -> {normalized name -> key, (last name, first initial) -> (position, first key), ordered keys}"""
+    index = {}
+    for d_key in daily_dff:
+        team, _, clean = d_key.partition('_')
+        bucket = index.get(team)
+        if bucket is None:
+            bucket = index[team] = {"by_name": {}, "by_last_initial": {}, "keys": []}
         
-    for p_key, p_data in dff_data.items():
-        # --- Fanduel ---
-        best_fd_sid, best_fd_pri = None, 99
-        for sid, stats in p_data["fd_slates"].items():
-            pri = get_slate_priority(GLOBAL_SLATES['fanduel'].get(sid, ""))
-            best_proj = p_data["fd_slates"].get(best_fd_sid, {}).get("proj", 0)
-            
-            # Rule 1: Actual projections always beat 0.0 projections
-            if stats["proj"] > 0 and best_proj == 0:
-                best_fd_pri, best_fd_sid = pri, sid
-            # Rule 2: If both have stats (or both are 0), defer to priority & highest projection
-            elif (stats["proj"] > 0) == (best_proj > 0):
-                if pri < best_fd_pri or (pri == best_fd_pri and stats["proj"] > best_proj):
-                    best_fd_pri, best_fd_sid = pri, sid
-                    
-        if best_fd_sid:
-            p_data["salary"] = p_data["fd_slates"][best_fd_sid]["salary"]
-            p_data["proj"] = p_data["fd_slates"][best_fd_sid]["proj"]
-            p_data["value"] = p_data["fd_slates"][best_fd_sid]["value"]
-            
-        # --- DraftKings ---
-        best_dk_sid, best_dk_pri = None, 99
-        for sid, stats in p_data["dk_slates"].items():
-            pri = get_slate_priority(GLOBAL_SLATES['draftkings'].get(sid, ""))
-            best_proj = p_data["dk_slates"].get(best_dk_sid, {}).get("proj", 0)
-            
-            # Rule 1: Actual projections always beat 0.0 projections
-            if stats["proj"] > 0 and best_proj == 0:
-                best_dk_pri, best_dk_sid = pri, sid
-            # Rule 2: If both have stats (or both are 0), defer to priority & highest projection
-            elif (stats["proj"] > 0) == (best_proj > 0):
-                if pri < best_dk_pri or (pri == best_dk_pri and stats["proj"] > best_proj):
-                    best_dk_pri, best_dk_sid = pri, sid
-                    
-        if best_dk_sid:
-            p_data["dk_salary"] = p_data["dk_slates"][best_dk_sid]["salary"]
-            p_data["dk_proj"] = p_data["dk_slates"][best_dk_sid]["proj"]
-            p_data["dk_value"] = p_data["dk_slates"][best_dk_sid]["value"]
+        bucket["by_name"][clean] = d_key
+        
+        parts = clean.split()
+        if parts:
+            bucket["by_last_initial"].setdefault((parts[-1], clean[0]), (len(bucket["keys"]), d_key))
+        bucket["keys"].append(d_key)
+    return index
 
-    driver.quit() 
-    return dff_data
+def find_dff_key(team_index, clean):
+    """
+    Same answer as the old scan: exact normalized name, else the FIRST team key (in DFF order)
+    that contains the last name and starts with the first initial.
+    """
+    d_key = team_index["by_name"].get(clean)
+    if d_key: return d_key
+    
+    parts = clean.split()
+    if len(parts) < 2: return None
+    last_name, first_initial = parts[-1], parts[0][0]
+    
+    # An exact (last name, initial) hit is always a scan match, but a key earlier in the
+    # list can match on substring ("green" in "greene"), so only the keys before it are scanned.
+    hit = team_index["by_last_initial"].get((last_name, first_initial))
+    stop = hit[0] if hit else len(team_index["keys"])
+    for d_key in team_index["keys"][:stop]:
+        if last_name in d_key and d_key.split('_')[1].startswith(first_initial):
+            return d_key
+    return hit[1] if hit else None
+
+def index_old_roster(old_game, team):
+    """normalized name -> first matching player from the previous run's roster"""
+    by_name = {}
+    for old_p in old_game.get('rosters', {}).get(team, {}).get('players', []):
+        by_name.setdefault(clean_player_name(old_p['name']), old_p)
+    return by_name
+
+def build_team_roster(team, starters_data, daily_dff, team_index, old_game):
+    """
+    One team's roster object: scraped starters matched to their DFF numbers (falling
+    back to last run's roster), plus every unmatched DFF player with a salary as bench.
+    """
+    player_list = []
+    matched_dff_keys = set()
+    old_players_by_name = None
+
+    for p_obj in starters_data:
+        raw_name = p_obj['name']
+        is_verified = p_obj['verified']
+        clean = clean_player_name(raw_name)
+
+        p_data = {
+            "pos": "Flex", "name": raw_name,
+            "salary": 0, "proj": 0, "value": 0,
+            "dk_pos": "Flex", "dk_salary": 0, "dk_proj": 0, "dk_value": 0,
+            "fd_slates": [], "dk_slates": [],
+            "fd_positions": "", "dk_positions": "",
+            "injury": "", "verified": is_verified 
+        }
+
+        d_key = find_dff_key(team_index, clean)
+        if d_key:
+            matched_dff_keys.add(d_key)
+            d_val = daily_dff[d_key]
+            p_data.update({
+                "pos": d_val.get('pos', 'Flex'),
+                "salary": d_val.get('salary', 0), "proj": d_val.get('proj', 0), "value": d_val.get('value', 0),
+                "dk_pos": d_val.get('dk_pos', 'Flex'),
+                "dk_salary": d_val.get('dk_salary', 0), "dk_proj": d_val.get('dk_proj', 0), "dk_value": d_val.get('dk_value', 0),
+                "fd_slates": d_val.get('fd_slates', []), "dk_slates": d_val.get('dk_slates', []),
+                "fd_positions": d_val.get('fd_positions', ''), "dk_positions": d_val.get('dk_positions', ''),
+                "injury": d_val.get('injury', '')
+            })
+
+        # Exact-name matches never reach the old-roster fallback (same as before)
+        if p_data["salary"] == 0 and old_game and d_key != f"{team}_{clean}":
+            if old_players_by_name is None:
+                old_players_by_name = index_old_roster(old_game, team)
+            old_p = old_players_by_name.get(clean)
+            if old_p:
+                p_data.update({
+                    "pos": old_p.get("pos", "Flex"),
+                    "salary": old_p.get("salary", 0), "proj": old_p.get("proj", 0), "value": old_p.get("value", 0),
+                    "dk_pos": old_p.get("dk_pos", "Flex"),
+                    "dk_salary": old_p.get("dk_salary", 0), "dk_proj": old_p.get("dk_proj", 0), "dk_value": old_p.get("dk_value", 0),
+                    "fd_slates": old_p.get("fd_slates", []), "dk_slates": old_p.get("dk_slates", []),
+                    "fd_positions": old_p.get("fd_positions", ""), "dk_positions": old_p.get("dk_positions", "")
+                })
+
+        player_list.append(p_data)
+
+    if not player_list:
+        player_list.append({"pos": "-", "name": "Waiting for Lineup", "salary": 0, "proj": 0, "value": 0, "dk_pos": "-", "dk_salary": 0, "dk_proj": 0, "dk_value": 0, "fd_slates": [], "dk_slates": [], "fd_positions": "", "dk_positions": "", "injury": "", "verified": False})
+
+    bench_list = []
+    for d_key in team_index["keys"]:
+        if d_key in matched_dff_keys: continue
+        d_val = daily_dff[d_key]
+        if d_val.get('salary', 0) > 0 or d_val.get('dk_salary', 0) > 0:
+            bench_list.append({
+                "pos": d_val.get('pos', 'Flex'),
+                "name": d_val.get('name', 'Unknown'),
+                "salary": d_val.get('salary', 0), "proj": d_val.get('proj', 0), "value": d_val.get('value', 0),
+                "dk_pos": d_val.get('dk_pos', 'Flex'),
+                "dk_salary": d_val.get('dk_salary', 0), "dk_proj": d_val.get('dk_proj', 0), "dk_value": d_val.get('dk_value', 0),
+                "fd_slates": d_val.get('fd_slates', []), "dk_slates": d_val.get('dk_slates', []),
+                "fd_positions": d_val.get('fd_positions', ''), "dk_positions": d_val.get('dk_positions', ''),
+                "injury": d_val.get('injury', ''), "verified": False
+            })
+
+    bench_list.sort(key=lambda x: max(x.get('proj', 0), x.get('dk_proj', 0)), reverse=True)
+
+    return {
+        "logo": f"https://a.espncdn.com/i/teamlogos/nba/500/{team.lower()}.png",
+        "players": player_list,
+        "bench": bench_list 
+    }
+
+# ==========================================================
+# --- INCREMENTAL BUILD FINGERPRINTS ---
+# ==========================================================
+BUILD_STATE_FILE = os.path.join(SCRIPT_DIR, '..', '.cache', 'build_fingerprints.json')
+
+def content_digest(obj):
+    return hashlib.sha1(json.dumps(obj, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def game_fingerprint(*inputs):
+    """Hash of everything a game object is built from (roster slice, DFF records, schedule, odds)"""
+    return content_digest(inputs)
+
+# BBM's relative "12m ago" string changes every run. The site renders news age from
+# local_timestamp (script.js), so it is left out of the change check.
+VOLATILE_NEWS_FIELDS = ('time_elapsed',)
+
+def output_digest(file_json):
+    """Only the parts that count as a real change. last_updated doesn't; the scoreboard (status, scores, odds) does."""
+    news = [{k: v for k, v in n.items() if k not in VOLATILE_NEWS_FIELDS} for n in file_json.get('player_news', [])]
+    return content_digest([file_json.get('games', []), news, file_json.get('slates', {}), file_json.get('espn_schedule')])
+
+def load_daily_news(file_path):
+    """Returns (old player_news, digest of the file as it is on disk)"""
+    if not os.path.exists(file_path): return [], None
+    try:
+        with open(file_path, 'r') as f:
+            old_json = json.load(f)
+        return old_json.get('player_news', []), output_digest(old_json)
+    except:
+        return [], None
+
+def load_build_fingerprints():
+    if not os.path.exists(BUILD_STATE_FILE): return {}
+    try:
+        with open(BUILD_STATE_FILE, 'r') as f:
+            return json.load(f)
+    except:
+        return {}
+
+def save_build_fingerprints(fingerprints):
+    try:
+        data_writer.write_json(BUILD_STATE_FILE, fingerprints, sidecars=())
+    except Exception as e:
+        print(f"⚠️ Could not save build fingerprints: {e}")
+
+# ==========================================================
+# --- CONCURRENT SOURCE FETCH STAGE ---
+# ==========================================================
+# None of the sources depend on each other, so the stage costs as much as the
+# SLOWEST source instead of the sum of all of them.
+SOURCE_TIMEOUTS = {
+    'schedule': 30,
+    'starters': 30,
+    'news': 30,
+    'dff': 240
+}
+
+def run_source(fn, *args):
+    """Starts fn on a daemon thread. Returns (thread, box); box gets 'result' or 'error' when fn finishes."""
+    box = {}
+    def target():
+        try:
+            box['result'] = fn(*args)
+        except Exception as e:
+            box['error'] = e
+    # Daemon, so a hung source can never hold the process open after the build is written
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, box
+
+def run_fetch_stage(dff_dates, browser_pool=None):
+    """
+    Runs every independent scrape in parallel. Each source gets its own deadline and
+    falls back to the same empty structure the source returns on failure.
+    DFF slate names are merged into GLOBAL_SLATES here, in date order, once every crawl is in.
+    """
+    print(f"\n--- CONCURRENT FETCH STAGE ({3 + len(dff_dates)} sources) ---")
+    stage_start = time.time()
+    cancel = threading.Event()
+    
+    jobs = {
+        'schedule': (run_source(get_espn_schedule_data), SOURCE_TIMEOUTS['schedule'], {}),
+        'starters': (run_source(scrape_starters), SOURCE_TIMEOUTS['starters'], {}),
+        'news': (run_source(scrape_bbm_player_news), SOURCE_TIMEOUTS['news'], [])
+    }
+    for d_str in dff_dates:
+        jobs[f"dff:{d_str}"] = (run_source(scrape_dff_projections, d_str, browser_pool, cancel), SOURCE_TIMEOUTS['dff'], ({}, {}))
+    
+    results = {}
+    for name, ((thread, box), timeout, fallback) in jobs.items():
+        # Deadlines are measured from stage start, so waiting on one source never eats into another's budget
+        thread.join(max(0, stage_start + timeout - time.time()))
+        if thread.is_alive():
+            print(f"⚠️ Source '{name}' timed out after {timeout}s. Using empty fallback.")
+            results[name] = fallback
+        elif 'error' in box:
+            print(f"⚠️ Source '{name}' failed: {box['error']}. Using empty fallback.")
+            results[name] = fallback
+        else:
+            results[name] = box['result']
+    
+    # Late DFF crawls stop at their next checkpoint instead of driving the (closing) browser pool
+    cancel.set()
+    print(f"⏱️ Fetch stage finished in {time.time() - stage_start:.1f}s")
+    
+    dff_by_date = {}
+    for d_str in sorted(dff_dates):
+        dff_data, slate_names = results[f"dff:{d_str}"]
+        merge_slate_names(GLOBAL_SLATES, slate_names)
+        dff_by_date[d_str] = dff_data
+    
+    return (
+        results['schedule'],
+        results['starters'],
+        results['news'],
+        {d_str: dff_by_date[d_str] for d_str in dff_dates}
+    )
 
 # ==========================================================
 # --- MAIN LOGIC ---
@@ -571,10 +981,13 @@ def build_json():
     # ----------------------------------------------------
     old_memory = {}
     old_legacy_news = []
+    old_legacy_digest = None
     if os.path.exists(LEGACY_FILE):
         try:
             with open(LEGACY_FILE, 'r') as f:
                 old_data = json.load(f)
+                # Digest BEFORE merge_news_lists touches the old items, so we can skip no-op rewrites
+                old_legacy_digest = output_digest(old_data)
                 old_legacy_news = old_data.get('player_news', [])
                 for g in old_data.get('games', []):
                     clean_id = str(g['id']).replace('\r', '').replace('\n', '').replace(' ', '')
@@ -589,56 +1002,41 @@ def build_json():
     tomorrow_file_path = os.path.join(DATA_DIR, f"{tomorrow_str}.json")
     yesterday_file_path = os.path.join(DATA_DIR, f"{yesterday_str}.json")
 
-    old_today_news = []
-    if os.path.exists(today_file_path):
-        try:
-            with open(today_file_path, 'r') as f:
-                old_today_news = json.load(f).get('player_news', [])
-        except: pass
-
-    old_tomorrow_news = []
-    if os.path.exists(tomorrow_file_path):
-        try:
-            with open(tomorrow_file_path, 'r') as f:
-                old_tomorrow_news = json.load(f).get('player_news', [])
-        except: pass
-        
-    old_yesterday_news = []
-    if os.path.exists(yesterday_file_path):
-        try:
-            with open(yesterday_file_path, 'r') as f:
-                old_yesterday_news = json.load(f).get('player_news', [])
-        except: pass
+    old_today_news, old_today_digest = load_daily_news(today_file_path)
+    old_tomorrow_news, old_tomorrow_digest = load_daily_news(tomorrow_file_path)
+    old_yesterday_news, old_yesterday_digest = load_daily_news(yesterday_file_path)
+    
+    # Input fingerprints of every game we built last run
+    old_fingerprints = load_build_fingerprints()
+    new_fingerprints = {}
+    reused_games = 0
     # ----------------------------------------------------
 
-    team_schedule = get_espn_schedule_data()
-    scraped_rosters = scrape_starters()
+    # We scrape Yesterday, Today, and Tomorrow to ensure all daily files are created/updated
+    unique_dates = [yesterday_str, current_date_str, tomorrow_str]
+    print(f"\n[TIME CHECK] Scraping Yesterday, Today, & Tomorrow: {unique_dates}")
     
-    # Fetch fresh news items 
-    all_player_news = scrape_bbm_player_news()
+    # ESPN schedule, BBM starters, BBM news and one DFF crawl per date all run at once.
+    # Since scrape_dff_projections already perfectly handles cross-slate logic 
+    # for a SINGLE day, each date's finished product lands in its own bucket!
+    # One Chrome for the whole run: every date/platform gets its own tab in the shared pool
+    browser_pool = BrowserPool()
+    try:
+        team_schedule, scraped_rosters, all_player_news, dff_projections_by_date = run_fetch_stage(unique_dates, browser_pool)
+    finally:
+        browser_pool.shutdown()
     
     # Filter the FRESH news into Yesterday, Today, and Tomorrow buckets
     fresh_yesterday_news = [n for n in all_player_news if n.get('next_game', '').startswith(yesterday_weekday)]
     fresh_today_news = [n for n in all_player_news if n.get('next_game', '').startswith(today_weekday)]
     fresh_tomorrow_news = [n for n in all_player_news if n.get('next_game', '').startswith(tomorrow_weekday)]
 
-    # We scrape Yesterday, Today, and Tomorrow to ensure all daily files are created/updated
-    unique_dates = [yesterday_str, current_date_str, tomorrow_str]
-    print(f"\n[TIME CHECK] Scraping Yesterday, Today, & Tomorrow: {unique_dates}")
-        
-    # Create a master dictionary separated by DATE
-    dff_projections_by_date = {d: {} for d in unique_dates}
-    
-    for d_str in unique_dates:
-        # Since scrape_dff_projections already perfectly handles cross-slate logic 
-        # for a SINGLE day, we just save the finished product into that date's bucket!
-        dff_projections_by_date[d_str] = scrape_dff_projections(d_str)
-
     teams_list = list(scraped_rosters.keys())
     new_games_dict = {}
     formatted_time = et_now.strftime("%b %d, %I:%M %p ET")
     
     print("\n--- MATCHING PLAYERS ---")
+    match_indexes = {}
 
     for i in range(0, len(teams_list), 2):
         if i+1 >= len(teams_list): break
@@ -656,29 +1054,29 @@ def build_json():
         game_time = schedule_info.get("time", "TBD")
         game_id = f"{team_a}-{team_b}-{game_date}"
         
-        # Grab the specific DFS data for THIS game's exact date
+        # Grab the specific DFS data for THIS game's exact date (indexed once per date)
         daily_dff = dff_projections_by_date.get(game_date, {})
+        if game_date not in match_indexes:
+            match_indexes[game_date] = build_match_index(daily_dff)
+        match_index = match_indexes[game_date]
         
         # --- START ODDS SHIELD LOGIC ---
         # 1. Fetch fresh event data from ESPN to check for current odds
         fresh_spread = "TBD"
         fresh_total = "TBD"
-        espn_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={game_date.replace('-', '')}"
         try:
-            res = requests.get(espn_url, timeout=10)
-            if res.status_code == 200:
-                espn_data = res.json()
-                for ev in espn_data.get('events', []):
-                    match = False
-                    for comp in ev['competitions'][0]['competitors']:
-                        if normalize_team(comp['team']['abbreviation']) in [team_a, team_b]:
-                            match = True
-                            break
-                    if match and ev['competitions'][0].get('odds'):
-                        odds_data = ev['competitions'][0]['odds'][0]
-                        fresh_spread = str(odds_data.get('details', "TBD"))
-                        fresh_total = str(odds_data.get('overUnder', "TBD"))
+            espn_data = get_cached_scoreboard(game_date)
+            for ev in espn_data.get('events', []):
+                match = False
+                for comp in ev['competitions'][0]['competitors']:
+                    if normalize_team(comp['team']['abbreviation']) in [team_a, team_b]:
+                        match = True
                         break
+                if match and ev['competitions'][0].get('odds'):
+                    odds_data = ev['competitions'][0]['odds'][0]
+                    fresh_spread = str(odds_data.get('details', "TBD"))
+                    fresh_total = str(odds_data.get('overUnder', "TBD"))
+                    break
         except Exception:
             pass
 
@@ -696,6 +1094,18 @@ def build_json():
         if total_str in ["nan", "+nan", "None"]: total_str = "TBD"
         # --- END ODDS SHIELD LOGIC ---
 
+        # --- INCREMENTAL BUILD: reuse last run's game if none of its inputs changed ---
+        fingerprint = game_fingerprint(
+            current_date_str, schedule_info, spread_str, total_str,
+            {team: scraped_rosters.get(team, []) for team in [team_a, team_b]},
+            {team: [(k, daily_dff[k]) for k in match_index.get(team, EMPTY_TEAM_INDEX)["keys"]] for team in [team_a, team_b]}
+        )
+        new_fingerprints[game_id] = fingerprint
+        if old_game and old_fingerprints.get(game_id) == fingerprint:
+            new_games_dict[game_id] = old_game
+            reused_games += 1
+            continue
+
         game_obj = {
             "id": game_id,
             "date": game_date, 
@@ -710,100 +1120,15 @@ def build_json():
         }
         
         for team in [team_a, team_b]:
-            starters_data = scraped_rosters.get(team, [])
-            player_list = []
-            matched_dff_keys = set()
-            
-            for p_obj in starters_data:
-                raw_name = p_obj['name']
-                is_verified = p_obj['verified']
-                clean = clean_player_name(raw_name)
-                
-                p_data = {
-                    "pos": "Flex", "name": raw_name,
-                    "salary": 0, "proj": 0, "value": 0,
-                    "dk_pos": "Flex", "dk_salary": 0, "dk_proj": 0, "dk_value": 0,
-                    "fd_slates": [], "dk_slates": [],
-                    "fd_positions": "", "dk_positions": "",
-                    "injury": "", "verified": is_verified 
-                }
-                
-                p_key = f"{team}_{clean}"
-                if p_key in daily_dff:
-                    matched_dff_keys.add(p_key)
-                    dff_p = daily_dff[p_key]
-                    p_data.update({
-                        "pos": dff_p.get('pos', 'Flex'),
-                        "salary": dff_p.get('salary', 0), "proj": dff_p.get('proj', 0), "value": dff_p.get('value', 0),
-                        "dk_pos": dff_p.get('dk_pos', 'Flex'),
-                        "dk_salary": dff_p.get('dk_salary', 0), "dk_proj": dff_p.get('dk_proj', 0), "dk_value": dff_p.get('dk_value', 0),
-                        "fd_slates": dff_p.get('fd_slates', []), "dk_slates": dff_p.get('dk_slates', []),
-                        "fd_positions": dff_p.get('fd_positions', ''), "dk_positions": dff_p.get('dk_positions', ''),
-                        "injury": dff_p.get('injury', '')
-                    })
-                else:
-                    parts = clean.split()
-                    if len(parts) >= 2:
-                        last_name = parts[-1]
-                        first_initial = parts[0][0]
-                        for d_key, d_val in daily_dff.items():
-                            if d_key.startswith(f"{team}_") and last_name in d_key and d_key.split('_')[1].startswith(first_initial):
-                                matched_dff_keys.add(d_key)
-                                p_data.update({
-                                    "pos": d_val.get('pos', 'Flex'),
-                                    "salary": d_val.get('salary', 0), "proj": d_val.get('proj', 0), "value": d_val.get('value', 0),
-                                    "dk_pos": d_val.get('dk_pos', 'Flex'),
-                                    "dk_salary": d_val.get('dk_salary', 0), "dk_proj": d_val.get('dk_proj', 0), "dk_value": d_val.get('dk_value', 0),
-                                    "fd_slates": d_val.get('fd_slates', []), "dk_slates": d_val.get('dk_slates', []),
-                                    "fd_positions": d_val.get('fd_positions', ''), "dk_positions": d_val.get('dk_positions', ''),
-                                    "injury": d_val.get('injury', '')
-                                })
-                                break
-
-                    if p_data["salary"] == 0 and old_game:
-                        old_roster = old_game.get('rosters', {}).get(team, {}).get('players', [])
-                        for old_p in old_roster:
-                            if clean_player_name(old_p['name']) == clean:
-                                p_data.update({
-                                    "pos": old_p.get("pos", "Flex"),
-                                    "salary": old_p.get("salary", 0), "proj": old_p.get("proj", 0), "value": old_p.get("value", 0),
-                                    "dk_pos": old_p.get("dk_pos", "Flex"),
-                                    "dk_salary": old_p.get("dk_salary", 0), "dk_proj": old_p.get("dk_proj", 0), "dk_value": old_p.get("dk_value", 0),
-                                    "fd_slates": old_p.get("fd_slates", []), "dk_slates": old_p.get("dk_slates", []),
-                                    "fd_positions": old_p.get("fd_positions", ""), "dk_positions": old_p.get("dk_positions", "")
-                                })
-                                break
-                
-                player_list.append(p_data)
-            
-            if not player_list:
-                 player_list.append({"pos": "-", "name": "Waiting for Lineup", "salary": 0, "proj": 0, "value": 0, "dk_pos": "-", "dk_salary": 0, "dk_proj": 0, "dk_value": 0, "fd_slates": [], "dk_slates": [], "fd_positions": "", "dk_positions": "", "injury": "", "verified": False})
-
-            bench_list = []
-            for d_key, d_val in daily_dff.items():
-                if d_key.startswith(f"{team}_") and d_key not in matched_dff_keys:
-                    if d_val.get('salary', 0) > 0 or d_val.get('dk_salary', 0) > 0:
-                        bench_list.append({
-                            "pos": d_val.get('pos', 'Flex'),
-                            "name": d_val.get('name', 'Unknown'),
-                            "salary": d_val.get('salary', 0), "proj": d_val.get('proj', 0), "value": d_val.get('value', 0),
-                            "dk_pos": d_val.get('dk_pos', 'Flex'),
-                            "dk_salary": d_val.get('dk_salary', 0), "dk_proj": d_val.get('dk_proj', 0), "dk_value": d_val.get('dk_value', 0),
-                            "fd_slates": d_val.get('fd_slates', []), "dk_slates": d_val.get('dk_slates', []),
-                            "fd_positions": d_val.get('fd_positions', ''), "dk_positions": d_val.get('dk_positions', ''),
-                            "injury": d_val.get('injury', ''), "verified": False
-                        })
-            
-            bench_list.sort(key=lambda x: max(x.get('proj', 0), x.get('dk_proj', 0)), reverse=True)
-
-            game_obj['rosters'][team] = {
-                "logo": f"https://a.espncdn.com/i/teamlogos/nba/500/{team.lower()}.png",
-                "players": player_list,
-                "bench": bench_list 
-            }
+            game_obj['rosters'][team] = build_team_roster(
+                team, scraped_rosters.get(team, []), daily_dff,
+                match_index.get(team, EMPTY_TEAM_INDEX), old_game
+            )
             
         new_games_dict[game_id] = game_obj
 
+    print(f"♻️ Reused {reused_games} of {len(new_games_dict)} games with unchanged inputs.")
+
     for g_id, g_obj in new_games_dict.items():
         old_memory[g_id] = g_obj
         
@@ -816,8 +1141,8 @@ def build_json():
         if 'sort_index' in g: del g['sort_index']
             
     formatted_slates = {
-        "fanduel": [{"id": k, "name": v} for k, v in GLOBAL_SLATES['fanduel'].items()],
-        "draftkings": [{"id": k, "name": v} for k, v in GLOBAL_SLATES['draftkings'].items()]
+        "fanduel": [{"id": k, "name": v} for k, v in list(GLOBAL_SLATES['fanduel'].items())],
+        "draftkings": [{"id": k, "name": v} for k, v in list(GLOBAL_SLATES['draftkings'].items())]
     }
 
     # ==========================================================
@@ -835,41 +1160,31 @@ def build_json():
     final_tomorrow_news = merge_news_lists(old_tomorrow_news, fresh_tomorrow_news)
     final_legacy_news = merge_news_lists(old_legacy_news, all_player_news)
     
-    # Write 1: Yesterday's Daily File (Keeps updating post-midnight for West Coast games)
-    yesterday_json = {
-        "last_updated": formatted_time,
-        "player_news": final_yesterday_news,
-        "espn_schedule": fetch_espn_scoreboard(yesterday_espn_date),
-        "slates": formatted_slates,
-        "games": yesterday_games
-    }
-    with open(os.path.join(DATA_DIR, f"{yesterday_str}.json"), 'w') as f:
-        json.dump(yesterday_json, f, indent=2)
-    print(f"✅ Saved Daily JSON: data/{yesterday_str}.json ({len(yesterday_games)} games, {len(final_yesterday_news)} news items)")
-
-    # Write 2: Today's Daily File
-    today_json = {
-        "last_updated": formatted_time,
-        "player_news": final_today_news,
-        "espn_schedule": fetch_espn_scoreboard(current_espn_date),
-        "slates": formatted_slates, 
-        "games": today_games
-    }
-    with open(os.path.join(DATA_DIR, f"{current_date_str}.json"), 'w') as f:
-        json.dump(today_json, f, indent=2)
-    print(f"✅ Saved Daily JSON: data/{current_date_str}.json ({len(today_games)} games, {len(final_today_news)} news items)")
-
-    # Write 3: Tomorrow's Daily File
-    tomorrow_json = {
-        "last_updated": formatted_time,
-        "player_news": final_tomorrow_news,
-        "espn_schedule": fetch_espn_scoreboard(tomorrow_espn_date),
-        "slates": formatted_slates,
-        "games": tomorrow_games
-    }
-    with open(os.path.join(DATA_DIR, f"{tomorrow_str}.json"), 'w') as f:
-        json.dump(tomorrow_json, f, indent=2)
-    print(f"✅ Saved Daily JSON: data/{tomorrow_str}.json ({len(tomorrow_games)} games, {len(final_tomorrow_news)} news items)")
+    # A file is only rewritten when its games, news, slates or scoreboard changed. Untouched files keep
+    # their old bytes, so the static site's caches stay valid.
+    daily_writes = [
+        # Write 1: Yesterday's Daily File (Keeps updating post-midnight for West Coast games)
+        (yesterday_str, yesterday_espn_date, final_yesterday_news, yesterday_games, old_yesterday_digest),
+        # Write 2: Today's Daily File
+        (current_date_str, current_espn_date, final_today_news, today_games, old_today_digest),
+        # Write 3: Tomorrow's Daily File
+        (tomorrow_str, tomorrow_espn_date, final_tomorrow_news, tomorrow_games, old_tomorrow_digest)
+    ]
+    for d_str, espn_date, final_news, day_games, old_digest in daily_writes:
+        day_json = {
+            "last_updated": formatted_time,
+            "player_news": final_news,
+            # Served from the per-run scoreboard cache, so fetching it before the check is free
+            "espn_schedule": fetch_espn_scoreboard(espn_date),
+            "slates": formatted_slates,
+            "games": day_games
+        }
+        if output_digest(day_json) == old_digest:
+            print(f"💤 Unchanged: data/{d_str}.json ({len(day_games)} games, {len(final_news)} news items). Skipping write.")
+            continue
+        
+        written = data_writer.write_json(os.path.join(DATA_DIR, f"{d_str}.json"), day_json)
+        print(f"✅ Saved Daily JSON: data/{d_str}.json ({len(day_games)} games, {len(final_news)} news items, {data_writer.format_bytes(written)})")
 
     # Write 4: Legacy JSON (Combines everything)
     legacy_json = {
@@ -878,9 +1193,15 @@ def build_json():
         "slates": formatted_slates,
         "games": games_output
     }
-    with open(LEGACY_FILE, 'w') as f:
-        json.dump(legacy_json, f, indent=2)
-    print(f"✅ Saved Legacy JSON: nba_data.json ({len(games_output)} games)")
+    if output_digest(legacy_json) == old_legacy_digest:
+        print(f"💤 Unchanged: nba_data.json ({len(games_output)} games). Skipping write.")
+    else:
+        written = data_writer.write_json(LEGACY_FILE, legacy_json)
+        print(f"✅ Saved Legacy JSON: nba_data.json ({len(games_output)} games, {data_writer.format_bytes(written)})")
+    
+    save_build_fingerprints(new_fingerprints)
+    print_scoreboard_cache_stats()
+    page_cache.flush()
 
 if __name__ == "__main__":
     build_json()
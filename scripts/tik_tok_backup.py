@@ -2,7 +2,7 @@ import os
 import re
 import time
 import asyncio
-import requests
+import http_client
 import unicodedata
 import smtplib
 import urllib.parse
@@ -142,7 +142,7 @@ def generate_announcer_audio():
     print("🎙️ Generating PA Announcer Audio...")
     
     try:
-        data = requests.get(f"https://nbastartingfive.com/data/{TARGET_DATE}.json").json()
+        data = http_client.get(f"https://nbastartingfive.com/data/{TARGET_DATE}.json").json()
         games = data.get('games', [])
         target_game = next((g for g in games if TARGET_TEAM in g.get('teams', [])), None)
         roster = target_game['rosters'][TARGET_TEAM]['players'][:5]
@@ -153,7 +153,7 @@ def generate_announcer_audio():
     players_db = {}
     try:
         players_url = f"https://nbastartingfive.com/data/players.json?v={time.time()}"
-        players_db = requests.get(players_url).json()
+        players_db = http_client.get(players_url).json()
     except Exception as e:
         print(f"⚠️ Could not load players.json: {e}")
 
@@ -188,7 +188,7 @@ def generate_announcer_audio():
                 espn_headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
                 }
-                espn_response = requests.get(espn_url, headers=espn_headers)
+                espn_response = http_client.get(espn_url, headers=espn_headers)
                 
                 if espn_response.status_code == 200:
                     athlete_data = espn_response.json().get('athlete', {})
@@ -256,7 +256,7 @@ def generate_announcer_audio():
             }
         }
         
-        response = requests.post(url, json=payload, headers=headers)
+        response = http_client.post(url, json=payload, headers=headers, timeout=120)
         
         if response.status_code == 200:
             audio_path = os.path.join(OUTPUT_DIR, f"{TARGET_TEAM}_audio.mp3")
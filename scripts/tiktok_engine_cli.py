@@ -2,7 +2,7 @@ import os
 import re
 import time
 import asyncio
-import requests
+import http_client
 import unicodedata
 import smtplib
 from email.message import EmailMessage
@@ -101,7 +101,7 @@ def generate_single_clip(text, filename):
     filepath = os.path.join(AUDIO_DIR, filename)
     
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = http_client.post(url, json=payload, headers=headers, timeout=120)
         if response.status_code == 200:
             with open(filepath, "wb") as f:
                 f.write(response.content)
@@ -117,7 +117,7 @@ def build_audio_timeline():
     print("🎙️ Generating PA Announcer Audio Timeline...")
     
     try:
-        data = requests.get(f"https://nbastartingfive.com/data/{TARGET_DATE}.json").json()
+        data = http_client.get(f"https://nbastartingfive.com/data/{TARGET_DATE}.json").json()
         games = data.get('games', [])
         target_game = next((g for g in games if TARGET_TEAM in g.get('teams', [])), None)
         